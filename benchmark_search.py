@@ -0,0 +1,222 @@
+"""
+Benchmark of the memory-mapped search index against an in-memory one.
+
+Each index is loaded in a fresh process, which reports how much its
+resident set grew and how long a set of queries took:
+
+- "dict": a plain dictionary mapping each word to Python lists of its
+  verses, counts and occurrence keys, built from the verse store
+- "mapped": the compressed search file written alongside the store (see
+  bible_search), memory-mapped
+
+Private memory (anonymous pages) is what each server process pays for
+on its own; mapped file pages are shared by every process on the host.
+Run it against an installed corpus:
+
+    python benchmark_search.py --corpus-dir ~/bible-corpus --translation web
+
+or, without a corpus, against a synthetic Bible-sized one with a Zipfian
+vocabulary.
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from bible_data import TOTAL_VERSES
+
+# Queries covering rare and common words, phrases, NEAR clauses and typos
+QUERIES = [
+    "love your enemies",
+    "the",
+    '"in the beginning"',
+    '"the lord"',
+    "faith NEAR/3 hope",
+    "and NEAR/5 the",
+    "love your enemes",
+]
+
+# Most frequent words of the synthetic corpus, most frequent first; the
+# rest of its vocabulary is made up
+_COMMON_WORDS = (
+    "the and of to that in he shall unto i his a lord they be is him not "
+    "them it with all thou thy was god which my me said but ye their have"
+).split()
+_PLACED_WORDS = {"love": 150, "faith": 400, "hope": 600, "enemies": 700, "beginning": 900, "your": 60}
+
+
+def write_synthetic_corpus(directory: str, translation_id: str) -> None:
+    """
+    Write a Bible-sized store of random verses with a Zipfian vocabulary.
+
+    Args:
+        directory: Corpus directory
+        translation_id: Translation ID to write it as
+    """
+    from bible_store import write_store
+
+    vocabulary = _COMMON_WORDS + [f"w{i}" for i in range(12000 - len(_COMMON_WORDS))]
+    for word, rank in _PLACED_WORDS.items():
+        vocabulary.insert(rank, word)
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    generator = random.Random(0)
+    verses = (
+        (ordinal, " ".join(generator.choices(vocabulary, weights, k=generator.randint(10, 40))))
+        for ordinal in range(TOTAL_VERSES)
+    )
+    write_store(directory, translation_id, verses, {"translation_name": "Synthetic"})
+
+
+def memory_usage() -> Dict[str, int]:
+    """
+    Get the process's resident memory, in bytes.
+
+    Returns:
+        Dictionary with "total" and "private" resident bytes; Linux only,
+        so other systems report zeros
+    """
+    usage = {"total": 0, "private": 0}
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    usage["total"] = int(line.split()[1]) * 1024
+                elif line.startswith("RssAnon:"):
+                    usage["private"] = int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return usage
+
+
+def run_worker(variant: str, directory: str, translation_id: str, repeat: int) -> Dict:
+    """
+    Load one index variant and time the benchmark queries.
+
+    Args:
+        variant: "dict" or "mapped"
+        directory: Corpus directory
+        translation_id: Translation ID
+        repeat: Number of times to run each query
+
+    Returns:
+        Dictionary with the load time, memory growth and query latencies
+    """
+    from bible_search import MappedSearchIndex, SearchIndex
+    from bible_store import VerseStore
+
+    gc.collect()
+    before = memory_usage()
+    started = time.perf_counter()
+    if variant == "mapped":
+        index = MappedSearchIndex(os.path.join(directory, translation_id + ".search"))
+    else:
+        store = VerseStore(directory, translation_id)
+        texts = store.get_texts(0, TOTAL_VERSES)
+        index = SearchIndex((ordinal, text) for ordinal, text in enumerate(texts) if text)
+        del texts
+        store.close()
+        for entry in index._postings.values():
+            entry.ordinals = list(entry.ordinals)
+            entry.offsets = list(entry.offsets)
+            entry.keys = list(entry.keys)
+    loaded = time.perf_counter() - started
+
+    latencies = {}
+    for query in QUERIES:
+        times = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            index.search(query)
+            times.append(time.perf_counter() - started)
+        latencies[query] = {"first": times[0], "median": statistics.median(times)}
+
+    gc.collect()
+    after = memory_usage()
+    return {
+        "load": loaded,
+        "memory": {key: after[key] - before[key] for key in after},
+        "latencies": latencies,
+    }
+
+
+def measure(variant: str, directory: str, translation_id: str, repeat: int) -> Dict:
+    """
+    Run one variant in a fresh process, so its memory is measured alone.
+
+    Args:
+        variant: "dict" or "mapped"
+        directory: Corpus directory
+        translation_id: Translation ID
+        repeat: Number of times to run each query
+
+    Returns:
+        The worker's results
+    """
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", variant,
+         "--corpus-dir", directory, "--translation", translation_id, "--repeat", str(repeat)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Benchmark both index variants and print a comparison.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--corpus-dir", help="Corpus directory (default: a synthetic corpus)")
+    parser.add_argument("--translation", "-t", default="web", help="Translation ID (default: web)")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs of each query (default: 20)")
+    parser.add_argument("--worker", choices=("dict", "mapped"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.corpus_dir, args.translation, args.repeat)))
+        return 0
+
+    with tempfile.TemporaryDirectory() as scratch:
+        directory = args.corpus_dir and os.path.expanduser(args.corpus_dir)
+        if directory is None:
+            directory = scratch
+            print("Writing a synthetic corpus...", file=sys.stderr)
+            write_synthetic_corpus(directory, args.translation)
+        search_file = os.path.join(directory, args.translation + ".search")
+        if not os.path.exists(search_file):
+            parser.error(f"no search index at {search_file}; recompile the store")
+
+        file_size = os.path.getsize(search_file)
+        results = {variant: measure(variant, directory, args.translation, args.repeat)
+                   for variant in ("dict", "mapped")}
+
+    megabyte = 1024 * 1024
+    print(f"Search file: {file_size / megabyte:.1f} MB")
+    print(f"{'':24}{'dict':>18}{'mapped':>18}")
+    print(f"{'load (ms)':24}" + "".join(
+        f"{results[v]['load'] * 1000:18.1f}" for v in results))
+    for key in ("private", "total"):
+        print(f"{'RSS growth, ' + key + ' (MB)':24}" + "".join(
+            f"{results[v]['memory'][key] / megabyte:18.1f}" for v in results))
+    print("query (ms, first/median)")
+    for query in QUERIES:
+        print(f"  {query:22}" + "".join(
+            f"{results[v]['latencies'][query]['first'] * 1000:10.2f}/"
+            f"{results[v]['latencies'][query]['median'] * 1000:<7.2f}" for v in results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,344 @@
+"""
+Response caches for the Bible API client.
+
+Bible text never changes once published, so responses can be cached
+aggressively. This module provides a bounded in-memory LRU cache with
+per-entry expiry, and an optional SQLite-backed cache that persists
+responses across server restarts.
+"""
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional, Tuple
+
+if TYPE_CHECKING:
+    import sqlite3
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache with a time-to-live per entry.
+
+    Entries are evicted when the cache grows beyond `maxsize` (oldest use
+    first). Entries older than `ttl` seconds are treated as misses, but are
+    kept so they can still be served as a fallback with `allow_stale`.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep (0 disables caching)
+            ttl: Seconds before an entry expires, or None to never expire
+            clock: Monotonic time source, injectable for testing
+
+        Raises:
+            ValueError: If maxsize is negative or ttl is not positive
+        """
+        if maxsize < 0:
+            raise ValueError(f"Invalid maxsize: {maxsize}. Must be zero or positive.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"Invalid ttl: {ttl}. Must be positive or None.")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, default: Any = None, allow_stale: bool = False) -> Any:
+        """
+        Get a cached value and mark it as recently used.
+
+        Args:
+            key: Cache key
+            default: Value to return on a miss
+            allow_stale: Return the value even if it has expired
+
+        Returns:
+            The cached value, or `default` if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at < self._clock() and not allow_stale:
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        if self.maxsize == 0:
+            return
+
+        expires_at = self._clock() + self.ttl if self.ttl is not None else float("inf")
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        self._entries.clear()
+
+
+class SQLiteCache:
+    """
+    Persistent response cache stored in a SQLite database.
+
+    Payloads are stored as JSON under their normalized request key (which
+    includes the translation). The database uses WAL mode so several server
+    processes can share one file, and the least recently used entries are
+    evicted once the cache grows beyond `max_entries`.
+
+    Reads record their access times in memory, and these are written in
+    one batch with the next write, so a hit costs no database write.
+    Database errors (such as another process holding the lock) are logged
+    and treated as a miss or a skipped write. The cache can be used from
+    worker threads.
+    """
+
+    # Check the size limit every this many writes rather than on each one
+    _EVICTION_INTERVAL = 64
+    # Write out recorded access times once this many are pending
+    _ACCESS_BATCH = 256
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 50_000,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Path to the SQLite database file (created if missing)
+            max_entries: Maximum number of entries to keep
+            ttl: Seconds before an entry expires, or None to never expire
+            clock: Wall-clock time source, injectable for testing
+
+        Raises:
+            ValueError: If max_entries or ttl is not positive
+        """
+        if max_entries < 1:
+            raise ValueError(f"Invalid max_entries: {max_entries}. Must be positive.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"Invalid ttl: {ttl}. Must be positive or None.")
+
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._writes = 0
+        self._accessed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional["sqlite3.Connection"] = None
+
+    def _connect(self) -> "sqlite3.Connection":
+        """
+        Open the database on first use and create the schema if needed.
+
+        Returns:
+            The open SQLite connection
+        """
+        if self._conn is None:
+            # Imported here so servers without a persistent cache never load it
+            import sqlite3
+
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()
+        return count
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[Dict]:
+        """
+        Get a cached payload and record the access for eviction.
+
+        Args:
+            key: Cache key
+            allow_stale: Return the payload even if it has expired
+
+        Returns:
+            The cached payload, or None if missing, expired or unreadable
+        """
+        import sqlite3
+
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT payload, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+
+                payload, created_at = row
+                now = self._clock()
+                if self.ttl is not None and created_at + self.ttl < now and not allow_stale:
+                    return None
+
+                self._accessed[key] = now
+                if len(self._accessed) >= self._ACCESS_BATCH:
+                    self._flush_accesses()
+            except sqlite3.Error as e:
+                logger.warning("Persistent cache read of %s failed: %s", key, e)
+                return None
+        return json.loads(payload)
+
+    def set(self, key: str, value: Dict) -> None:
+        """
+        Store a payload, evicting the least recently used entries if full.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable payload
+        """
+        self.set_many([(key, value)])
+
+    def set_many(self, items: Iterable[Tuple[str, Dict]]) -> None:
+        """
+        Store several payloads in one transaction, evicting if full.
+
+        Args:
+            items: (key, JSON-serializable payload) pairs
+        """
+        import sqlite3
+
+        items = list(items)
+        if not items:
+            return
+        with self._lock:
+            try:
+                conn = self._connect()
+                now = self._clock()
+                for key, _ in items:
+                    self._accessed.pop(key, None)
+                self._flush_accesses()
+                conn.execute("BEGIN")
+                try:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO responses (key, payload, created_at, accessed_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        [(key, json.dumps(value), now, now) for key, value in items],
+                    )
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+
+                # Evict whenever the writes pass a multiple of the interval
+                before, self._writes = self._writes, self._writes + len(items)
+                if (self._writes - 1) // self._EVICTION_INTERVAL != (before - 1) // self._EVICTION_INTERVAL:
+                    self._evict()
+            except sqlite3.Error as e:
+                logger.warning("Persistent cache write of %d entries failed: %s", len(items), e)
+
+    def evict(self) -> None:
+        """
+        Delete the least recently used entries beyond `max_entries`.
+        """
+        with self._lock:
+            self._flush_accesses()
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Delete the least recently used entries; the caller holds the lock.
+        """
+        conn = self._connect()
+        (count,) = conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                (excess,),
+            )
+
+    def _flush_accesses(self) -> None:
+        """
+        Write the recorded access times in one transaction; the caller holds the lock.
+
+        Access times are only a hint for eviction, so they are dropped if
+        the write fails.
+        """
+        if not self._accessed:
+            return
+        accessed, self._accessed = self._accessed, {}
+        conn = self._connect()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                [(now, key) for key, now in accessed.items()],
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """
+        Close the database connection. It is reopened on next use.
+        """
+        import sqlite3
+
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._flush_accesses()
+            except sqlite3.Error as e:
+                logger.warning("Persistent cache access times not saved: %s", e)
+            conn, self._conn = self._conn, None
+            conn.close()
@@ -6,22 +6,159 @@ including books, chapters, and verses, as well as utility functions
 for random verse selection and reference validation.
 """
 import random
-from typing import Dict, List, Optional, Tuple, Union, Any
+import re
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union, Any
+
+import bible_tables
+from bible_intervals import IntervalSet
 
 # Constants for testament types
 OLD_TESTAMENT = "OT"
 NEW_TESTAMENT = "NT"
 
+# === BOOK RECORDS ===
+#
+# The structure of the Bible is loaded from bible_tables, which is
+# generated by generate_bible_tables.py, so importing this module does no
+# work beyond building one Book record per book. Every book stores its verse
+# counts the same way, including single-chapter books.
+#
+# Every verse also has a global ordinal: its 0-based position when all
+# verses are laid out in canonical order (Genesis 1:1 is 0, Revelation
+# 22:21 is TOTAL_VERSES - 1).
+
+
+class Book:
+    """
+    Structure of one book of the Bible.
+    
+    Attributes:
+        id: Book ID (e.g., "JHN", "GEN")
+        name: Full book name (e.g., "John", "Genesis")
+        testament: "OT" or "NT"
+        verses: Number of verses in each chapter
+        chapter_starts: Global ordinal of the first verse of each chapter,
+            followed by one past the book's last verse
+    """
+    
+    __slots__ = ("id", "name", "testament", "verses", "chapter_starts")
+    
+    def __init__(
+        self,
+        book_id: str,
+        name: str,
+        testament: str,
+        verses: Iterable[int],
+        chapter_starts: Iterable[int]
+    ):
+        self.id = book_id
+        self.name = name
+        self.testament = testament
+        self.verses = array("H", verses)
+        self.chapter_starts = array("I", chapter_starts)
+    
+    @property
+    def chapters(self) -> int:
+        """
+        The number of chapters in the book.
+        """
+        return len(self.verses)
+    
+    def __repr__(self) -> str:
+        return f"Book({self.id!r}, {self.name!r})"
+
+
+# Book IDs in canonical order
+BOOK_IDS: Tuple[str, ...] = bible_tables.BOOK_IDS
+
+# Book records by ID, in canonical order
+BOOKS: Dict[str, Book] = {
+    book_id: Book(book_id, name, testament, verses, starts)
+    for book_id, name, testament, verses, starts in zip(
+        bible_tables.BOOK_IDS,
+        bible_tables.BOOK_NAMES,
+        bible_tables.BOOK_TESTAMENTS,
+        bible_tables.VERSE_COUNTS,
+        bible_tables.CHAPTER_STARTS,
+    )
+}
+
 # Single chapter books (with verse counts)
-SINGLE_CHAPTER_BOOKS = {
-    "OBAD": 21,   # Obadiah - 21 verses
-    "PHLM": 25,   # Philemon - 25 verses
-    "2JN": 13,    # 2 John - 13 verses
-    "3JN": 14,    # 3 John - 14 verses
-    "JUD": 25     # Jude - 25 verses
+SINGLE_CHAPTER_BOOKS: Dict[str, int] = {
+    book.id: book.verses[0] for book in BOOKS.values() if book.chapters == 1
+}
+
+TOTAL_VERSES: int = bible_tables.TOTAL_VERSES
+
+# First ordinal of each book, for mapping ordinals back to books
+_BOOK_STARTS = array("I", (starts[0] for starts in bible_tables.CHAPTER_STARTS))
+
+# Book IDs per testament filter, for random book selection
+_BOOKS_BY_TESTAMENT: Dict[Optional[str], Tuple[str, ...]] = {
+    None: BOOK_IDS,
+    OLD_TESTAMENT: tuple(b.id for b in BOOKS.values() if b.testament == OLD_TESTAMENT),
+    NEW_TESTAMENT: tuple(b.id for b in BOOKS.values() if b.testament == NEW_TESTAMENT),
 }
 
-# Bible books data with metadata
+# The Old Testament books precede the New Testament books, so each
+# testament is one contiguous ordinal range
+_TESTAMENT_RANGES: Dict[str, Tuple[int, int]] = bible_tables.TESTAMENT_RANGES
+
+
+class _BookView(Mapping):
+    """
+    Read-only view of a Book in the original BIBLE_DATA dictionary format,
+    where single-chapter books store their verse count as an int.
+    """
+    
+    __slots__ = ("_book",)
+    
+    _KEYS = ("name", "testament", "chapters", "verses")
+    
+    def __init__(self, book: Book):
+        self._book = book
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == "verses":
+            verses = self._book.verses
+            return verses[0] if len(verses) == 1 else list(verses)
+        if key in self._KEYS:
+            return getattr(self._book, key)
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+    
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+
+class _BibleDataView(Mapping):
+    """
+    Read-only view of BOOKS in the original BIBLE_DATA dictionary format.
+    """
+    
+    __slots__ = ()
+    
+    def __getitem__(self, book_id: str) -> _BookView:
+        return _BookView(BOOKS[book_id])
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(BOOKS)
+    
+    def __len__(self) -> int:
+        return len(BOOKS)
+    
+    def __contains__(self, book_id: object) -> bool:
+        return book_id in BOOKS
+
+
+# Bible books data with metadata, kept for existing callers; new code
+# should use BOOKS
 # Format: {
 #     "book_id": {
 #         "name": "Full Book Name",
@@ -30,407 +167,111 @@ SINGLE_CHAPTER_BOOKS = {
 #         "verses": [verses per chapter] or fixed verse count for single-chapter books
 #     }
 # }
-BIBLE_DATA = {
-    # Old Testament
-    "GEN": {
-        "name": "Genesis",
-        "testament": OLD_TESTAMENT,
-        "chapters": 50,
-        "verses": [31, 25, 24, 26, 32, 22, 24, 22, 29, 32, 32, 20, 18, 24, 21, 16, 27, 33, 38, 18, 34, 24, 20, 67, 34, 35, 46, 22, 35, 43, 55, 32, 20, 31, 29, 43, 36, 30, 23, 23, 57, 38, 34, 34, 28, 34, 31, 22, 33, 26]
-    },
-    "EXO": {
-        "name": "Exodus",
-        "testament": OLD_TESTAMENT,
-        "chapters": 40,
-        "verses": [22, 25, 22, 31, 23, 30, 25, 32, 35, 29, 10, 51, 22, 31, 27, 36, 16, 27, 25, 26, 36, 31, 33, 18, 40, 37, 21, 43, 46, 38, 18, 35, 23, 35, 35, 38, 29, 31, 43, 38]
-    },
-    "LEV": {
-        "name": "Leviticus",
-        "testament": OLD_TESTAMENT,
-        "chapters": 27,
-        "verses": [17, 16, 17, 35, 19, 30, 38, 36, 24, 20, 47, 8, 59, 57, 33, 34, 16, 30, 37, 27, 24, 33, 44, 23, 55, 46, 34]
-    },
-    "NUM": {
-        "name": "Numbers",
-        "testament": OLD_TESTAMENT,
-        "chapters": 36,
-        "verses": [54, 34, 51, 49, 31, 27, 89, 26, 23, 36, 35, 16, 33, 45, 41, 50, 13, 32, 22, 29, 35, 41, 30, 25, 18, 65, 23, 31, 40, 16, 54, 42, 56, 29, 34, 13]
-    },
-    "DEU": {
-        "name": "Deuteronomy",
-        "testament": OLD_TESTAMENT,
-        "chapters": 34,
-        "verses": [46, 37, 29, 49, 33, 25, 26, 20, 29, 22, 32, 32, 18, 29, 23, 22, 20, 22, 21, 20, 23, 30, 25, 22, 19, 19, 26, 68, 29, 20, 30, 52, 29, 12]
-    },
-    "JOS": {
-        "name": "Joshua",
-        "testament": OLD_TESTAMENT,
-        "chapters": 24,
-        "verses": [18, 24, 17, 24, 15, 27, 26, 35, 27, 43, 23, 24, 33, 15, 63, 10, 18, 28, 51, 9, 45, 34, 16, 33]
-    },
-    "JDG": {
-        "name": "Judges",
-        "testament": OLD_TESTAMENT,
-        "chapters": 21,
-        "verses": [36, 23, 31, 24, 31, 40, 25, 35, 57, 18, 40, 15, 25, 20, 20, 31, 13, 31, 30, 48, 25]
-    },
-    "RUT": {
-        "name": "Ruth",
-        "testament": OLD_TESTAMENT,
-        "chapters": 4,
-        "verses": [22, 23, 18, 22]
-    },
-    "1SA": {
-        "name": "1 Samuel",
-        "testament": OLD_TESTAMENT,
-        "chapters": 31,
-        "verses": [28, 36, 21, 22, 12, 21, 17, 22, 27, 27, 15, 25, 23, 52, 35, 23, 58, 30, 24, 42, 15, 23, 29, 22, 44, 25, 12, 25, 11, 31, 13]
-    },
-    "2SA": {
-        "name": "2 Samuel",
-        "testament": OLD_TESTAMENT,
-        "chapters": 24,
-        "verses": [27, 32, 39, 12, 25, 23, 29, 18, 13, 19, 27, 31, 39, 33, 37, 23, 29, 33, 43, 26, 22, 51, 39, 25]
-    },
-    "1KI": {
-        "name": "1 Kings",
-        "testament": OLD_TESTAMENT,
-        "chapters": 22,
-        "verses": [53, 46, 28, 34, 18, 38, 51, 66, 28, 29, 43, 33, 34, 31, 34, 34, 24, 46, 21, 43, 29, 53]
-    },
-    "2KI": {
-        "name": "2 Kings",
-        "testament": OLD_TESTAMENT,
-        "chapters": 25,
-        "verses": [18, 25, 27, 44, 27, 33, 20, 29, 37, 36, 21, 21, 25, 29, 38, 20, 41, 37, 37, 21, 26, 20, 37, 20, 30]
-    },
-    "1CH": {
-        "name": "1 Chronicles",
-        "testament": OLD_TESTAMENT,
-        "chapters": 29,
-        "verses": [54, 55, 24, 43, 26, 81, 40, 40, 44, 14, 47, 40, 14, 17, 29, 43, 27, 17, 19, 8, 30, 19, 32, 31, 31, 32, 34, 21, 30]
-    },
-    "2CH": {
-        "name": "2 Chronicles",
-        "testament": OLD_TESTAMENT,
-        "chapters": 36,
-        "verses": [17, 18, 17, 22, 14, 42, 22, 18, 31, 19, 23, 16, 22, 15, 19, 14, 19, 34, 11, 37, 20, 12, 21, 27, 28, 23, 9, 27, 36, 27, 21, 33, 25, 33, 27, 23]
-    },
-    "EZR": {
-        "name": "Ezra",
-        "testament": OLD_TESTAMENT,
-        "chapters": 10,
-        "verses": [11, 70, 13, 24, 17, 22, 28, 36, 15, 44]
-    },
-    "NEH": {
-        "name": "Nehemiah",
-        "testament": OLD_TESTAMENT,
-        "chapters": 13,
-        "verses": [11, 20, 32, 23, 19, 19, 73, 18, 38, 39, 36, 47, 31]
-    },
-    "EST": {
-        "name": "Esther",
-        "testament": OLD_TESTAMENT,
-        "chapters": 10,
-        "verses": [22, 23, 15, 17, 14, 14, 10, 17, 32, 3]
-    },
-    "JOB": {
-        "name": "Job",
-        "testament": OLD_TESTAMENT,
-        "chapters": 42,
-        "verses": [22, 13, 26, 21, 27, 30, 21, 22, 35, 22, 20, 25, 28, 22, 35, 22, 16, 21, 29, 29, 34, 30, 17, 25, 6, 14, 23, 28, 25, 31, 40, 22, 33, 37, 16, 33, 24, 41, 30, 24, 34, 17]
-    },
-    "PSA": {
-        "name": "Psalms",
-        "testament": OLD_TESTAMENT,
-        "chapters": 150,
-        "verses": [6, 12, 8, 8, 12, 10, 17, 9, 20, 18, 7, 8, 6, 7, 5, 11, 15, 50, 14, 9, 13, 31, 6, 10, 22, 12, 14, 9, 11, 12, 24, 11, 22, 22, 28, 12, 40, 22, 13, 17, 13, 11, 5, 26, 17, 11, 9, 14, 20, 23, 19, 9, 6, 7, 23, 13, 11, 11, 17, 12, 8, 12, 11, 10, 13, 20, 7, 35, 36, 5, 24, 20, 28, 23, 10, 12, 20, 72, 13, 19, 16, 8, 18, 12, 13, 17, 7, 18, 52, 17, 16, 15, 5, 23, 11, 13, 12, 9, 9, 5, 8, 28, 22, 35, 45, 48, 43, 13, 31, 7, 10, 10, 9, 8, 18, 19, 2, 29, 176, 7, 8, 9, 4, 8, 5, 6, 5, 6, 8, 8, 3, 18, 3, 3, 21, 26, 9, 8, 24, 13, 10, 7, 12, 15, 21, 10, 20, 14, 9, 6]
-    },
-    "PRO": {
-        "name": "Proverbs",
-        "testament": OLD_TESTAMENT,
-        "chapters": 31,
-        "verses": [33, 22, 35, 27, 23, 35, 27, 36, 18, 32, 31, 28, 25, 35, 33, 33, 28, 24, 29, 30, 31, 29, 35, 34, 28, 28, 27, 28, 27, 33, 31]
-    },
-    "ECC": {
-        "name": "Ecclesiastes",
-        "testament": OLD_TESTAMENT,
-        "chapters": 12,
-        "verses": [18, 26, 22, 16, 20, 12, 29, 17, 18, 20, 10, 14]
-    },
-    "SNG": {
-        "name": "Song of Solomon",
-        "testament": OLD_TESTAMENT,
-        "chapters": 8,
-        "verses": [17, 17, 11, 16, 16, 13, 13, 14]
-    },
-    "ISA": {
-        "name": "Isaiah",
-        "testament": OLD_TESTAMENT,
-        "chapters": 66,
-        "verses": [31, 22, 26, 6, 30, 13, 25, 22, 21, 34, 16, 6, 22, 32, 9, 14, 14, 7, 25, 6, 17, 25, 18, 23, 12, 21, 13, 29, 24, 33, 9, 20, 24, 17, 10, 22, 38, 22, 8, 31, 29, 25, 28, 28, 25, 13, 15, 22, 26, 11, 23, 15, 12, 17, 13, 12, 21, 14, 21, 22, 11, 12, 19, 12, 25, 24]
-    },
-    "JER": {
-        "name": "Jeremiah",
-        "testament": OLD_TESTAMENT,
-        "chapters": 52,
-        "verses": [19, 37, 25, 31, 31, 30, 34, 22, 26, 25, 23, 17, 27, 22, 21, 21, 27, 23, 15, 18, 14, 30, 40, 10, 38, 24, 22, 17, 32, 24, 40, 44, 26, 22, 19, 32, 21, 28, 18, 16, 18, 22, 13, 30, 5, 28, 7, 47, 39, 46, 64, 34]
-    },
-    "LAM": {
-        "name": "Lamentations",
-        "testament": OLD_TESTAMENT,
-        "chapters": 5,
-        "verses": [22, 22, 66, 22, 22]
-    },
-    "EZK": {
-        "name": "Ezekiel",
-        "testament": OLD_TESTAMENT,
-        "chapters": 48,
-        "verses": [28, 10, 27, 17, 17, 14, 27, 18, 11, 22, 25, 28, 23, 23, 8, 63, 24, 32, 14, 49, 32, 31, 49, 27, 17, 21, 36, 26, 21, 26, 18, 32, 33, 31, 15, 38, 28, 23, 29, 49, 26, 20, 27, 31, 25, 24, 23, 35]
-    },
-    "DAN": {
-        "name": "Daniel",
-        "testament": OLD_TESTAMENT,
-        "chapters": 12,
-        "verses": [21, 49, 30, 37, 31, 28, 28, 27, 27, 21, 45, 13]
-    },
-    "HOS": {
-        "name": "Hosea",
-        "testament": OLD_TESTAMENT,
-        "chapters": 14,
-        "verses": [11, 23, 5, 19, 15, 11, 16, 14, 17, 15, 12, 14, 16, 9]
-    },
-    "JOL": {
-        "name": "Joel",
-        "testament": OLD_TESTAMENT,
-        "chapters": 3,
-        "verses": [20, 32, 21]
-    },
-    "AMO": {
-        "name": "Amos",
-        "testament": OLD_TESTAMENT,
-        "chapters": 9,
-        "verses": [15, 16, 15, 13, 27, 14, 17, 14, 15]
-    },
-    "OBAD": {
-        "name": "Obadiah",
-        "testament": OLD_TESTAMENT,
-        "chapters": 1,
-        "verses": 21
-    },
-    "JON": {
-        "name": "Jonah",
-        "testament": OLD_TESTAMENT,
-        "chapters": 4,
-        "verses": [17, 10, 10, 11]
-    },
-    "MIC": {
-        "name": "Micah",
-        "testament": OLD_TESTAMENT,
-        "chapters": 7,
-        "verses": [16, 13, 12, 13, 15, 16, 20]
-    },
-    "NAM": {
-        "name": "Nahum",
-        "testament": OLD_TESTAMENT,
-        "chapters": 3,
-        "verses": [15, 13, 19]
-    },
-    "HAB": {
-        "name": "Habakkuk",
-        "testament": OLD_TESTAMENT,
-        "chapters": 3,
-        "verses": [17, 20, 19]
-    },
-    "ZEP": {
-        "name": "Zephaniah",
-        "testament": OLD_TESTAMENT,
-        "chapters": 3,
-        "verses": [18, 15, 20]
-    },
-    "HAG": {
-        "name": "Haggai",
-        "testament": OLD_TESTAMENT,
-        "chapters": 2,
-        "verses": [15, 23]
-    },
-    "ZEC": {
-        "name": "Zechariah",
-        "testament": OLD_TESTAMENT,
-        "chapters": 14,
-        "verses": [21, 13, 10, 14, 11, 15, 14, 23, 17, 12, 17, 14, 9, 21]
-    },
-    "MAL": {
-        "name": "Malachi",
-        "testament": OLD_TESTAMENT,
-        "chapters": 4,
-        "verses": [14, 17, 18, 6]
-    },
-    
-    # New Testament
-    "MAT": {
-        "name": "Matthew",
-        "testament": NEW_TESTAMENT,
-        "chapters": 28,
-        "verses": [25, 23, 17, 25, 48, 34, 29, 34, 38, 42, 30, 50, 58, 36, 39, 28, 27, 35, 30, 34, 46, 46, 39, 51, 46, 75, 66, 20]
-    },
-    "MRK": {
-        "name": "Mark",
-        "testament": NEW_TESTAMENT,
-        "chapters": 16,
-        "verses": [45, 28, 35, 41, 43, 56, 37, 38, 50, 52, 33, 44, 37, 72, 47, 20]
-    },
-    "LUK": {
-        "name": "Luke",
-        "testament": NEW_TESTAMENT,
-        "chapters": 24,
-        "verses": [80, 52, 38, 44, 39, 49, 50, 56, 62, 42, 54, 59, 35, 35, 32, 31, 37, 43, 48, 47, 38, 71, 56, 53]
-    },
-    "JHN": {
-        "name": "John",
-        "testament": NEW_TESTAMENT,
-        "chapters": 21,
-        "verses": [51, 25, 36, 54, 47, 71, 53, 59, 41, 42, 57, 50, 38, 31, 27, 33, 26, 40, 42, 31, 25]
-    },
-    "ACT": {
-        "name": "Acts",
-        "testament": NEW_TESTAMENT,
-        "chapters": 28,
-        "verses": [26, 47, 26, 37, 42, 15, 60, 40, 43, 48, 30, 25, 52, 28, 41, 40, 34, 28, 41, 38, 40, 30, 35, 27, 27, 32, 44, 31]
-    },
-    "ROM": {
-        "name": "Romans",
-        "testament": NEW_TESTAMENT,
-        "chapters": 16,
-        "verses": [32, 29, 31, 25, 21, 23, 25, 39, 33, 21, 36, 21, 14, 23, 33, 27]
-    },
-    "1CO": {
-        "name": "1 Corinthians",
-        "testament": NEW_TESTAMENT,
-        "chapters": 16,
-        "verses": [31, 16, 23, 21, 13, 20, 40, 13, 27, 33, 34, 31, 13, 40, 58, 24]
-    },
-    "2CO": {
-        "name": "2 Corinthians",
-        "testament": NEW_TESTAMENT,
-        "chapters": 13,
-        "verses": [24, 17, 18, 18, 21, 18, 16, 24, 15, 18, 33, 21, 14]
-    },
-    "GAL": {
-        "name": "Galatians",
-        "testament": NEW_TESTAMENT,
-        "chapters": 6,
-        "verses": [24, 21, 29, 31, 26, 18]
-    },
-    "EPH": {
-        "name": "Ephesians",
-        "testament": NEW_TESTAMENT,
-        "chapters": 6,
-        "verses": [23, 22, 21, 32, 33, 24]
-    },
-    "PHP": {
-        "name": "Philippians",
-        "testament": NEW_TESTAMENT,
-        "chapters": 4,
-        "verses": [30, 30, 21, 23]
-    },
-    "COL": {
-        "name": "Colossians",
-        "testament": NEW_TESTAMENT,
-        "chapters": 4,
-        "verses": [29, 23, 25, 18]
-    },
-    "1TH": {
-        "name": "1 Thessalonians",
-        "testament": NEW_TESTAMENT,
-        "chapters": 5,
-        "verses": [10, 20, 13, 18, 28]
-    },
-    "2TH": {
-        "name": "2 Thessalonians",
-        "testament": NEW_TESTAMENT,
-        "chapters": 3,
-        "verses": [12, 17, 18]
-    },
-    "1TI": {
-        "name": "1 Timothy",
-        "testament": NEW_TESTAMENT,
-        "chapters": 6,
-        "verses": [20, 15, 16, 16, 25, 21]
-    },
-    "2TI": {
-        "name": "2 Timothy",
-        "testament": NEW_TESTAMENT,
-        "chapters": 4,
-        "verses": [18, 26, 17, 22]
-    },
-    "TIT": {
-        "name": "Titus",
-        "testament": NEW_TESTAMENT,
-        "chapters": 3,
-        "verses": [16, 15, 15]
-    },
-    "PHLM": {
-        "name": "Philemon",
-        "testament": NEW_TESTAMENT,
-        "chapters": 1,
-        "verses": 25
-    },
-    "HEB": {
-        "name": "Hebrews",
-        "testament": NEW_TESTAMENT,
-        "chapters": 13,
-        "verses": [14, 18, 19, 16, 14, 20, 28, 13, 28, 39, 40, 29, 25]
-    },
-    "JAS": {
-        "name": "James",
-        "testament": NEW_TESTAMENT,
-        "chapters": 5,
-        "verses": [27, 26, 18, 17, 20]
-    },
-    "1PE": {
-        "name": "1 Peter",
-        "testament": NEW_TESTAMENT,
-        "chapters": 5,
-        "verses": [25, 25, 22, 19, 14]
-    },
-    "2PE": {
-        "name": "2 Peter",
-        "testament": NEW_TESTAMENT,
-        "chapters": 3,
-        "verses": [21, 22, 18]
-    },
-    "1JN": {
-        "name": "1 John",
-        "testament": NEW_TESTAMENT,
-        "chapters": 5,
-        "verses": [10, 29, 24, 21, 21]
-    },
-    "2JN": {
-        "name": "2 John",
-        "testament": NEW_TESTAMENT,
-        "chapters": 1,
-        "verses": 13
-    },
-    "3JN": {
-        "name": "3 John",
-        "testament": NEW_TESTAMENT,
-        "chapters": 1,
-        "verses": 14
-    },
-    "JUD": {
-        "name": "Jude",
-        "testament": NEW_TESTAMENT,
-        "chapters": 1,
-        "verses": 25
-    },
-    "REV": {
-        "name": "Revelation",
-        "testament": NEW_TESTAMENT,
-        "chapters": 22,
-        "verses": [20, 29, 22, 11, 14, 17, 17, 13, 21, 11, 19, 17, 18, 20, 8, 21, 18, 24, 21, 15, 27, 21]
-    }
-}
+BIBLE_DATA: Mapping[str, Mapping[str, Any]] = _BibleDataView()
+
+
+def verse_to_ordinal(book_id: str, chapter: int, verse: int) -> int:
+    """
+    Convert a verse reference to its global ordinal in O(1).
+    
+    Args:
+        book_id: Book ID (e.g., "JHN", "GEN")
+        chapter: Chapter number
+        verse: Verse number
+        
+    Returns:
+        The verse's 0-based global ordinal
+        
+    Raises:
+        ValueError: If the verse does not exist
+    """
+    book = BOOKS.get(book_id)
+    if book is None or chapter < 1 or chapter > len(book.verses):
+        raise ValueError(f"Reference does not exist: {book_id} {chapter}:{verse}")
+    
+    starts = book.chapter_starts
+    ordinal = starts[chapter - 1] + verse - 1
+    if verse < 1 or ordinal >= starts[chapter]:
+        raise ValueError(f"Reference does not exist: {book_id} {chapter}:{verse}")
+    return ordinal
+
+
+def ordinal_to_verse(ordinal: int) -> Tuple[str, int, int]:
+    """
+    Convert a global ordinal back to a verse reference in O(log n).
+    
+    Args:
+        ordinal: 0-based global verse ordinal
+        
+    Returns:
+        Tuple of (book_id, chapter, verse)
+        
+    Raises:
+        ValueError: If the ordinal is out of range
+    """
+    if not 0 <= ordinal < TOTAL_VERSES:
+        raise ValueError(f"Invalid verse ordinal: {ordinal}")
+    
+    book = BOOKS[BOOK_IDS[bisect_right(_BOOK_STARTS, ordinal) - 1]]
+    chapter = bisect_right(book.chapter_starts, ordinal)
+    return book.id, chapter, ordinal - book.chapter_starts[chapter - 1] + 1
+
+
+def chapter_ordinal_range(book_id: str, chapter: int) -> Tuple[int, int]:
+    """
+    Get the ordinal range covered by a chapter.
+    
+    Args:
+        book_id: Book ID (e.g., "JHN", "GEN")
+        chapter: Chapter number
+        
+    Returns:
+        Tuple of (first ordinal, one past the last ordinal)
+        
+    Raises:
+        ValueError: If the chapter does not exist
+    """
+    book = BOOKS.get(book_id)
+    if book is None or chapter < 1 or chapter > len(book.verses):
+        raise ValueError(f"Chapter {chapter} does not exist in {book_id}")
+    return book.chapter_starts[chapter - 1], book.chapter_starts[chapter]
+
+
+def book_ordinal_range(book_id: str) -> Tuple[int, int]:
+    """
+    Get the ordinal range covered by a book.
+    
+    Args:
+        book_id: Book ID (e.g., "JHN", "GEN")
+        
+    Returns:
+        Tuple of (first ordinal, one past the last ordinal)
+        
+    Raises:
+        ValueError: If the book does not exist
+    """
+    book = BOOKS.get(book_id)
+    if book is None:
+        raise ValueError(f"Unknown book ID: {book_id}")
+    return book.chapter_starts[0], book.chapter_starts[-1]
+
+
+def testament_ordinal_range(testament: str) -> Tuple[int, int]:
+    """
+    Get the ordinal range covered by a testament.
+    
+    Args:
+        testament: "OT" (Old Testament) or "NT" (New Testament)
+        
+    Returns:
+        Tuple of (first ordinal, one past the last ordinal)
+        
+    Raises:
+        ValueError: If an invalid testament is specified
+    """
+    if testament not in _TESTAMENT_RANGES:
+        raise ValueError(f"Invalid testament: {testament}. Must be 'OT', 'NT', or None.")
+    return _TESTAMENT_RANGES[testament]
 
 
 def get_random_book(testament: Optional[str] = None) -> str:
@@ -450,16 +291,8 @@ def get_random_book(testament: Optional[str] = None) -> str:
     if testament and testament not in (OLD_TESTAMENT, NEW_TESTAMENT):
         raise ValueError(f"Invalid testament: {testament}. Must be 'OT', 'NT', or None.")
     
-    # Filter books by testament if requested
-    if testament:
-        books = [book_id for book_id, data in BIBLE_DATA.items() 
-                if data["testament"] == testament]
-    else:
-        books = list(BIBLE_DATA.keys())
-    
-    # Safety check in case filtering resulted in empty list
-    if not books:
-        raise ValueError(f"No books found for testament: {testament}")
+    # Use the precomputed book list for the testament
+    books = _BOOKS_BY_TESTAMENT[testament or None]
     
     # Return a random book ID
     return random.choice(books)
@@ -475,11 +308,12 @@ def get_random_chapter(book_id: str) -> int:
     Returns:
         A random chapter number
     """
-    if book_id not in BIBLE_DATA:
+    book = BOOKS.get(book_id)
+    if book is None:
         raise ValueError(f"Unknown book ID: {book_id}")
     
     # Get the number of chapters in the book
-    num_chapters = BIBLE_DATA[book_id]["chapters"]
+    num_chapters = len(book.verses)
     
     # Return a random chapter number (1-based)
     return random.randint(1, num_chapters)
@@ -496,50 +330,86 @@ def get_random_verse(book_id: str, chapter: int) -> int:
     Returns:
         A random verse number
     """
-    if book_id not in BIBLE_DATA:
+    book = BOOKS.get(book_id)
+    if book is None:
         raise ValueError(f"Unknown book ID: {book_id}")
     
-    book_data = BIBLE_DATA[book_id]
-    
-    # Handle single-chapter books
-    if book_data["chapters"] == 1:
-        num_verses = book_data["verses"]
-        return random.randint(1, num_verses)
-    
-    # For multi-chapter books, get the verse count for the specified chapter
-    if chapter < 1 or chapter > book_data["chapters"]:
+    if chapter < 1 or chapter > len(book.verses):
         raise ValueError(f"Chapter {chapter} does not exist in {book_id}")
     
     # Get verse count for the chapter (1-based indexing)
-    num_verses = book_data["verses"][chapter - 1]
+    num_verses = book.verses[chapter - 1]
     
     # Return a random verse number (1-based)
     return random.randint(1, num_verses)
 
 
-def get_random_reference(testament: Optional[str] = None) -> str:
+def get_random_ordinal(testament: Optional[str] = None, rng: Optional[random.Random] = None) -> int:
     """
-    Generate a random Bible reference.
+    Draw a global verse ordinal uniformly over all verses.
+    
+    Every verse is equally likely, so long books are picked in proportion
+    to their length rather than as often as short ones.
     
     Args:
         testament: Optional filter for "OT" (Old Testament) or "NT" (New Testament)
+        rng: Optional random number generator (defaults to the module's)
         
     Returns:
-        A random reference string (e.g., "John 3:16")
+        A random verse ordinal
+        
+    Raises:
+        ValueError: If an invalid testament is specified
     """
-    # Get a random book
-    book_id = get_random_book(testament)
-    book_data = BIBLE_DATA[book_id]
-    book_name = book_data["name"]
+    start, stop = testament_ordinal_range(testament) if testament else (0, TOTAL_VERSES)
+    return (rng or random).randrange(start, stop)
+
+
+def get_random_reference(testament: Optional[str] = None, seed: Optional[int] = None) -> str:
+    """
+    Generate a random Bible reference, uniformly over all verses.
     
-    # Get a random chapter
-    chapter = get_random_chapter(book_id)
+    Args:
+        testament: Optional filter for "OT" (Old Testament) or "NT" (New Testament)
+        seed: Optional seed for a reproducible draw
+        
+    Returns:
+        A random reference string (e.g., "John 3:16")
+    """
+    rng = random.Random(seed) if seed is not None else None
     
-    # Get a random verse
-    verse = get_random_verse(book_id, chapter)
+    # Draw a verse ordinal and map it back to book, chapter and verse
+    book_id, chapter, verse = ordinal_to_verse(get_random_ordinal(testament, rng))
     
     # Format the reference (using the book name, not ID)
-    return f"{book_name} {chapter}:{verse}"
+    return f"{BOOKS[book_id].name} {chapter}:{verse}"
+
+
+def sample_ordinals(
+    count: int,
+    testament: Optional[str] = None,
+    seed: Optional[int] = None
+) -> List[int]:
+    """
+    Draw distinct global verse ordinals uniformly over all verses.
+
+    Args:
+        count: Number of verses to draw
+        testament: Optional filter for "OT" (Old Testament) or "NT" (New Testament)
+        seed: Optional seed for a reproducible draw
+
+    Returns:
+        List of distinct verse ordinals, in the order they were drawn
+
+    Raises:
+        ValueError: If an invalid testament or count is specified
+    """
+    start, stop = testament_ordinal_range(testament) if testament else (0, TOTAL_VERSES)
+    if not 1 <= count <= stop - start:
+        raise ValueError(f"Invalid count: {count}. Must be between 1 and {stop - start}.")
+
+    rng = random.Random(seed) if seed is not None else random
+    return rng.sample(range(start, stop), count)
 
 
 def is_valid_reference(book_id: str, chapter: int, verse: Optional[int] = None) -> bool:
@@ -555,27 +425,17 @@ def is_valid_reference(book_id: str, chapter: int, verse: Optional[int] = None)
         True if the reference is valid, False otherwise
     """
     # Check if book exists
-    if book_id not in BIBLE_DATA:
+    book = BOOKS.get(book_id)
+    if book is None:
         return False
     
-    book_data = BIBLE_DATA[book_id]
-    
     # Check if chapter exists
-    if chapter < 1 or chapter > book_data["chapters"]:
+    verses = book.verses
+    if chapter < 1 or chapter > len(verses):
         return False
     
     # If no verse specified, just validate the chapter
-    if verse is None:
-        return True
-    
-    # For single-chapter books
-    if book_data["chapters"] == 1:
-        num_verses = book_data["verses"]
-        return 1 <= verse <= num_verses
-    
-    # For multi-chapter books, check the verse
-    num_verses = book_data["verses"][chapter - 1]
-    return 1 <= verse <= num_verses
+    return verse is None or 1 <= verse <= verses[chapter - 1]
 
 
 def get_book_testament(book_id: str) -> str:
@@ -588,65 +448,343 @@ def get_book_testament(book_id: str) -> str:
     Returns:
         "OT" or "NT"
     """
-    if book_id not in BIBLE_DATA:
+    book = BOOKS.get(book_id)
+    if book is None:
         raise ValueError(f"Unknown book ID: {book_id}")
     
-    return BIBLE_DATA[book_id]["testament"]
+    return book.testament
 
 
-def parse_reference(reference: str) -> Tuple[str, int, Optional[int]]:
+def get_verse_count(book_id: str, chapter: int) -> int:
     """
-    Parse a Bible reference string into its components.
+    Get the number of verses in a chapter.
     
     Args:
-        reference: Reference string (e.g., "John 3:16", "Genesis 1")
+        book_id: Book ID (e.g., "JHN", "GEN")
+        chapter: Chapter number
         
     Returns:
-        Tuple of (book_id, chapter, verse) where verse may be None
+        Number of verses in the chapter
+        
+    Raises:
+        ValueError: If the book or chapter does not exist
     """
-    # This is a simplified parser - a full implementation would handle
-    # more complex references like ranges and multiple verses
+    book = BOOKS.get(book_id)
+    if book is None:
+        raise ValueError(f"Unknown book ID: {book_id}")
     
-    # First, split by space to separate book name from chapter/verse
-    parts = reference.strip().split(" ", 1)
-    if len(parts) < 2:
-        raise ValueError(f"Invalid reference format: {reference}")
+    if chapter < 1 or chapter > len(book.verses):
+        raise ValueError(f"Chapter {chapter} does not exist in {book_id}")
+    return book.verses[chapter - 1]
+
+
+# === BOOK NAME INDEX ===
+#
+# Book names are resolved through a dictionary precomputed in bible_tables,
+# mapping every normalized spelling of every book to its ID. The spellings
+# are listed in generate_bible_tables.py.
+
+# Word boundaries a reference may leave out: abbreviation dots ("Gen."),
+# and the gaps in "1Cor" or "John3:16"
+_BOOK_NAME_BREAKS = re.compile(r"(?<=[a-z])\.|(?<=[a-z])(?=\d)|(?<=\d)(?=[a-z])")
+
+
+def _normalize_book_name(name: str) -> str:
+    """
+    Normalize case, punctuation and spacing for book name lookups.
     
-    book_name, chapter_verse = parts
-    
-    # Find the book ID from the name
-    book_id = None
-    for bid, data in BIBLE_DATA.items():
-        if data["name"].lower() == book_name.lower():
-            book_id = bid
-            break
-    
-    if not book_id:
-        # If not found by name, maybe it's already an ID
-        if book_name.upper() in BIBLE_DATA:
-            book_id = book_name.upper()
-        else:
-            raise ValueError(f"Unknown book: {book_name}")
-    
-    # Parse chapter and verse
-    if ":" in chapter_verse:
-        # Has both chapter and verse
-        chapter_str, verse_str = chapter_verse.split(":", 1)
-        try:
-            chapter = int(chapter_str)
-            verse = int(verse_str)
-        except ValueError:
-            raise ValueError(f"Invalid chapter or verse number: {chapter_verse}")
-    else:
-        # Has only chapter
+    Args:
+        name: Book name or reference (e.g., "1Cor.", "Song  of Solomon")
+        
+    Returns:
+        Lowercase words separated by single spaces (e.g., "1 cor")
+    """
+    return " ".join(_BOOK_NAME_BREAKS.sub(" ", name.lower()).split())
+
+
+# Normalized book name to book ID, and the most words in any name
+_BOOK_INDEX: Dict[str, str] = bible_tables.BOOK_INDEX
+_MAX_BOOK_NAME_WORDS: int = bible_tables.MAX_BOOK_NAME_WORDS
+
+
+def match_book(text: str) -> Tuple[str, str]:
+    """
+    Split the book name off the start of a reference.
+    
+    The longest run of leading words that names a book wins, so
+    "1 John 3:16" is 1 John rather than a malformed "1", and
+    "Song of Solomon 2:1" is matched as a whole.
+    
+    Args:
+        text: Reference text (e.g., "1 John 3:16", "1Cor 13", "Jn 3:16")
+        
+    Returns:
+        Tuple of (book_id, normalized remainder of the text)
+        
+    Raises:
+        ValueError: If the text does not start with a known book
+    """
+    words = _normalize_book_name(text).split(" ")
+    for length in range(min(len(words), _MAX_BOOK_NAME_WORDS), 0, -1):
+        book_id = _BOOK_INDEX.get(" ".join(words[:length]))
+        if book_id is not None:
+            return book_id, " ".join(words[length:])
+    raise ValueError(f"Unknown book: {text.strip()}")
+
+
+def parse_verse_range(reference: str) -> Tuple[str, int, Optional[int], Optional[int]]:
+    """
+    Parse a reference to a chapter, verse or verse range within one chapter.
+    
+    This is a thin wrapper over parse_passage (see passage_verse_range),
+    so "Jude 5" means Jude 1:5.
+    
+    Args:
+        reference: Reference string (e.g., "John 3", "John 3:16", "1 John 3:16-18")
+        
+    Returns:
+        Tuple of (book_id, chapter, start_verse, end_verse) where both verses
+        are None for a whole chapter
+        
+    Raises:
+        ValueError: If the reference is malformed, does not exist or is not
+            within one chapter
+    """
+    verse_range = passage_verse_range(parse_passage(reference))
+    if verse_range is None:
+        raise ValueError(f"Not a chapter or verses within one chapter: {reference}")
+    return verse_range
+
+
+# === PASSAGE GRAMMAR ===
+#
+# A passage is one or more references separated by semicolons, each a book
+# followed by comma-separated segments:
+#
+#     passage   := reference (";" reference)*
+#     reference := [book] segment ("," segment)*
+#     segment   := point ["-" point]
+#     point     := number [":" number]
+#
+# A reference without a book continues the previous reference's book
+# ("John 3:16; 4:5"). A bare number is a verse after a segment that named
+# verses ("Matt 25:31-33,46") and a chapter otherwise ("Gen 1-3"), except
+# in single-chapter books, where it is always a verse ("Jude 5").
+
+_SEGMENT = re.compile(r"^(\d+)(?:[:.](\d+))?(?:-(\d+)(?:[:.](\d+))?)?$")
+
+# En and em dashes are accepted in ranges
+_DASHES = str.maketrans({"\u2013": "-", "\u2014": "-"})
+
+
+def _point_ordinal_range(book_id: str, chapter: int, verse: Optional[int]) -> Tuple[int, int]:
+    """
+    Get the ordinal range of a chapter or verse, explaining what is missing.
+    
+    Args:
+        book_id: Book ID (e.g., "JHN", "GEN")
+        chapter: Chapter number
+        verse: Verse number, or None for the whole chapter
+        
+    Returns:
+        Tuple of (first ordinal, one past the last ordinal)
+        
+    Raises:
+        ValueError: If the chapter or verse does not exist
+    """
+    book = BOOKS[book_id]
+    book_name = book.name
+    if not 1 <= chapter <= len(book.verses):
+        raise ValueError(f"Invalid chapter: {chapter} does not exist in {book_name}")
+    start, stop = chapter_ordinal_range(book_id, chapter)
+    if verse is None:
+        return start, stop
+    if not 1 <= verse <= stop - start:
+        raise ValueError(f"Invalid verse: {verse} does not exist in {book_name} {chapter}")
+    return start + verse - 1, start + verse
+
+
+@lru_cache(maxsize=4096)
+def parse_passage(reference: str) -> Tuple[Tuple[int, int], ...]:
+    """
+    Parse a passage reference into the verse ordinal ranges it covers.
+    
+    Supports chapters ("John 3", "Gen 1-3"), verses and ranges
+    ("Matthew 5:1-10"), cross-chapter ranges ("Gen 1:26-2:3"), comma lists
+    ("matt 25:31-33,46") and semicolon-separated references
+    ("John 3:16; Rom 5:8"). Results are memoized.
+    
+    Args:
+        reference: Passage reference string
+        
+    Returns:
+        Sorted, merged, half-open (start, stop) ordinal ranges
+        
+    Raises:
+        ValueError: If the reference is malformed or does not exist
+    """
+    ranges: List[Tuple[int, int]] = []
+    book_id: Optional[str] = None
+    
+    for part in reference.translate(_DASHES).split(";"):
+        if not part.strip():
+            continue
         try:
-            chapter = int(chapter_verse)
-            verse = None
+            book_id, rest = match_book(part)
         except ValueError:
-            raise ValueError(f"Invalid chapter number: {chapter_verse}")
+            if book_id is None:
+                raise
+            # No book name: continue the previous reference's book
+            rest = part
+        
+        rest = "".join(rest.split())
+        if not rest:
+            raise ValueError(f"Invalid reference format: {reference}")
+        
+        single_chapter = BOOKS[book_id].chapters == 1
+        # Chapter whose verses bare numbers refer to, or None for chapters
+        chapter: Optional[int] = 1 if single_chapter else None
+        
+        for segment in rest.split(","):
+            match = _SEGMENT.match(segment)
+            if match is None:
+                raise ValueError(f"Invalid chapter or verse number: {segment}")
+            first, first_verse, last, last_verse = (
+                int(n) if n is not None else None for n in match.groups()
+            )
+            
+            if first_verse is not None:
+                start_chapter, start_verse = first, first_verse
+            elif chapter is not None:
+                start_chapter, start_verse = chapter, first
+            else:
+                start_chapter, start_verse = first, None
+            
+            if last is None:
+                end_chapter, end_verse = start_chapter, start_verse
+            elif last_verse is not None:
+                end_chapter, end_verse = last, last_verse
+            elif start_verse is not None:
+                end_chapter, end_verse = start_chapter, last
+            else:
+                end_chapter, end_verse = last, None
+            
+            start = _point_ordinal_range(book_id, start_chapter, start_verse)[0]
+            stop = _point_ordinal_range(book_id, end_chapter, end_verse)[1]
+            if stop <= start:
+                raise ValueError(f"Reference does not exist: {reference}")
+            
+            ranges.append((start, stop))
+            chapter = end_chapter if end_verse is not None else None
+    
+    if not ranges:
+        raise ValueError(f"Invalid reference format: {reference}")
+    return IntervalSet(ranges).ranges
+
+
+def format_passage(ranges: Iterable[Tuple[int, int]]) -> str:
+    """
+    Format verse ordinal ranges as a reference that parse_passage accepts.
     
-    # Validate the reference
-    if not is_valid_reference(book_id, chapter, verse):
-        raise ValueError(f"Reference does not exist: {reference}")
+    Whole chapters are written as chapters ("Genesis 1-3"), and ranges in
+    the chapter the previous range ended in are joined with commas
+    ("Matthew 25:31-33,46").
     
-    return book_id, chapter, verse
+    Args:
+        ranges: Sorted, half-open (start, stop) ordinal ranges
+        
+    Returns:
+        Reference string (e.g., "John 3:16; Romans 5:8")
+    """
+    parts: List[str] = []
+    previous: Optional[Tuple[str, int]] = None
+    for start, stop in ranges:
+        while start < stop:
+            book_id, first_chapter, first_verse = ordinal_to_verse(start)
+            book = BOOKS[book_id]
+            piece_stop = min(stop, book.chapter_starts[-1])
+            _, last_chapter, last_verse = ordinal_to_verse(piece_stop - 1)
+            single_chapter = book.chapters == 1
+            whole_chapters = (
+                not single_chapter
+                and first_verse == 1
+                and piece_stop == book.chapter_starts[last_chapter]
+            )
+            
+            if whole_chapters:
+                text = str(first_chapter)
+                if last_chapter != first_chapter:
+                    text += f"-{last_chapter}"
+            else:
+                text = str(first_verse) if single_chapter else f"{first_chapter}:{first_verse}"
+                if last_chapter != first_chapter:
+                    text += f"-{last_chapter}:{last_verse}"
+                elif last_verse != first_verse:
+                    text += f"-{last_verse}"
+            
+            if not whole_chapters and previous == (book_id, first_chapter):
+                parts[-1] += "," + (text.split(":", 1)[1] if ":" in text.split("-")[0] else text)
+            else:
+                parts.append(f"{book.name} {text}")
+            previous = None if whole_chapters else (book_id, last_chapter)
+            start = piece_stop
+    return "; ".join(parts)
+
+
+def passage_verse_range(
+    ranges: Iterable[Tuple[int, int]]
+) -> Optional[Tuple[str, int, Optional[int], Optional[int]]]:
+    """
+    Get the chapter and verses that parsed passage ranges cover.
+    
+    Single-chapter books have no whole-chapter references, so their
+    ranges always give verses.
+    
+    Args:
+        ranges: Ranges returned by parse_passage
+        
+    Returns:
+        Tuple of (book_id, chapter, start_verse, end_verse) where both verses
+        are None for a whole chapter, or None if the ranges are not one run
+        of verses within a single chapter
+    """
+    ranges = list(ranges)
+    if len(ranges) != 1:
+        return None
+    start, stop = ranges[0]
+    book_id, chapter, start_verse = ordinal_to_verse(start)
+    end_book_id, end_chapter, end_verse = ordinal_to_verse(stop - 1)
+    if (end_book_id, end_chapter) != (book_id, chapter):
+        return None
+    if BOOKS[book_id].chapters > 1 and (start, stop) == chapter_ordinal_range(book_id, chapter):
+        return book_id, chapter, None, None
+    return book_id, chapter, start_verse, end_verse
+
+
+def parse_reference(reference: str) -> Tuple[str, int, Optional[int]]:
+    """
+    Parse a reference to a single verse or chapter into its components.
+    
+    This is a thin wrapper over parse_passage, which is the canonical
+    parser, for callers that need a book, chapter and verse. A bare number
+    in a single-chapter book is a verse, so "Jude 1" is Jude 1:1.
+    
+    Args:
+        reference: Reference string (e.g., "John 3:16", "Genesis 1")
+        
+    Returns:
+        Tuple of (book_id, chapter, verse) where verse is None for a whole chapter
+        
+    Raises:
+        ValueError: If the reference is malformed, does not exist or covers
+            more than one verse or chapter
+    """
+    ranges = parse_passage(reference)
+    if len(ranges) == 1:
+        start, stop = ranges[0]
+        book_id, chapter, verse = ordinal_to_verse(start)
+        if stop - start == 1:
+            return book_id, chapter, verse
+        if (start, stop) == chapter_ordinal_range(book_id, chapter):
+            return book_id, chapter, None
+    raise ValueError(f"Not a single verse or chapter: {reference}")
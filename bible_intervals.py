@@ -0,0 +1,142 @@
+"""
+Sets of verse ordinals stored as ranges.
+
+A passage like "John 3:1-10, 16" is a handful of contiguous runs of
+global verse ordinals (see bible_data). IntervalSet keeps those runs as
+sorted, disjoint, half-open (start, stop) ranges, so set operations over
+whole passages cost time proportional to the number of ranges rather than
+the number of verses.
+"""
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Tuple
+
+
+class IntervalSet:
+    """
+    Immutable set of integers stored as sorted, disjoint, half-open ranges.
+
+    Ranges that overlap or touch are merged on construction, so two sets
+    covering the same integers always have the same ranges.
+    """
+
+    __slots__ = ("_ranges", "_starts")
+
+    def __init__(self, ranges: Iterable[Tuple[int, int]] = ()):
+        """
+        Build a set from ranges in any order.
+
+        Args:
+            ranges: Half-open (start, stop) ranges; empty ranges are ignored
+        """
+        merged: List[Tuple[int, int]] = []
+        for start, stop in sorted(r for r in ranges if r[0] < r[1]):
+            if merged and start <= merged[-1][1]:
+                if stop > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], stop)
+            else:
+                merged.append((start, stop))
+        self._ranges: Tuple[Tuple[int, int], ...] = tuple(merged)
+        self._starts = [start for start, _ in merged]
+
+    @property
+    def ranges(self) -> Tuple[Tuple[int, int], ...]:
+        """
+        The set's sorted, disjoint, non-adjacent (start, stop) ranges.
+        """
+        return self._ranges
+
+    @property
+    def size(self) -> int:
+        """
+        The number of integers in the set.
+        """
+        return sum(stop - start for start, stop in self._ranges)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return iter(self._ranges)
+
+    def __bool__(self) -> bool:
+        return bool(self._ranges)
+
+    def __contains__(self, value: int) -> bool:
+        index = bisect_right(self._starts, value) - 1
+        return index >= 0 and value < self._ranges[index][1]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self._ranges == other._ranges
+
+    def __hash__(self) -> int:
+        return hash(self._ranges)
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self._ranges)!r})"
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        """
+        Get the integers in either set.
+
+        Args:
+            other: Another interval set
+
+        Returns:
+            A new interval set
+        """
+        return IntervalSet(self._ranges + other._ranges)
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        """
+        Get the integers in both sets.
+
+        Args:
+            other: Another interval set
+
+        Returns:
+            A new interval set
+        """
+        result = []
+        mine, theirs = self._ranges, other._ranges
+        i = j = 0
+        while i < len(mine) and j < len(theirs):
+            start = max(mine[i][0], theirs[j][0])
+            stop = min(mine[i][1], theirs[j][1])
+            if start < stop:
+                result.append((start, stop))
+            # Advance whichever range ends first
+            if mine[i][1] < theirs[j][1]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet(result)
+
+    def difference(self, other: "IntervalSet") -> "IntervalSet":
+        """
+        Get the integers in this set but not the other.
+
+        Args:
+            other: Another interval set
+
+        Returns:
+            A new interval set
+        """
+        result = []
+        theirs = other._ranges
+        j = 0
+        for start, stop in self._ranges:
+            # Skip the other set's ranges that end before this one starts
+            while j < len(theirs) and theirs[j][1] <= start:
+                j += 1
+            k = j
+            while k < len(theirs) and theirs[k][0] < stop:
+                if theirs[k][0] > start:
+                    result.append((start, theirs[k][0]))
+                start = max(start, theirs[k][1])
+                k += 1
+            if start < stop:
+                result.append((start, stop))
+        return IntervalSet(result)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
@@ -0,0 +1,478 @@
+"""
+Offline Bible backend serving verses from a corpus installed on disk.
+
+Translations are served from compiled, memory-mapped verse stores (see
+bible_store). A corpus directory may also hold source JSON files, one per
+translation, named after the translation ID (e.g., "web.json"):
+
+    {
+        "translation_id": "web",
+        "translation_name": "World English Bible",
+        "language": "English",
+        "books": {"GEN": [["In the beginning...", ...], ...], ...}
+    }
+
+where "books" maps each book ID to a list of chapters, each a list of
+verse texts. A JSON corpus is compiled into a store the first time its
+translation is requested. Lookups never touch the network and are not
+rate limited. Compiling a store also writes the translation's full-text
+search index and concordance (see bible_search), which are memory-mapped
+the first time the translation is searched.
+"""
+import asyncio
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from bible_api import BibleBackend, DEFAULT_TRANSLATION
+from bible_data import (
+    BOOKS,
+    OLD_TESTAMENT,
+    NEW_TESTAMENT,
+    TOTAL_VERSES,
+    book_ordinal_range,
+    chapter_ordinal_range,
+    format_passage,
+    get_random_reference,
+    is_valid_reference,
+    match_book,
+    ordinal_to_verse,
+    parse_passage,
+    testament_ordinal_range,
+    verse_to_ordinal,
+)
+from bible_intervals import IntervalSet
+from bible_search import CONCORDANCE_REFERENCES, MappedSearchIndex, SearchIndex, tokenize
+from bible_store import VerseStore, import_json_corpus, read_metadata, store_exists
+
+# Translation IDs name files in the corpus directory, so they may not hold path separators
+_TRANSLATION_ID = re.compile(r"[a-z0-9_-]+")
+
+
+class LocalBibleClient(BibleBackend):
+    """
+    Bible backend reading translations from a local corpus directory.
+    """
+
+    def __init__(self, corpus_dir: str):
+        """
+        Initialize the backend.
+
+        Translations are opened lazily the first time they are requested.
+
+        Args:
+            corpus_dir: Directory containing the compiled stores or JSON corpus files
+        """
+        self.corpus_dir = corpus_dir
+        self._stores: Dict[str, VerseStore] = {}
+        self._indexes: Dict[str, SearchIndex] = {}
+        # Held while a store or index is being opened (see _get_opening_lock)
+        self._opening: Optional[asyncio.Lock] = None
+        self._opening_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def available_translations(self) -> List[str]:
+        """
+        Get the IDs of the translations installed in the corpus directory.
+
+        Returns:
+            Sorted list of translation IDs
+        """
+        if not os.path.isdir(self.corpus_dir):
+            return []
+        translations = set()
+        for name in os.listdir(self.corpus_dir):
+            if name.endswith(".idx"):
+                translations.add(name[:-len(".idx")])
+            elif name.endswith(".json") and not name.endswith(".meta.json"):
+                translations.add(name[:-len(".json")])
+        return sorted(translations)
+
+    def _get_opening_lock(self) -> asyncio.Lock:
+        """
+        Get the lock held while opening stores, for the running event loop.
+
+        The backend is created at import time, before any loop runs, so the
+        lock is created on first use and again whenever the loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._opening is None or self._opening_loop is not loop:
+            self._opening = asyncio.Lock()
+            self._opening_loop = loop
+        return self._opening
+
+    async def _load(self, translation: Optional[str]) -> VerseStore:
+        """
+        Open a translation's store, compiling its JSON corpus if needed.
+
+        Compiling and opening run on a worker thread, one translation at
+        a time, so they do not hold up other requests.
+
+        Args:
+            translation: Translation ID, or None for the default
+
+        Returns:
+            The translation's verse store
+
+        Raises:
+            ValueError: If the translation ID is invalid or not installed
+        """
+        translation = (translation or DEFAULT_TRANSLATION).lower()
+        if not _TRANSLATION_ID.fullmatch(translation):
+            raise ValueError(f"Invalid translation: {translation}")
+        store = self._stores.get(translation)
+        if store is None:
+            async with self._get_opening_lock():
+                store = self._stores.get(translation)
+                if store is None:
+                    store = await asyncio.to_thread(self._open_store, translation)
+                    self._stores[translation] = store
+        return store
+
+    def _open_store(self, translation: str) -> VerseStore:
+        """
+        Open a translation's store, compiling its JSON corpus first if needed.
+
+        Args:
+            translation: Validated, lowercase translation ID
+
+        Returns:
+            The opened verse store
+
+        Raises:
+            ValueError: If the translation is not installed
+        """
+        if not store_exists(self.corpus_dir, translation):
+            json_path = os.path.join(self.corpus_dir, f"{translation}.json")
+            if not os.path.exists(json_path):
+                raise ValueError(f"Translation not available offline: {translation}")
+            import_json_corpus(json_path, self.corpus_dir)
+        return VerseStore(self.corpus_dir, translation)
+
+    async def _get_index(self, translation: Optional[str]) -> SearchIndex:
+        """
+        Get a translation's search index, opening it on first use.
+
+        Stores compiled before search indexes were written alongside them
+        have their index built in memory instead, on a worker thread.
+
+        Args:
+            translation: Translation ID, or None for the default
+
+        Returns:
+            The translation's search index
+
+        Raises:
+            ValueError: If the translation is not installed
+        """
+        store = await self._load(translation)
+        index = self._indexes.get(store.translation_id)
+        if index is None:
+            async with self._get_opening_lock():
+                index = self._indexes.get(store.translation_id)
+                if index is None:
+                    index = await asyncio.to_thread(self._open_index, store)
+                    self._indexes[store.translation_id] = index
+        return index
+
+    def _open_index(self, store: VerseStore) -> SearchIndex:
+        """
+        Open a store's search file, or index its verses if it has none.
+
+        Args:
+            store: The translation's verse store
+
+        Returns:
+            The translation's search index
+        """
+        path = os.path.join(self.corpus_dir, store.translation_id + ".search")
+        if os.path.exists(path):
+            return MappedSearchIndex(path)
+        texts = store.get_texts(0, TOTAL_VERSES)
+        return SearchIndex((ordinal, text) for ordinal, text in enumerate(texts) if text)
+
+    async def aclose(self) -> None:
+        """
+        Release the memory-mapped stores and search indexes.
+        """
+        for store in self._stores.values():
+            store.close()
+        self._stores.clear()
+        for index in self._indexes.values():
+            index.close()
+        self._indexes.clear()
+
+    async def _get_passage(
+        self,
+        translation: Optional[str],
+        ranges: Iterable[Tuple[int, int]],
+        reference: str
+    ) -> Dict:
+        """
+        Build a response for the verses in a set of ordinal ranges.
+
+        Args:
+            translation: Translation ID, or None for the default
+            ranges: Half-open (start, stop) ordinal ranges
+            reference: Reference to report for the passage
+
+        Returns:
+            Dictionary in the bible-api.com response format
+
+        Raises:
+            ValueError: If the translation is not installed or lacks the verses
+        """
+        store = await self._load(translation)
+
+        verses = []
+        for start, stop in ranges:
+            for ordinal, text in enumerate(store.get_texts(start, stop), start):
+                if not text:
+                    continue
+                book_id, chapter, verse = ordinal_to_verse(ordinal)
+                verses.append({
+                    "book_id": book_id,
+                    "book_name": BOOKS[book_id].name,
+                    "chapter": chapter,
+                    "verse": verse,
+                    "text": text,
+                })
+        if not verses:
+            raise ValueError(f"Reference not found: {reference}")
+
+        return {
+            "reference": reference,
+            "verses": verses,
+            "text": "\n".join(v["text"] for v in verses),
+            "translation_id": store.metadata.get("translation_id", translation),
+            "translation_name": store.metadata.get("translation_name", translation),
+        }
+
+    async def get_verse_by_reference(self, reference: str, translation: Optional[str] = None) -> Dict:
+        """
+        Get verse(s) by reference from the local corpus.
+
+        Args:
+            reference: Bible reference (e.g., "John 3:16", "Gen 1:26-2:3", "John 3:16; Rom 5:8")
+            translation: Optional translation ID (e.g., "kjv", "web")
+
+        Returns:
+            Dictionary containing the verse data
+
+        Raises:
+            ValueError: If the reference is invalid or not in the corpus
+        """
+        ranges = parse_passage(reference)
+        return await self._get_passage(translation, ranges, format_passage(ranges))
+
+    async def get_by_book_chapter_verse(
+        self,
+        translation_id: str,
+        book_id: str,
+        chapter: int,
+        verse: Optional[int] = None
+    ) -> Dict:
+        """
+        Get a chapter or verse by book ID and numbers from the local corpus.
+
+        Args:
+            translation_id: Translation identifier (e.g., "web", "kjv")
+            book_id: Book identifier (e.g., "JHN", "GEN")
+            chapter: Chapter number
+            verse: Optional verse number
+
+        Returns:
+            Dictionary containing the verse data
+
+        Raises:
+            ValueError: If the reference is invalid or not in the corpus
+        """
+        if not is_valid_reference(book_id, chapter, verse):
+            raise ValueError(f"Invalid reference: {book_id} {chapter}:{verse if verse else ''}")
+
+        book_name = BOOKS[book_id].name
+        if verse is None:
+            return await self._get_passage(
+                translation_id, [chapter_ordinal_range(book_id, chapter)], f"{book_name} {chapter}"
+            )
+        ordinal = verse_to_ordinal(book_id, chapter, verse)
+        return await self._get_passage(
+            translation_id, [(ordinal, ordinal + 1)], f"{book_name} {chapter}:{verse}"
+        )
+
+    async def get_random_verse(
+        self,
+        translation_id: str = "web",
+        testament: Optional[str] = None,
+        seed: Optional[int] = None
+    ) -> Dict:
+        """
+        Get a random verse from the local corpus, with every verse equally likely.
+
+        Args:
+            translation_id: Translation identifier (default: "web")
+            testament: Optional filter for "OT" (Old Testament) or "NT" (New Testament)
+            seed: Optional seed for a reproducible choice
+
+        Returns:
+            Dictionary containing the random verse data
+
+        Raises:
+            ValueError: If an invalid testament is specified
+        """
+        if testament and testament not in (OLD_TESTAMENT, NEW_TESTAMENT):
+            raise ValueError(f"Invalid testament: {testament}. Must be 'OT', 'NT', or None.")
+        return await self.get_verse_by_reference(get_random_reference(testament, seed), translation_id)
+
+    async def search_verses(
+        self,
+        query: str,
+        translation: Optional[str] = None,
+        testament: Optional[str] = None,
+        limit: int = 10,
+        book: Optional[str] = None
+    ) -> Dict:
+        """
+        Search the local corpus, ranking verses with BM25.
+
+        Args:
+            query: Words, quoted phrases and NEAR/k clauses to search for
+            translation: Optional translation ID (e.g., "kjv", "web")
+            testament: Optional filter for "OT" (Old Testament) or "NT" (New Testament)
+            limit: Maximum number of verses to return
+            book: Optional book name or ID to search within (e.g., "Psalms", "JHN")
+
+        Returns:
+            Dictionary with the "query", "translation_id", "translation_name",
+            the matching "verses", best match first, each with its "score",
+            and the "corrections" made for misspelled words
+
+        Raises:
+            ValueError: If the query, filters or limit are invalid, or the
+                translation is not installed
+        """
+        if not query.strip():
+            raise ValueError("Search query is empty")
+        if limit < 1:
+            raise ValueError(f"Invalid limit: {limit}. Must be positive.")
+        if testament and testament not in (OLD_TESTAMENT, NEW_TESTAMENT):
+            raise ValueError(f"Invalid testament: {testament}. Must be 'OT', 'NT', or None.")
+
+        scope = IntervalSet([(0, TOTAL_VERSES)])
+        if testament:
+            scope &= IntervalSet([testament_ordinal_range(testament)])
+        if book:
+            book_id, rest = match_book(book)
+            if rest:
+                raise ValueError(f"Unknown book: {book}")
+            scope &= IntervalSet([book_ordinal_range(book_id)])
+
+        index = await self._get_index(translation)
+        store = await self._load(translation)
+        hits, corrections = index.search(query, scope.ranges, limit)
+        verses = []
+        for ordinal, score in hits:
+            book_id, chapter, verse = ordinal_to_verse(ordinal)
+            verses.append({
+                "book_id": book_id,
+                "book_name": BOOKS[book_id].name,
+                "chapter": chapter,
+                "verse": verse,
+                "text": store.get_text(ordinal),
+                "score": round(score, 3),
+            })
+
+        return {
+            "query": query,
+            "verses": verses,
+            "corrections": corrections,
+            "translation_id": store.translation_id,
+            "translation_name": store.metadata.get("translation_name", store.translation_id),
+        }
+
+    async def concordance(
+        self,
+        word: str,
+        translation: Optional[str] = None,
+        limit: int = 10
+    ) -> Dict:
+        """
+        Count a word's occurrences from the concordance precomputed with the store.
+
+        Args:
+            word: Word to look up (e.g., "grace")
+            translation: Optional translation ID (e.g., "kjv", "web")
+            limit: Maximum number of references to return
+
+        Returns:
+            Dictionary with the normalized "word", "translation_id",
+            "translation_name", the number of "occurrences" and of "verses"
+            containing it, occurrences per testament ("testaments") and per
+            book ("books", in canonical order), the first "references" in
+            canonical order, and "suggestions" for a word not found
+
+        Raises:
+            ValueError: If the word or limit is invalid, or the translation
+                is not installed
+        """
+        words = tokenize(word)
+        if len(words) != 1:
+            raise ValueError(f"Invalid word: {word!r}. Must be a single word.")
+        if not 1 <= limit <= CONCORDANCE_REFERENCES:
+            raise ValueError(f"Invalid limit: {limit}. Must be between 1 and {CONCORDANCE_REFERENCES}.")
+
+        index = await self._get_index(translation)
+        store = await self._load(translation)
+        counts = index.concordance(words[0])
+        result = {
+            "word": words[0],
+            "translation_id": store.translation_id,
+            "translation_name": store.metadata.get("translation_name", store.translation_id),
+            "occurrences": 0,
+            "verses": 0,
+            "testaments": {OLD_TESTAMENT: 0, NEW_TESTAMENT: 0},
+            "books": [],
+            "references": [],
+            "suggestions": [],
+        }
+        if counts is None:
+            result["suggestions"] = index.correct(words[0])
+            return result
+
+        result.update(
+            occurrences=counts["occurrences"],
+            verses=counts["verses"],
+            testaments=counts["testaments"],
+        )
+        result["books"] = [
+            {"book_id": book_id, "book_name": BOOKS[book_id].name, "count": count}
+            for book_id, count in counts["books"].items()
+        ]
+        for ordinal in counts["ordinals"][:limit]:
+            book_id, chapter, verse = ordinal_to_verse(ordinal)
+            result["references"].append({
+                "book_id": book_id,
+                "book_name": BOOKS[book_id].name,
+                "chapter": chapter,
+                "verse": verse,
+                "text": store.get_text(ordinal),
+            })
+        return result
+
+    async def list_translations(self) -> List[Dict]:
+        """
+        Get the translations installed in the corpus directory.
+
+        Returns:
+            List of translation dictionaries with id, name, and language
+        """
+        translations = []
+        for translation_id in self.available_translations():
+            # Only the metadata is read, so nothing is compiled or opened
+            metadata = await asyncio.to_thread(read_metadata, self.corpus_dir, translation_id)
+            translations.append({
+                "id": translation_id,
+                "name": metadata.get("translation_name", translation_id),
+                "language": metadata.get("language", "Unknown"),
+                "default": translation_id == DEFAULT_TRANSLATION,
+            })
+        return translations
@@ -0,0 +1,213 @@
+"""
+Bulk mirroring of a translation from bible-api.com into a local store.
+
+Crawls every chapter of a translation through BibleAPIClient, staying
+under the upstream rate limit, and writes the result as a compiled verse
+store that the local backend can serve. Progress is checkpointed after
+each chapter, so an interrupted run resumes where it stopped.
+
+Usage:
+    bible-mcp-mirror --translation web --output ~/.local/share/bible-mcp
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from bible_api import TRANSLATIONS, BibleAPIClient, BibleBackend, TokenBucket
+from bible_data import BOOKS, verse_to_ordinal
+from bible_store import write_store
+from bible_versification import get_versification
+
+
+def iter_chapters() -> Iterator[Tuple[str, int]]:
+    """
+    Iterate over every chapter in canonical order.
+
+    Returns:
+        Iterator of (book_id, chapter) pairs
+    """
+    for book in BOOKS.values():
+        for chapter in range(1, book.chapters + 1):
+            yield book.id, chapter
+
+
+def checkpoint_path(directory: str, translation_id: str) -> str:
+    """
+    Get the path of a translation's mirroring checkpoint file.
+
+    Args:
+        directory: Output corpus directory
+        translation_id: Translation ID (e.g., "web")
+
+    Returns:
+        Path to the checkpoint file
+    """
+    return os.path.join(directory, f"{translation_id}.mirror.jsonl")
+
+
+def _read_checkpoint(path: str) -> List[Dict]:
+    """
+    Read the chapters completed by a previous run.
+
+    A partially written last line (from an interrupted run) is ignored.
+
+    Args:
+        path: Checkpoint file path
+
+    Returns:
+        List of chapter records
+    """
+    records = []
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+    return records
+
+
+async def mirror_translation(
+    client: BibleBackend,
+    translation_id: str,
+    directory: str,
+    progress: Optional[Callable[[int, int, str, int], None]] = None
+) -> int:
+    """
+    Mirror a whole translation into a compiled verse store.
+
+    Verses are stored at their standard ordinals, converted from the
+    translation's own numbering where it differs (see bible_versification).
+
+    Args:
+        client: Backend to fetch chapters from
+        translation_id: Translation ID (e.g., "web")
+        directory: Output corpus directory
+        progress: Optional callback(done, total, book_id, chapter) after each chapter
+
+    Returns:
+        Number of verses written to the store
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = checkpoint_path(directory, translation_id)
+    records = _read_checkpoint(path)
+    done: Set[Tuple[str, int]] = {(r["book_id"], r["chapter"]) for r in records}
+    translation_name = next((r["translation_name"] for r in records if r.get("translation_name")), None)
+
+    chapters = list(iter_chapters())
+    # Rewrite completed chapters so a truncated last line does not linger,
+    # replacing the old checkpoint only once the new one is complete
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    os.replace(path + ".tmp", path)
+
+    with open(path, "a", encoding="utf-8") as f:
+        for book_id, chapter in chapters:
+            if (book_id, chapter) in done:
+                continue
+
+            try:
+                data = await client.get_by_book_chapter_verse(translation_id, book_id, chapter)
+            except ValueError:
+                # Chapter missing from this translation (e.g., NT-only editions).
+                # It is left out of the checkpoint, so a resumed run retries it.
+                data = None
+
+            if data is not None:
+                translation_name = translation_name or data.get("translation_name")
+                record = {
+                    "book_id": book_id,
+                    "chapter": chapter,
+                    "translation_name": data.get("translation_name"),
+                    # The translation's own numbering, which may differ from the chapter asked for
+                    "verses": [
+                        [v["chapter"], v["verse"], v["text"].strip()] for v in data.get("verses", [])
+                    ],
+                }
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                records.append(record)
+            done.add((book_id, chapter))
+
+            if progress:
+                progress(len(done), len(chapters), book_id, chapter)
+
+    versification = get_versification(translation_id)
+    texts: Dict[int, str] = {}
+    for record in records:
+        book_id = record["book_id"]
+        for chapter, verse, text in record["verses"]:
+            try:
+                if versification is not None:
+                    start, stop = versification.from_scheme(book_id, chapter, verse)
+                else:
+                    start = verse_to_ordinal(book_id, chapter, verse)
+                    stop = start + 1
+            except ValueError:
+                # Verse outside the canonical versification
+                continue
+            # A verse covering several standard verses is stored at the first;
+            # one with no standard counterpart (e.g., a psalm title) is dropped
+            if start < stop:
+                texts.setdefault(start, text)
+    verses = sorted(texts.items())
+
+    metadata = {"translation_name": translation_name or translation_id}
+    write_store(directory, translation_id, verses, metadata)
+    os.remove(path)
+    return len(verses)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point for mirroring a translation.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog="bible-mcp-mirror",
+        description="Download a whole translation from bible-api.com into a local corpus.",
+    )
+    parser.add_argument("--translation", "-t", default="web", help="Translation ID (default: web)")
+    parser.add_argument("--output", "-o", required=True, help="Corpus directory to write to")
+    parser.add_argument(
+        "--rate", type=float, default=1.0,
+        help="Maximum requests per second (default: 1.0)",
+    )
+    args = parser.parse_args(argv)
+    if args.translation.lower() not in {t["id"] for t in TRANSLATIONS}:
+        parser.error(f"unknown translation: {args.translation}")
+
+    def report(done: int, total: int, book_id: str, chapter: int) -> None:
+        print(f"[{done}/{total}] {book_id} {chapter}", file=sys.stderr)
+
+    async def run() -> int:
+        async with BibleAPIClient(rate_limiter=TokenBucket(rate=args.rate), cache_size=0) as client:
+            return await mirror_translation(
+                client, args.translation.lower(), os.path.expanduser(args.output), report
+            )
+
+    try:
+        count = asyncio.run(run())
+    except KeyboardInterrupt:
+        print("Interrupted; run the same command again to resume.", file=sys.stderr)
+        return 130
+    except Exception as e:
+        print(f"Error: {str(e)}. Run the same command again to resume.", file=sys.stderr)
+        return 1
+
+    print(f"Mirrored {count} verses of {args.translation} into {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
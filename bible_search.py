@@ -0,0 +1,980 @@
+"""
+Full-text search over a translation's verses.
+
+A SearchIndex is an inverted index mapping each word to the verses that
+contain it, ranked with Okapi BM25. Postings are kept sorted by global
+verse ordinal (see bible_data), so a search restricted to a book or
+testament only visits the postings inside its ordinal ranges.
+
+Postings also record where in each verse a word occurs, which lets
+queries require exact phrases and words near each other:
+
+    love your enemies            verses with any of the words
+    "in the beginning"           verses containing the phrase
+    faith NEAR/3 hope            verses with the words at most 3 words apart
+
+Phrases and NEAR clauses must all match; every word in the query counts
+towards the ranking.
+
+Query words missing from the index are taken to be misspellings. Indexed
+words sharing enough trigrams (three-letter runs) with them are looked up
+in a trigram index over the vocabulary and kept if they are within a small
+edit distance, so "Nebuchadnezar" finds "Nebuchadnezzar". A misspelled
+loose word is replaced by its few closest corrections, and a misspelled
+word in a phrase or NEAR clause by its closest one.
+
+write_search_index writes a translation's index to a "<translation>.search"
+file, and MappedSearchIndex memory-maps it so every server process shares
+one read-only copy. The file holds a sorted term dictionary and each
+word's postings, delta-encoded as varints; a word's postings are only
+decoded when a query uses it, and its positions only when a phrase or
+NEAR clause needs them. The file also holds the trigram index, written
+as each trigram's sorted term numbers, delta-encoded as varints, and each
+word's concordance: its occurrences per book and its first verses,
+counted when the file is written so looking them up costs no more than
+finding the word.
+"""
+import heapq
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, chain, repeat
+from operator import lshift, or_
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from bible_data import BOOK_IDS, BOOKS, NEW_TESTAMENT, OLD_TESTAMENT, TOTAL_VERSES, book_ordinal_range
+
+# Words are runs of letters and digits, possibly joined by apostrophes
+_WORD = re.compile(r"[^\W_]+(?:['’][^\W_]+)*")
+
+# Query clauses: a quoted phrase, a NEAR/k pair, or a single word
+_CLAUSE = re.compile(
+    r'"(?P<phrase>[^"]*)"?'
+    r'|(?P<left>[^\s"]+)\s+NEAR/(?P<distance>\d+)\s+(?P<right>[^\s"]+)'
+    r'|(?P<word>[^\s"]+)'
+)
+
+# Search file header: magic, verse ordinal count, term count, indexed verse
+# count, trigram count
+_SEARCH_MAGIC = b"BIBLSRC3"
+_SEARCH_HEADER = struct.Struct("<8sIIII")
+
+# Words shorter than this are never corrected, as too many words are
+# within an edit of them
+_MIN_CORRECTED_LENGTH = 4
+
+# Words at least this long may be corrected by two edits rather than one
+_TWO_EDIT_LENGTH = 8
+
+# Largest number of corrections a misspelled word expands to
+MAX_CORRECTIONS = 3
+
+# Number of a word's first verses kept in its concordance
+CONCORDANCE_REFERENCES = 50
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase words for indexing and querying.
+
+    Possessive endings are dropped, so "God's" matches "God".
+
+    Args:
+        text: Verse text or query
+
+    Returns:
+        List of words in order
+    """
+    words = []
+    for word in _WORD.findall(text.lower()):
+        word = word.replace("’", "'")
+        if word.endswith("'s"):
+            word = word[:-2]
+        words.append(word)
+    return words
+
+
+def trigrams(word: str) -> Set[str]:
+    """
+    Get the trigrams of a word, marking its start and end with "^" and "$".
+
+    Args:
+        word: Indexed or query word
+
+    Returns:
+        Set of trigrams (e.g., {"^go", "god", "od$"} for "god")
+    """
+    padded = f"^{word}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(first: str, second: str, limit: int) -> int:
+    """
+    Get the Levenshtein distance between two words, up to a limit.
+
+    Args:
+        first: A word
+        second: Another word
+        limit: Largest distance of interest
+
+    Returns:
+        The number of insertions, deletions and substitutions turning one
+        word into the other, or limit + 1 if more than limit are needed
+    """
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+    previous = list(range(len(second) + 1))
+    for i, char in enumerate(first, 1):
+        current = [i]
+        for j, other in enumerate(second, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char != other),
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return min(previous[-1], limit + 1)
+
+
+def parse_query(query: str) -> Tuple[List[List[str]], List[Tuple[str, str, int]], List[str]]:
+    """
+    Split a query into phrases, NEAR clauses and loose words.
+
+    Args:
+        query: Search query (e.g., '"in the beginning" faith NEAR/3 hope')
+
+    Returns:
+        Tuple of (phrases as word lists, (word, word, distance) NEAR
+        clauses, loose words)
+    """
+    phrases: List[List[str]] = []
+    nears: List[Tuple[str, str, int]] = []
+    words: List[str] = []
+    for match in _CLAUSE.finditer(query):
+        if match.group("phrase") is not None:
+            phrase = tokenize(match.group("phrase"))
+            if len(phrase) > 1:
+                phrases.append(phrase)
+            else:
+                words.extend(phrase)
+        elif match.group("left") is not None:
+            left = tokenize(match.group("left"))
+            right = tokenize(match.group("right"))
+            if len(left) == 1 and len(right) == 1:
+                nears.append((left[0], right[0], int(match.group("distance"))))
+            else:
+                words.extend(left + right)
+        else:
+            words.extend(tokenize(match.group("word")))
+    return phrases, nears, words
+
+
+# Each occurrence of a word is keyed by its verse and position as
+# ordinal << 16 | position, so an occurrence's neighbours have neighbouring
+# keys. Positions stop at _MAX_POSITION, and distances are capped at the
+# same value, so shifting a key never reaches another verse's words.
+_POSITION_BITS = 16
+_MAX_POSITION = 0x7FFF
+
+
+class _Postings:
+    """
+    The verses containing one word, and the word's occurrences in each.
+
+    The occurrence keys in the i-th verse are keys[offsets[i]:offsets[i + 1]],
+    so the word's count in that verse is the length of the slice.
+    """
+
+    __slots__ = ("ordinals", "offsets", "keys")
+
+    def __init__(self, ordinals: Optional[array] = None, offsets: Optional[array] = None):
+        self.ordinals = ordinals if ordinals is not None else array("I")
+        self.offsets = offsets if offsets is not None else array("I", [0])
+        self.keys = array("I")
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def occurrences(self) -> int:
+        """
+        Get the number of times the word occurs in all verses.
+        """
+        return self.offsets[-1]
+
+    def find(self, ordinal: int) -> int:
+        """
+        Get the index of a verse in the postings.
+
+        Args:
+            ordinal: Verse ordinal
+
+        Returns:
+            The verse's index, or -1 if the word is not in the verse
+        """
+        i = bisect_left(self.ordinals, ordinal)
+        return i if i < len(self.ordinals) and self.ordinals[i] == ordinal else -1
+
+    def keys_within(self, spans: List[Tuple[int, int]]) -> List[int]:
+        """
+        Get the keys of the word's occurrences within some ordinal ranges.
+
+        Args:
+            spans: Half-open ordinal ranges
+
+        Returns:
+            Sorted occurrence keys
+        """
+        keys = self.keys
+        found: List[int] = []
+        for start, stop in spans:
+            low = bisect_left(keys, start << _POSITION_BITS)
+            high = bisect_left(keys, stop << _POSITION_BITS, low)
+            found.extend(keys[low:high])
+        return found
+
+    def has_near(self, key: int, distance: int, exclude_self: bool = False) -> bool:
+        """
+        Check whether the word occurs at most some distance from a key.
+
+        Args:
+            key: Occurrence key to look around
+            distance: Largest allowed difference in word positions
+            exclude_self: Whether an occurrence at the key itself does not count
+
+        Returns:
+            True if the word occurs within the distance
+        """
+        return _has_key_near(self.keys, key, distance, exclude_self)
+
+
+class _MappedPostings(_Postings):
+    """
+    Postings decoded from a search file.
+
+    The verses are decoded up front, since every query needs them; the
+    occurrence keys are decoded the first time a phrase or NEAR clause
+    asks for all of them. While every position fits in one byte, which
+    is the case unless a verse has more than 127 words, the positions of
+    a single verse are read straight out of the encoded postings instead.
+    """
+
+    __slots__ = ("_counts", "_encoded_positions", "_one_byte_positions")
+
+    def __init__(self, encoded_verses: bytes, encoded_positions: bytes):
+        values = _decode_varints(encoded_verses)
+        self._counts = values[1::2]
+        super().__init__(
+            array("I", accumulate(values[0::2])),
+            array("I", accumulate(self._counts, initial=0)),
+        )
+        self.keys = None
+        self._encoded_positions = encoded_positions
+        self._one_byte_positions = encoded_positions.isascii()
+
+    def _decode_keys(self) -> None:
+        """
+        Decode the occurrence keys, if they have not been already.
+        """
+        if self.keys is None:
+            # Repeat each verse's key base once per occurrence in the verse
+            bases = map(lshift, self.ordinals, repeat(_POSITION_BITS))
+            self.keys = array("I", map(
+                or_,
+                chain.from_iterable(map(repeat, bases, self._counts)),
+                _decode_varints(self._encoded_positions),
+            ))
+
+    def keys_within(self, spans: List[Tuple[int, int]]) -> List[int]:
+        self._decode_keys()
+        return super().keys_within(spans)
+
+    def has_near(self, key: int, distance: int, exclude_self: bool = False) -> bool:
+        if self.keys is not None or not self._one_byte_positions:
+            self._decode_keys()
+            return super().has_near(key, distance, exclude_self)
+        i = self.find(key >> _POSITION_BITS)
+        if i < 0:
+            return False
+        position = key & 0xFFFF
+        return any(
+            abs(other - position) <= distance and not (exclude_self and other == position)
+            for other in self._encoded_positions[self.offsets[i]:self.offsets[i + 1]]
+        )
+
+
+def _encode_varints(values: Iterable[int], out: bytearray) -> None:
+    """
+    Append integers to a buffer as LEB128 varints, seven bits per byte.
+
+    Args:
+        values: Non-negative integers
+        out: Buffer to append to
+    """
+    for value in values:
+        while value >= 0x80:
+            out.append(value & 0x7F | 0x80)
+            value >>= 7
+        out.append(value)
+
+
+def _decode_varints(data: bytes) -> List[int]:
+    """
+    Decode a run of LEB128 varints.
+
+    Args:
+        data: Encoded varints
+
+    Returns:
+        The decoded integers
+    """
+    if data.isascii():
+        # Every value fits in one byte
+        return list(data)
+    values = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    return values
+
+
+def _cast(view: memoryview, fmt: str):
+    """
+    Read a little-endian array out of a mapped file.
+
+    Args:
+        view: Bytes of the array
+        fmt: Array type code ("I" or "f")
+
+    Returns:
+        A zero-copy view, or a byte-swapped copy on big-endian machines
+    """
+    if sys.byteorder == "little":
+        return view.cast(fmt)
+    values = array(fmt, view.tobytes())
+    values.byteswap()
+    return values
+
+
+def _concordance(
+    occurrences: int,
+    verses: int,
+    books: Dict[str, int],
+    ordinals: List[int]
+) -> Dict:
+    """
+    Assemble a word's concordance, totalling its occurrences per testament.
+
+    Args:
+        occurrences: Number of times the word occurs
+        verses: Number of verses containing it
+        books: Occurrences per book ID, in canonical order
+        ordinals: Ordinals of its first verses
+
+    Returns:
+        Concordance dictionary (see SearchIndex.concordance)
+    """
+    testaments = {OLD_TESTAMENT: 0, NEW_TESTAMENT: 0}
+    for book_id, count in books.items():
+        testaments[BOOKS[book_id].testament] += count
+    return {
+        "occurrences": occurrences,
+        "verses": verses,
+        "books": books,
+        "testaments": testaments,
+        "ordinals": ordinals,
+    }
+
+
+def _has_key_near(keys: List[int], key: int, distance: int, exclude_self: bool = False) -> bool:
+    """
+    Check whether sorted keys hold one at most some distance from a key.
+
+    Args:
+        keys: Sorted occurrence keys
+        key: Key to look around
+        distance: Largest allowed difference
+        exclude_self: Whether the key itself does not count
+
+    Returns:
+        True if a key lies within the distance
+    """
+    i = bisect_left(keys, key - distance)
+    if i < len(keys) and exclude_self and keys[i] == key:
+        i += 1
+    return i < len(keys) and keys[i] <= key + distance
+
+
+class SearchIndex:
+    """
+    BM25-ranked positional inverted index over one translation's verses.
+    """
+
+    # BM25 term frequency saturation and length normalization
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, verses: Iterable[Tuple[int, str]]):
+        """
+        Index a translation's verses.
+
+        Args:
+            verses: (ordinal, text) pairs in ordinal order
+        """
+        postings: Dict[str, _Postings] = {}
+        lengths = array("H", bytes(2 * TOTAL_VERSES))
+        for ordinal, text in verses:
+            words = tokenize(text)[:_MAX_POSITION + 1]
+            lengths[ordinal] = len(words)
+            base = ordinal << _POSITION_BITS
+            occurrences: Dict[str, List[int]] = {}
+            for position, word in enumerate(words):
+                occurrences.setdefault(word, []).append(base | position)
+            for word, keys in occurrences.items():
+                entry = postings.get(word)
+                if entry is None:
+                    entry = postings[word] = _Postings()
+                entry.ordinals.append(ordinal)
+                entry.keys.extend(keys)
+                entry.offsets.append(len(entry.keys))
+        self._postings = postings
+
+        self.verse_count = sum(1 for length in lengths if length)
+        average = sum(lengths) / self.verse_count if self.verse_count else 1.0
+        # Length normalization of each verse, precomputed for scoring
+        self._norms = array("f", (
+            self.K1 * (1 - self.B + self.B * length / average) for length in lengths
+        ))
+        # Built the first time a word needs correcting
+        self._trigram_index: Optional[Dict[str, List[str]]] = None
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._postings
+
+    def _lookup(self, word: str) -> Optional[_Postings]:
+        """
+        Get a word's postings.
+
+        Args:
+            word: Indexed word
+
+        Returns:
+            The word's postings, or None if no verse contains it
+        """
+        return self._postings.get(word)
+
+    def _build_trigram_index(self) -> Dict[str, List[str]]:
+        """
+        Map each trigram to the indexed words containing it.
+
+        Returns:
+            Dictionary of trigram to words, each list sorted by UTF-8 bytes
+        """
+        index: Dict[str, List[str]] = {}
+        for word in sorted(self._postings, key=lambda word: word.encode("utf-8")):
+            for trigram in trigrams(word):
+                index.setdefault(trigram, []).append(word)
+        return index
+
+    def _words_with_trigram(self, trigram: str) -> List[str]:
+        """
+        Get the indexed words containing a trigram.
+
+        Args:
+            trigram: Trigram (see trigrams)
+
+        Returns:
+            List of words
+        """
+        if self._trigram_index is None:
+            self._trigram_index = self._build_trigram_index()
+        return self._trigram_index.get(trigram, [])
+
+    def correct(self, word: str) -> List[str]:
+        """
+        Find the indexed words a misspelled word could have meant.
+
+        Candidates are the words sharing enough trigrams with it to be
+        within the allowed edit distance, since one edit changes at most
+        three trigrams; the vocabulary is never scanned.
+
+        Args:
+            word: Query word
+
+        Returns:
+            Up to MAX_CORRECTIONS words within one edit (two for words of
+            8 or more letters), closest and then most common first; empty
+            for short words and numbers
+        """
+        if len(word) < _MIN_CORRECTED_LENGTH or word.isdigit():
+            return []
+        limit = 2 if len(word) >= _TWO_EDIT_LENGTH else 1
+        word_trigrams = trigrams(word)
+        shared: Dict[str, int] = {}
+        for trigram in word_trigrams:
+            for candidate in self._words_with_trigram(trigram):
+                shared[candidate] = shared.get(candidate, 0) + 1
+
+        needed = max(1, len(word_trigrams) - 3 * limit)
+        matches = []
+        for candidate, count in shared.items():
+            if count < needed or candidate == word:
+                continue
+            distance = edit_distance(word, candidate, limit)
+            if distance <= limit:
+                matches.append((distance, -len(self._lookup(candidate)), candidate))
+        return [candidate for _, _, candidate in sorted(matches)[:MAX_CORRECTIONS]]
+
+    def concordance(self, word: str) -> Optional[Dict]:
+        """
+        Count a word's occurrences by book and testament.
+
+        Args:
+            word: Indexed word
+
+        Returns:
+            Dictionary with the word's "occurrences", the number of "verses"
+            containing it, its occurrences per book ID ("books", in
+            canonical order, leaving out books without it) and per
+            testament ("testaments"), and the "ordinals" of the first
+            CONCORDANCE_REFERENCES verses containing it; None if no verse
+            contains it
+        """
+        entry = self._lookup(word)
+        if entry is None:
+            return None
+        books = {}
+        for book_id in BOOK_IDS:
+            start, stop = book_ordinal_range(book_id)
+            low = bisect_left(entry.ordinals, start)
+            high = bisect_left(entry.ordinals, stop, low)
+            if high > low:
+                books[book_id] = entry.offsets[high] - entry.offsets[low]
+        return _concordance(
+            entry.occurrences(), len(entry), books, list(entry.ordinals[:CONCORDANCE_REFERENCES])
+        )
+
+    def corrections(self, query: str) -> Dict[str, List[str]]:
+        """
+        Get the corrections a search makes for a query's misspelled words.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Dictionary mapping each query word missing from the index to
+            its corrections, empty if none were found
+        """
+        phrases, nears, words = parse_query(query)
+        query_words = set(words)
+        query_words.update(word for phrase in phrases for word in phrase)
+        query_words.update(word for left, right, _ in nears for word in (left, right))
+        corrections = {}
+        for word in query_words:
+            if word not in self:
+                corrected = self.correct(word)
+                if corrected:
+                    corrections[word] = corrected
+        return corrections
+
+    def close(self) -> None:
+        """
+        Release the index's resources.
+        """
+
+    def _weight(self, entry: _Postings) -> float:
+        """
+        Get a word's BM25 inverse document frequency weight.
+        """
+        frequency = len(entry)
+        idf = math.log(1 + (self.verse_count - frequency + 0.5) / (frequency + 0.5))
+        return idf * (self.K1 + 1)
+
+    def _phrase_matches(
+        self,
+        phrase: List[str],
+        entries: Dict[str, Optional[_Postings]],
+        spans: List[Tuple[int, int]]
+    ) -> Set[int]:
+        """
+        Find the verses containing a phrase.
+
+        Candidate phrase starts come from the rarest word's occurrences and
+        are narrowed by each other word in turn: by looking up each
+        candidate while there are few, by set intersection once there are
+        many.
+
+        Args:
+            phrase: Words of the phrase, in order
+            entries: Postings of the query's words
+            spans: Half-open ordinal ranges to search within
+
+        Returns:
+            Set of matching verse ordinals
+        """
+        if not all(entries[word] for word in phrase):
+            return set()
+        order = sorted(range(len(phrase)), key=lambda i: entries[phrase[i]].occurrences())
+
+        rarest = order[0]
+        starts = {key - rarest for key in entries[phrase[rarest]].keys_within(spans)}
+        for i in order[1:]:
+            if not starts:
+                break
+            entry = entries[phrase[i]]
+            if len(starts) * 8 < entry.occurrences():
+                starts = {start for start in starts if entry.has_near(start + i, 0)}
+            else:
+                starts.intersection_update(map((-i).__add__, entry.keys_within(spans)))
+        return {start >> _POSITION_BITS for start in starts}
+
+    def _near_matches(
+        self,
+        left: str,
+        right: str,
+        distance: int,
+        entries: Dict[str, Optional[_Postings]],
+        spans: List[Tuple[int, int]]
+    ) -> Set[int]:
+        """
+        Find the verses with two words at most some distance apart, in either order.
+
+        Args:
+            left: First word
+            right: Second word
+            distance: Largest allowed difference in word positions
+            entries: Postings of the query's words
+            spans: Half-open ordinal ranges to search within
+
+        Returns:
+            Set of matching verse ordinals
+        """
+        if not (entries[left] and entries[right]):
+            return set()
+        distance = min(distance, _MAX_POSITION)
+        rarer, other = sorted((entries[left], entries[right]), key=_Postings.occurrences)
+        keys = rarer.keys_within(spans)
+        if len(keys) * 8 < other.occurrences():
+            return {
+                key >> _POSITION_BITS for key in keys
+                if other.has_near(key, distance, exclude_self=left == right)
+            }
+        other_keys = other.keys_within(spans)
+        return {
+            key >> _POSITION_BITS for key in keys
+            if _has_key_near(other_keys, key, distance, exclude_self=left == right)
+        }
+
+    def search(
+        self,
+        query: str,
+        ranges: Optional[Iterable[Tuple[int, int]]] = None,
+        limit: int = 10
+    ) -> Tuple[List[Tuple[int, float]], Dict[str, List[str]]]:
+        """
+        Find the verses best matching a query.
+
+        Args:
+            query: Words, quoted phrases and NEAR/k clauses to search for;
+                misspelled words are corrected (see correct)
+            ranges: Optional half-open ordinal ranges to search within
+            limit: Maximum number of hits
+
+        Returns:
+            Tuple of the (ordinal, score) hits, best first with equal
+            scores in canonical order, and the corrections made (see
+            corrections)
+        """
+        spans = list(ranges) if ranges is not None else [(0, TOTAL_VERSES)]
+        phrases, nears, words = parse_query(query)
+
+        # Misspelled words in clauses take their closest correction, and
+        # loose ones all of them
+        corrections = self.corrections(query)
+
+        def closest(word: str) -> str:
+            return corrections[word][0] if word in corrections else word
+
+        phrases = [[closest(word) for word in phrase] for phrase in phrases]
+        nears = [(closest(left), closest(right), distance) for left, right, distance in nears]
+        words = [term for word in words for term in corrections.get(word, [word])]
+
+        terms = set(words)
+        terms.update(word for phrase in phrases for word in phrase)
+        terms.update(word for left, right, _ in nears for word in (left, right))
+        entries = {word: self._lookup(word) for word in terms}
+
+        # Verses matching every phrase and NEAR clause, if there are any
+        required: Optional[Set[int]] = None
+        for matches in (
+            *(self._phrase_matches(phrase, entries, spans) for phrase in phrases),
+            *(
+                self._near_matches(left, right, distance, entries, spans)
+                for left, right, distance in nears
+            ),
+        ):
+            required = matches if required is None else required & matches
+            if not required:
+                return [], corrections
+
+        norms = self._norms
+        scores: Dict[int, float] = {}
+        # In a fixed order, so equal scores add up the same every time
+        for word in sorted(entries):
+            entry = entries[word]
+            if entry is None:
+                continue
+            weight = self._weight(entry)
+            offsets = entry.offsets
+            if required is not None:
+                # Only score the verses that can match
+                for ordinal in required:
+                    i = entry.find(ordinal)
+                    if i >= 0:
+                        count = offsets[i + 1] - offsets[i]
+                        scores[ordinal] = scores.get(ordinal, 0.0) + weight * count / (count + norms[ordinal])
+                continue
+            for start, stop in spans:
+                low = bisect_left(entry.ordinals, start)
+                high = bisect_left(entry.ordinals, stop, low)
+                for i in range(low, high):
+                    ordinal = entry.ordinals[i]
+                    count = offsets[i + 1] - offsets[i]
+                    scores[ordinal] = scores.get(ordinal, 0.0) + weight * count / (count + norms[ordinal])
+        hits = heapq.nlargest(limit, scores.items(), key=lambda hit: (hit[1], -hit[0]))
+        return hits, corrections
+
+
+def write_search_index(path: str, verses: Iterable[Tuple[int, str]]) -> None:
+    """
+    Index a translation's verses and write them as a search file for
+    MappedSearchIndex.
+
+    The file holds, after the header, four-byte aligned sections:
+    the float32 length normalization of every verse, the byte offset
+    of every term in the term blob, two offsets per term into the
+    postings blob (its verses, then its positions), the byte offset
+    of every trigram in the trigram blob and of its term numbers in
+    the trigram postings blob, the byte offset of every term's
+    concordance in the concordance blob, the sorted UTF-8 terms, the
+    sorted UTF-8 trigrams, the trigram postings, the concordances and
+    the postings.
+
+    A term's verses are (ordinal gap, count) varint pairs, followed
+    by the position of each occurrence within its verse as a varint;
+    few verses are long enough for a position to take more than one
+    byte. A trigram's postings are the gaps between the numbers of the
+    terms containing it, in sorted term order, as varints. A term's
+    concordance is its occurrence and verse counts, the number of
+    books it is in, a (book number, occurrences) pair for each, and
+    the ordinal gaps between its first verses, all as varints.
+
+    Args:
+        path: File to write
+        verses: (ordinal, text) pairs in ordinal order
+    """
+    index = SearchIndex(verses)
+    terms = sorted(index._postings, key=lambda word: word.encode("utf-8"))
+    term_offsets = array("I", [0])
+    posting_offsets = array("I", [0])
+    concordance_offsets = array("I", [0])
+    term_blob = bytearray()
+    postings_blob = bytearray()
+    concordance_blob = bytearray()
+    book_numbers = {book_id: number for number, book_id in enumerate(BOOK_IDS)}
+    for word in terms:
+        entry = index._postings[word]
+        term_blob += word.encode("utf-8")
+        term_offsets.append(len(term_blob))
+        counts = (entry.offsets[i + 1] - entry.offsets[i] for i in range(len(entry)))
+        gaps = (b - a for a, b in zip((0, *entry.ordinals), entry.ordinals))
+        _encode_varints((value for pair in zip(gaps, counts) for value in pair), postings_blob)
+        posting_offsets.append(len(postings_blob))
+        _encode_varints((key & 0xFFFF for key in entry.keys), postings_blob)
+        posting_offsets.append(len(postings_blob))
+
+        concordance = index.concordance(word)
+        books = concordance["books"]
+        ordinals = concordance["ordinals"]
+        _encode_varints((
+            concordance["occurrences"], concordance["verses"], len(books),
+            *(value for book_id, count in books.items() for value in (book_numbers[book_id], count)),
+            *(b - a for a, b in zip((0, *ordinals), ordinals)),
+        ), concordance_blob)
+        concordance_offsets.append(len(concordance_blob))
+
+    numbers = {word: number for number, word in enumerate(terms)}
+    trigram_index = index._build_trigram_index()
+    trigram_offsets = array("I", [0])
+    trigram_posting_offsets = array("I", [0])
+    trigram_blob = bytearray()
+    trigram_postings_blob = bytearray()
+    for trigram in sorted(trigram_index, key=lambda trigram: trigram.encode("utf-8")):
+        trigram_blob += trigram.encode("utf-8")
+        trigram_offsets.append(len(trigram_blob))
+        term_numbers = [numbers[word] for word in trigram_index[trigram]]
+        _encode_varints((b - a for a, b in zip((0, *term_numbers), term_numbers)), trigram_postings_blob)
+        trigram_posting_offsets.append(len(trigram_postings_blob))
+    for blob in (term_blob, trigram_blob, trigram_postings_blob, concordance_blob):
+        blob += bytes(-len(blob) % 4)
+
+    sections = [
+        index._norms, term_offsets, posting_offsets,
+        trigram_offsets, trigram_posting_offsets, concordance_offsets,
+    ]
+    if sys.byteorder != "little":
+        sections = [array(section.typecode, section) for section in sections]
+        for section in sections:
+            section.byteswap()
+    with open(path, "wb") as f:
+        f.write(_SEARCH_HEADER.pack(
+            _SEARCH_MAGIC, TOTAL_VERSES, len(terms), index.verse_count, len(trigram_index)
+        ))
+        for section in sections:
+            f.write(section.tobytes())
+        for blob in (term_blob, trigram_blob, trigram_postings_blob, concordance_blob, postings_blob):
+            f.write(blob)
+
+
+class MappedSearchIndex(SearchIndex):
+    """
+    Read-only search index memory-mapped from a file written by write_search_index.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a search file.
+
+        Args:
+            path: File written by write_search_index
+
+        Raises:
+            ValueError: If the file has an unexpected format
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _SEARCH_HEADER.size:
+                raise ValueError(f"Unsupported search index format: {path}")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, ordinal_count, term_count, self.verse_count, trigram_count = \
+            _SEARCH_HEADER.unpack_from(self._map)
+        if magic != _SEARCH_MAGIC or ordinal_count != TOTAL_VERSES:
+            self._map.close()
+            raise ValueError(f"Unsupported search index format: {path}")
+
+        view = memoryview(self._map)
+        self._views = []
+        position = _SEARCH_HEADER.size
+        for attribute, fmt, count in (
+            ("_norms", "f", TOTAL_VERSES),
+            ("_term_offsets", "I", term_count + 1),
+            ("_posting_offsets", "I", 2 * term_count + 1),
+            ("_trigram_offsets", "I", trigram_count + 1),
+            ("_trigram_posting_offsets", "I", trigram_count + 1),
+            ("_concordance_offsets", "I", term_count + 1),
+        ):
+            section = view[position:position + 4 * count]
+            self._views.append(section)
+            setattr(self, attribute, _cast(section, fmt))
+            position += 4 * count
+        for attribute, size in (
+            ("_terms", self._term_offsets[term_count]),
+            ("_trigrams", self._trigram_offsets[trigram_count]),
+            ("_trigram_postings", self._trigram_posting_offsets[trigram_count]),
+            ("_concordances", self._concordance_offsets[term_count]),
+        ):
+            setattr(self, attribute, view[position:position + size])
+            self._views.append(getattr(self, attribute))
+            position += size + -size % 4
+        self._postings_blob = view[position:]
+        self._views += [self._postings_blob, view]
+        self._term_count = term_count
+        self._trigram_count = trigram_count
+
+    def __len__(self) -> int:
+        return self._term_count
+
+    def __contains__(self, word: str) -> bool:
+        return self._find_term(word) >= 0
+
+    @staticmethod
+    def _find(blob: memoryview, offsets, count: int, key: str) -> int:
+        """
+        Find a string in a sorted blob of UTF-8 strings.
+
+        Args:
+            blob: Concatenated strings, sorted by their UTF-8 bytes
+            offsets: Byte offset of each string, and of the end of the blob
+            count: Number of strings
+            key: String to find
+
+        Returns:
+            The string's number, or -1 if it is not in the blob
+        """
+        encoded = key.encode("utf-8")
+        i = bisect_left(range(count), encoded, key=lambda i: bytes(blob[offsets[i]:offsets[i + 1]]))
+        if i < count and blob[offsets[i]:offsets[i + 1]] == encoded:
+            return i
+        return -1
+
+    def _find_term(self, word: str) -> int:
+        """
+        Get a word's number in the sorted term dictionary, or -1 if it is not indexed.
+        """
+        return self._find(self._terms, self._term_offsets, self._term_count, word)
+
+    def _lookup(self, word: str) -> Optional[_Postings]:
+        i = self._find_term(word)
+        if i < 0:
+            return None
+        offsets = self._posting_offsets
+        # Copy the encoded postings out, so no view outlives the mapping
+        return _MappedPostings(
+            bytes(self._postings_blob[offsets[2 * i]:offsets[2 * i + 1]]),
+            bytes(self._postings_blob[offsets[2 * i + 1]:offsets[2 * i + 2]]),
+        )
+
+    def _words_with_trigram(self, trigram: str) -> List[str]:
+        i = self._find(self._trigrams, self._trigram_offsets, self._trigram_count, trigram)
+        if i < 0:
+            return []
+        offsets = self._trigram_posting_offsets
+        numbers = accumulate(_decode_varints(bytes(self._trigram_postings[offsets[i]:offsets[i + 1]])))
+        terms, term_offsets = self._terms, self._term_offsets
+        return [str(terms[term_offsets[n]:term_offsets[n + 1]], "utf-8") for n in numbers]
+
+    def concordance(self, word: str) -> Optional[Dict]:
+        i = self._find_term(word)
+        if i < 0:
+            return None
+        offsets = self._concordance_offsets
+        values = _decode_varints(bytes(self._concordances[offsets[i]:offsets[i + 1]]))
+        book_count = values[2]
+        pairs = values[3:3 + 2 * book_count]
+        books = {BOOK_IDS[number]: count for number, count in zip(pairs[0::2], pairs[1::2])}
+        ordinals = list(accumulate(values[3 + 2 * book_count:]))
+        return _concordance(values[0], values[1], books, ordinals)
+
+    def close(self) -> None:
+        for section in (
+            self._norms, self._term_offsets, self._posting_offsets,
+            self._trigram_offsets, self._trigram_posting_offsets, self._concordance_offsets,
+        ):
+            if isinstance(section, memoryview):
+                section.release()
+        for view in self._views:
+            view.release()
+        self._map.close()
@@ -4,11 +4,12 @@ MCP Server for Bible content using bible-api.com.
 This server provides Bible verses and chapters as resources and tools
 for searching and retrieving Bible content.
 """
-from typing import Dict, List, Optional, Any
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Any
 
 from mcp.server.fastmcp import FastMCP, Context
-import mcp.types as types
-from bible_api import BibleAPIClient
+from bible_api import BibleAPIClient, BibleBackend
 from bible_data import (
     SINGLE_CHAPTER_BOOKS, 
     OLD_TESTAMENT, 
@@ -16,13 +17,109 @@ from bible_data import (
     get_random_reference
 )
 
-# Create a global instance of the Bible API client
-bible_client = BibleAPIClient()
+
+def _env_flag(name: str) -> bool:
+    """
+    Read a boolean flag from the environment.
+    
+    Args:
+        name: Environment variable name
+        
+    Returns:
+        True if the variable is set to "1", "true", "yes" or "on"
+    """
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def create_client() -> BibleBackend:
+    """
+    Create the Bible backend configured from environment variables.
+    
+    Environment variables:
+        BIBLE_MCP_BACKEND: "http" (default) for bible-api.com or "local" for an offline corpus
+        BIBLE_MCP_CORPUS_DIR: Directory holding the local corpus
+        BIBLE_MCP_CACHE_PATH: Path to a SQLite file for a persistent verse cache
+        BIBLE_MCP_CACHE_MAX_ENTRIES: Maximum number of entries in that cache
+        BIBLE_MCP_CHAPTER_MODE: Fetch whole chapters and slice verses from them
+        
+    Returns:
+        A configured Bible backend
+        
+    Raises:
+        ValueError: If the backend name is unknown or the local corpus is not configured
+    """
+    # The local backend and the persistent cache are imported only when
+    # configured, to keep server startup fast
+    backend = os.environ.get("BIBLE_MCP_BACKEND", "http").strip().lower()
+    if backend == "local":
+        from bible_local import LocalBibleClient
+        
+        corpus_dir = os.environ.get("BIBLE_MCP_CORPUS_DIR")
+        if not corpus_dir:
+            raise ValueError("BIBLE_MCP_CORPUS_DIR must be set to use the local backend")
+        return LocalBibleClient(os.path.expanduser(corpus_dir))
+    if backend != "http":
+        raise ValueError(f"Unknown backend: {backend}. Must be 'http' or 'local'.")
+    
+    persistent_cache = None
+    cache_path = os.environ.get("BIBLE_MCP_CACHE_PATH")
+    if cache_path:
+        from bible_cache import SQLiteCache
+        
+        max_entries = int(os.environ.get("BIBLE_MCP_CACHE_MAX_ENTRIES", "50000"))
+        persistent_cache = SQLiteCache(os.path.expanduser(cache_path), max_entries=max_entries)
+    
+    return BibleAPIClient(
+        persistent_cache=persistent_cache,
+        chapter_mode=_env_flag("BIBLE_MCP_CHAPTER_MODE"),
+    )
+
+
+# Largest number of verses the get_random_verses tool returns at once
+MAX_RANDOM_VERSES = 100
+
+# Largest number of hits the search_verses tool returns at once
+MAX_SEARCH_RESULTS = 100
+
+# Largest number of references the concordance tool returns at once
+MAX_CONCORDANCE_REFERENCES = 50
+
+# Create a global instance of the configured Bible backend
+bible_client = create_client()
+
+# Number of running lifespans sharing the backend; the SSE and HTTP
+# transports run one per session
+_active_lifespans = 0
+
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """
+    Open the Bible backend's resources while any session is running.
+    
+    The backend is shared by every session, so it is opened when the first
+    lifespan starts and closed only when the last one ends.
+    
+    Args:
+        server: The FastMCP server instance
+    """
+    global _active_lifespans
+    if _active_lifespans == 0:
+        await bible_client.open()
+    _active_lifespans += 1
+    try:
+        yield
+    finally:
+        _active_lifespans -= 1
+        if _active_lifespans == 0:
+            await bible_client.aclose()
+
 
 # Create the MCP server
 mcp = FastMCP(
     "Bible MCP",
     dependencies=["httpx"],
+    lifespan=server_lifespan,
 )
 
 
@@ -142,10 +239,32 @@ async def get_verse_by_reference(reference: str, translation: Optional[str] = "w
         return f"Error: {str(e)}"
 
 
+@mcp.tool()
+async def get_passages(references: List[str], translation: Optional[str] = "web") -> str:
+    """
+    Get several passages in one call, fetching shared verses only once.
+    
+    Args:
+        references: Bible references (e.g., ["John 3:1-10", "John 3:16", "Rom 5:8"])
+        translation: Translation ID (default: "web")
+        
+    Returns:
+        Formatted string containing each passage
+    """
+    try:
+        passages = await bible_client.get_passages(references, translation)
+        return "\n\n".join(format_verse(data) for data in passages)
+    except ValueError as e:
+        return f"Error: {str(e)}"
+    except Exception as e:
+        return f"Error: {str(e)}"
+
+
 @mcp.tool()
 async def get_random_verse_tool(
     translation: str = "web", 
-    testament: Optional[str] = None
+    testament: Optional[str] = None,
+    seed: Optional[int] = None
 ) -> str:
     """
     Get a random verse from the Bible.
@@ -153,6 +272,7 @@ async def get_random_verse_tool(
     Args:
         translation: Translation ID (default: "web")
         testament: Optional filter for "OT" (Old Testament) or "NT" (New Testament)
+        seed: Optional seed to get the same verse again
         
     Returns:
         Formatted string containing a random verse
@@ -163,7 +283,9 @@ async def get_random_verse_tool(
             return f"Error: Invalid testament: {testament}. Must be 'OT', 'NT', or None."
         
         # Get a random verse using the API client's improved method
-        data = await bible_client.get_random_verse(translation_id=translation, testament=testament)
+        data = await bible_client.get_random_verse(
+            translation_id=translation, testament=testament, seed=seed
+        )
         return format_verse(data)
     except ValueError as e:
         return f"Error: {str(e)}"
@@ -171,6 +293,108 @@ async def get_random_verse_tool(
         return f"Error: {str(e)}"
 
 
+@mcp.tool()
+async def get_random_verses(
+    count: int = 10,
+    testament: Optional[str] = None,
+    translation: str = "web",
+    seed: Optional[int] = None
+) -> str:
+    """
+    Get several distinct random verses from the Bible in one call.
+    
+    Args:
+        count: Number of verses (default: 10, at most 100)
+        testament: Optional filter for "OT" (Old Testament) or "NT" (New Testament)
+        translation: Translation ID (default: "web")
+        seed: Optional seed to get the same verses again
+        
+    Returns:
+        Formatted string containing the random verses
+    """
+    try:
+        if not 1 <= count <= MAX_RANDOM_VERSES:
+            return f"Error: Invalid count: {count}. Must be between 1 and {MAX_RANDOM_VERSES}."
+        if testament and testament not in (OLD_TESTAMENT, NEW_TESTAMENT):
+            return f"Error: Invalid testament: {testament}. Must be 'OT', 'NT', or None."
+        
+        verses = await bible_client.get_random_verses(
+            count, translation_id=translation, testament=testament, seed=seed
+        )
+        if not verses:
+            return "Error: No verses found"
+        return "\n\n".join(format_verse(data) for data in verses)
+    except ValueError as e:
+        return f"Error: {str(e)}"
+    except Exception as e:
+        return f"Error: {str(e)}"
+
+
+@mcp.tool()
+async def search_verses(
+    query: str,
+    translation: str = "web",
+    testament: Optional[str] = None,
+    limit: int = 10,
+    book: Optional[str] = None
+) -> str:
+    """
+    Search the Bible's text for verses matching some words, best match first.
+    
+    Args:
+        query: Words to search for (e.g., "love your enemies"); quote a phrase
+            to require it ('"in the beginning"'), or use NEAR/k to require two
+            words at most k words apart ("faith NEAR/3 hope"); misspelled
+            words are matched to the closest indexed words
+        translation: Translation ID (default: "web")
+        testament: Optional filter for "OT" (Old Testament) or "NT" (New Testament)
+        limit: Maximum number of verses (default: 10, at most 100)
+        book: Optional book to search within (e.g., "Psalms", "JHN")
+        
+    Returns:
+        Formatted string containing the matching verses
+    """
+    try:
+        if not 1 <= limit <= MAX_SEARCH_RESULTS:
+            return f"Error: Invalid limit: {limit}. Must be between 1 and {MAX_SEARCH_RESULTS}."
+        if testament and testament not in (OLD_TESTAMENT, NEW_TESTAMENT):
+            return f"Error: Invalid testament: {testament}. Must be 'OT', 'NT', or None."
+        
+        data = await bible_client.search_verses(
+            query, translation, testament=testament, limit=limit, book=book
+        )
+        return format_search_results(data)
+    except ValueError as e:
+        return f"Error: {str(e)}"
+    except Exception as e:
+        return f"Error: {str(e)}"
+
+
+@mcp.tool()
+async def concordance(word: str, translation: str = "web", limit: int = 10) -> str:
+    """
+    Count where a word occurs in the Bible, by testament and book.
+    
+    Args:
+        word: Word to look up (e.g., "grace")
+        translation: Translation ID (default: "web")
+        limit: Number of references to list, in canonical order (default: 10, at most 50)
+        
+    Returns:
+        Formatted string with the word's counts and first references
+    """
+    try:
+        if not 1 <= limit <= MAX_CONCORDANCE_REFERENCES:
+            return f"Error: Invalid limit: {limit}. Must be between 1 and {MAX_CONCORDANCE_REFERENCES}."
+        
+        data = await bible_client.concordance(word, translation, limit=limit)
+        return format_concordance(data)
+    except ValueError as e:
+        return f"Error: {str(e)}"
+    except Exception as e:
+        return f"Error: {str(e)}"
+
+
 @mcp.tool()
 async def list_available_translations() -> str:
     """
@@ -264,6 +488,71 @@ def format_verse(data: Dict) -> str:
     return result
 
 
+def format_search_results(data: Dict) -> str:
+    """
+    Format search results into a readable string.
+    
+    Args:
+        data: Search results from the Bible backend
+        
+    Returns:
+        Formatted string with one line per matching verse
+    """
+    query = data.get('query', '')
+    verses = data.get('verses', [])
+    if not verses:
+        return f"No verses found for: {query}"
+    
+    translation = data.get('translation_name', 'Unknown translation')
+    header = f"🔎 {query}\n📝 {translation}\n"
+    corrections = data.get('corrections') or {}
+    if corrections:
+        header += "✏️ Also searched for: " + "; ".join(
+            f"{', '.join(words)} (for {word})" for word, words in sorted(corrections.items())
+        ) + "\n"
+    lines = [
+        f"{v.get('book_name', v.get('book_id'))} {v.get('chapter')}:{v.get('verse')} - {v.get('text', '').strip()}"
+        for v in verses
+    ]
+    return header + "\n" + "\n\n".join(lines)
+
+
+def format_concordance(data: Dict) -> str:
+    """
+    Format a word's concordance into a readable string.
+    
+    Args:
+        data: Concordance from the Bible backend
+        
+    Returns:
+        Formatted string with the word's counts by testament and book,
+        followed by its first references
+    """
+    word = data.get('word', '')
+    if not data.get('occurrences'):
+        result = f"No occurrences of: {word}"
+        suggestions = data.get('suggestions') or []
+        if suggestions:
+            result += f"\nDid you mean: {', '.join(suggestions)}?"
+        return result
+    
+    translation = data.get('translation_name', 'Unknown translation')
+    testaments = data.get('testaments', {})
+    result = f"📚 {word}\n📝 {translation}\n\n"
+    result += f"{data['occurrences']} occurrences in {data.get('verses', 0)} verses "
+    result += f"(Old Testament: {testaments.get(OLD_TESTAMENT, 0)}, New Testament: {testaments.get(NEW_TESTAMENT, 0)})\n\n"
+    result += "By book:\n" + "\n".join(
+        f"- {b.get('book_name', b.get('book_id'))}: {b.get('count')}" for b in data.get('books', [])
+    )
+    references = data.get('references', [])
+    if references:
+        result += f"\n\nFirst {len(references)} references:\n" + "\n".join(
+            f"{r.get('book_name', r.get('book_id'))} {r.get('chapter')}:{r.get('verse')} - {r.get('text', '').strip()}"
+            for r in references
+        )
+    return result
+
+
 def format_chapter(data: Dict) -> str:
     """
     Format chapter data into a readable string.
@@ -0,0 +1,274 @@
+"""
+Compact memory-mapped verse store for local translations.
+
+Each translation is stored as three files in a corpus directory:
+
+- "<translation>.txt": every verse's UTF-8 text concatenated in canonical
+  order, with no separators
+- "<translation>.idx": a 16-byte header followed by a fixed-width array of
+  TOTAL_VERSES + 1 little-endian uint32 byte offsets into the text blob,
+  indexed by global verse ordinal
+- "<translation>.meta.json": translation name and language
+- "<translation>.search": the translation's full-text search index (see
+  bible_search), opened by the local backend when the translation is
+  first searched
+
+Both data files are opened with mmap, so a verse or any contiguous range
+of verses is a zero-copy slice, opening a translation costs a few
+milliseconds, and the pages are shared by every process that maps them.
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from bible_data import TOTAL_VERSES, verse_to_ordinal
+from bible_search import write_search_index
+
+# Index file header: magic, verse count, reserved
+_INDEX_MAGIC = b"BIBLIDX1"
+_INDEX_HEADER = struct.Struct("<8sII")
+
+
+def store_exists(directory: str, translation_id: str) -> bool:
+    """
+    Check whether a compiled store exists for a translation.
+
+    Args:
+        directory: Corpus directory
+        translation_id: Translation ID (e.g., "web")
+
+    Returns:
+        True if both the text and index files are present
+    """
+    base = os.path.join(directory, translation_id)
+    return os.path.exists(base + ".txt") and os.path.exists(base + ".idx")
+
+
+def read_metadata(directory: str, translation_id: str) -> Dict:
+    """
+    Read a translation's metadata without opening or compiling its store.
+
+    Translations not compiled yet have their metadata read from their JSON
+    corpus file (see bible_local).
+
+    Args:
+        directory: Corpus directory
+        translation_id: Translation ID (e.g., "web")
+
+    Returns:
+        Dictionary with the translation ID and any name and language
+
+    Raises:
+        ValueError: If the translation is not installed
+    """
+    base = os.path.join(directory, translation_id)
+    metadata = {"translation_id": translation_id}
+    if store_exists(directory, translation_id):
+        if os.path.exists(base + ".meta.json"):
+            with open(base + ".meta.json", encoding="utf-8") as f:
+                metadata.update(json.load(f))
+    elif os.path.exists(base + ".json"):
+        with open(base + ".json", encoding="utf-8") as f:
+            corpus = json.load(f)
+        metadata.update((k, v) for k, v in corpus.items() if k not in ("books", "translation_id"))
+    else:
+        raise ValueError(f"Translation not available offline: {translation_id}")
+    return metadata
+
+
+def write_store(
+    directory: str,
+    translation_id: str,
+    verses: Iterable[Tuple[int, str]],
+    metadata: Optional[Dict] = None
+) -> None:
+    """
+    Write a translation's verses as a compiled store and search index.
+
+    Files are written to temporary names and renamed into place, so readers
+    never see a partially written store.
+
+    Args:
+        directory: Corpus directory (created if missing)
+        translation_id: Translation ID (e.g., "web")
+        verses: (ordinal, text) pairs; missing ordinals are stored as empty
+        metadata: Optional translation metadata (e.g., name and language)
+
+    Raises:
+        ValueError: If an ordinal is out of range
+    """
+    texts: List[bytes] = [b""] * TOTAL_VERSES
+    for ordinal, text in verses:
+        if not 0 <= ordinal < TOTAL_VERSES:
+            raise ValueError(f"Invalid verse ordinal: {ordinal}")
+        texts[ordinal] = text.encode("utf-8")
+
+    offsets = array("I", [0] * (TOTAL_VERSES + 1))
+    position = 0
+    for ordinal, data in enumerate(texts):
+        offsets[ordinal] = position
+        position += len(data)
+    offsets[TOTAL_VERSES] = position
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    os.makedirs(directory, exist_ok=True)
+    base = os.path.join(directory, translation_id)
+
+    with open(base + ".txt.tmp", "wb") as f:
+        f.write(b"".join(texts))
+    with open(base + ".idx.tmp", "wb") as f:
+        f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, TOTAL_VERSES, 0))
+        f.write(offsets.tobytes())
+    meta = {"translation_id": translation_id}
+    meta.update(metadata or {})
+    with open(base + ".meta.json.tmp", "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    write_search_index(
+        base + ".search.tmp",
+        ((ordinal, str(data, "utf-8")) for ordinal, data in enumerate(texts) if data),
+    )
+
+    for suffix in (".txt", ".idx", ".meta.json", ".search"):
+        os.replace(base + suffix + ".tmp", base + suffix)
+
+
+def import_json_corpus(json_path: str, directory: str) -> str:
+    """
+    Compile a JSON corpus file (see bible_local) into a store.
+
+    Args:
+        json_path: Path to a "<translation>.json" corpus file
+        directory: Corpus directory to write the store to
+
+    Returns:
+        The translation ID of the imported corpus
+    """
+    with open(json_path, encoding="utf-8") as f:
+        corpus = json.load(f)
+
+    translation_id = corpus.get("translation_id") or os.path.basename(json_path)[:-len(".json")]
+
+    def iter_verses():
+        for book_id, chapters in corpus.get("books", {}).items():
+            for chapter, chapter_texts in enumerate(chapters, 1):
+                for verse, text in enumerate(chapter_texts, 1):
+                    if text:
+                        yield verse_to_ordinal(book_id, chapter, verse), text
+
+    metadata = {k: v for k, v in corpus.items() if k not in ("books", "translation_id")}
+    write_store(directory, translation_id, iter_verses(), metadata)
+    return translation_id
+
+
+class VerseStore:
+    """
+    Read-only memory-mapped view of one translation's compiled store.
+    """
+
+    def __init__(self, directory: str, translation_id: str):
+        """
+        Open a translation's store.
+
+        Args:
+            directory: Corpus directory
+            translation_id: Translation ID (e.g., "web")
+
+        Raises:
+            ValueError: If the store is missing or has an unexpected format
+        """
+        self.translation_id = translation_id
+        base = os.path.join(directory, translation_id)
+        if not store_exists(directory, translation_id):
+            raise ValueError(f"Translation not available offline: {translation_id}")
+
+        self.metadata = read_metadata(directory, translation_id)
+
+        self._index_map = self._map(base + ".idx")
+        magic, count, _ = _INDEX_HEADER.unpack_from(self._index_map)
+        if magic != _INDEX_MAGIC or count != TOTAL_VERSES:
+            raise ValueError(f"Unsupported verse store format: {base}.idx")
+
+        index_view = memoryview(self._index_map)[_INDEX_HEADER.size:]
+        if sys.byteorder == "little":
+            self._offsets = index_view.cast("I")
+        else:
+            self._offsets = array("I", index_view.tobytes())
+            self._offsets.byteswap()
+
+        self._text_map = self._map(base + ".txt")
+        self._text = memoryview(self._text_map) if self._text_map is not None else memoryview(b"")
+
+    @staticmethod
+    def _map(path: str) -> Optional[mmap.mmap]:
+        """
+        Memory-map a file read-only.
+
+        Args:
+            path: File path
+
+        Returns:
+            The mapping, or None for an empty file (which cannot be mapped)
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return TOTAL_VERSES
+
+    def range_bytes(self, start: int, stop: int) -> memoryview:
+        """
+        Get the concatenated UTF-8 text of a contiguous ordinal range.
+
+        Args:
+            start: First ordinal (inclusive)
+            stop: Last ordinal (exclusive)
+
+        Returns:
+            A zero-copy view into the mapped text blob
+        """
+        return self._text[self._offsets[start]:self._offsets[stop]]
+
+    def get_text(self, ordinal: int) -> str:
+        """
+        Get one verse's text.
+
+        Args:
+            ordinal: Global verse ordinal
+
+        Returns:
+            The verse text, or an empty string if the translation lacks it
+        """
+        return str(self.range_bytes(ordinal, ordinal + 1), "utf-8")
+
+    def get_texts(self, start: int, stop: int) -> List[str]:
+        """
+        Get the texts of a contiguous ordinal range.
+
+        Args:
+            start: First ordinal (inclusive)
+            stop: Last ordinal (exclusive)
+
+        Returns:
+            List of verse texts, empty strings for verses the translation lacks
+        """
+        offsets = self._offsets
+        text = self._text
+        return [str(text[offsets[i]:offsets[i + 1]], "utf-8") for i in range(start, stop)]
+
+    def close(self) -> None:
+        """
+        Release the memory mappings.
+        """
+        self._text.release()
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        for mapping in (self._text_map, self._index_map):
+            if mapping is not None:
+                mapping.close()
@@ -0,0 +1,612 @@
+"""
+Precomputed Bible structure tables.
+
+Generated by generate_bible_tables.py; do not edit by hand.
+"""
+
+# Book IDs, names and testaments in canonical order
+BOOK_IDS = ('GEN', 'EXO', 'LEV', 'NUM', 'DEU', 'JOS', 'JDG', 'RUT', '1SA', '2SA', '1KI', '2KI', '1CH', '2CH', 'EZR', 'NEH', 'EST', 'JOB', 'PSA', 'PRO', 'ECC', 'SNG', 'ISA', 'JER', 'LAM', 'EZK', 'DAN', 'HOS', 'JOL', 'AMO', 'OBAD', 'JON', 'MIC', 'NAM', 'HAB', 'ZEP', 'HAG', 'ZEC', 'MAL', 'MAT', 'MRK', 'LUK', 'JHN', 'ACT', 'ROM', '1CO', '2CO', 'GAL', 'EPH', 'PHP', 'COL', '1TH', '2TH', '1TI', '2TI', 'TIT', 'PHLM', 'HEB', 'JAS', '1PE', '2PE', '1JN', '2JN', '3JN', 'JUD', 'REV')
+BOOK_NAMES = ('Genesis', 'Exodus', 'Leviticus', 'Numbers', 'Deuteronomy', 'Joshua', 'Judges', 'Ruth', '1 Samuel', '2 Samuel', '1 Kings', '2 Kings', '1 Chronicles', '2 Chronicles', 'Ezra', 'Nehemiah', 'Esther', 'Job', 'Psalms', 'Proverbs', 'Ecclesiastes', 'Song of Solomon', 'Isaiah', 'Jeremiah', 'Lamentations', 'Ezekiel', 'Daniel', 'Hosea', 'Joel', 'Amos', 'Obadiah', 'Jonah', 'Micah', 'Nahum', 'Habakkuk', 'Zephaniah', 'Haggai', 'Zechariah', 'Malachi', 'Matthew', 'Mark', 'Luke', 'John', 'Acts', 'Romans', '1 Corinthians', '2 Corinthians', 'Galatians', 'Ephesians', 'Philippians', 'Colossians', '1 Thessalonians', '2 Thessalonians', '1 Timothy', '2 Timothy', 'Titus', 'Philemon', 'Hebrews', 'James', '1 Peter', '2 Peter', '1 John', '2 John', '3 John', 'Jude', 'Revelation')
+BOOK_TESTAMENTS = ('OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'OT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT', 'NT')
+
+# Verses per chapter of each book
+VERSE_COUNTS = (
+    (31, 25, 24, 26, 32, 22, 24, 22, 29, 32, 32, 20, 18, 24, 21, 16, 27, 33, 38, 18, 34, 24, 20, 67, 34, 35, 46, 22, 35, 43, 55, 32, 20, 31, 29, 43, 36, 30, 23, 23, 57, 38, 34, 34, 28, 34, 31, 22, 33, 26),
+    (22, 25, 22, 31, 23, 30, 25, 32, 35, 29, 10, 51, 22, 31, 27, 36, 16, 27, 25, 26, 36, 31, 33, 18, 40, 37, 21, 43, 46, 38, 18, 35, 23, 35, 35, 38, 29, 31, 43, 38),
+    (17, 16, 17, 35, 19, 30, 38, 36, 24, 20, 47, 8, 59, 57, 33, 34, 16, 30, 37, 27, 24, 33, 44, 23, 55, 46, 34),
+    (54, 34, 51, 49, 31, 27, 89, 26, 23, 36, 35, 16, 33, 45, 41, 50, 13, 32, 22, 29, 35, 41, 30, 25, 18, 65, 23, 31, 40, 16, 54, 42, 56, 29, 34, 13),
+    (46, 37, 29, 49, 33, 25, 26, 20, 29, 22, 32, 32, 18, 29, 23, 22, 20, 22, 21, 20, 23, 30, 25, 22, 19, 19, 26, 68, 29, 20, 30, 52, 29, 12),
+    (18, 24, 17, 24, 15, 27, 26, 35, 27, 43, 23, 24, 33, 15, 63, 10, 18, 28, 51, 9, 45, 34, 16, 33),
+    (36, 23, 31, 24, 31, 40, 25, 35, 57, 18, 40, 15, 25, 20, 20, 31, 13, 31, 30, 48, 25),
+    (22, 23, 18, 22),
+    (28, 36, 21, 22, 12, 21, 17, 22, 27, 27, 15, 25, 23, 52, 35, 23, 58, 30, 24, 42, 15, 23, 29, 22, 44, 25, 12, 25, 11, 31, 13),
+    (27, 32, 39, 12, 25, 23, 29, 18, 13, 19, 27, 31, 39, 33, 37, 23, 29, 33, 43, 26, 22, 51, 39, 25),
+    (53, 46, 28, 34, 18, 38, 51, 66, 28, 29, 43, 33, 34, 31, 34, 34, 24, 46, 21, 43, 29, 53),
+    (18, 25, 27, 44, 27, 33, 20, 29, 37, 36, 21, 21, 25, 29, 38, 20, 41, 37, 37, 21, 26, 20, 37, 20, 30),
+    (54, 55, 24, 43, 26, 81, 40, 40, 44, 14, 47, 40, 14, 17, 29, 43, 27, 17, 19, 8, 30, 19, 32, 31, 31, 32, 34, 21, 30),
+    (17, 18, 17, 22, 14, 42, 22, 18, 31, 19, 23, 16, 22, 15, 19, 14, 19, 34, 11, 37, 20, 12, 21, 27, 28, 23, 9, 27, 36, 27, 21, 33, 25, 33, 27, 23),
+    (11, 70, 13, 24, 17, 22, 28, 36, 15, 44),
+    (11, 20, 32, 23, 19, 19, 73, 18, 38, 39, 36, 47, 31),
+    (22, 23, 15, 17, 14, 14, 10, 17, 32, 3),
+    (22, 13, 26, 21, 27, 30, 21, 22, 35, 22, 20, 25, 28, 22, 35, 22, 16, 21, 29, 29, 34, 30, 17, 25, 6, 14, 23, 28, 25, 31, 40, 22, 33, 37, 16, 33, 24, 41, 30, 24, 34, 17),
+    (6, 12, 8, 8, 12, 10, 17, 9, 20, 18, 7, 8, 6, 7, 5, 11, 15, 50, 14, 9, 13, 31, 6, 10, 22, 12, 14, 9, 11, 12, 24, 11, 22, 22, 28, 12, 40, 22, 13, 17, 13, 11, 5, 26, 17, 11, 9, 14, 20, 23, 19, 9, 6, 7, 23, 13, 11, 11, 17, 12, 8, 12, 11, 10, 13, 20, 7, 35, 36, 5, 24, 20, 28, 23, 10, 12, 20, 72, 13, 19, 16, 8, 18, 12, 13, 17, 7, 18, 52, 17, 16, 15, 5, 23, 11, 13, 12, 9, 9, 5, 8, 28, 22, 35, 45, 48, 43, 13, 31, 7, 10, 10, 9, 8, 18, 19, 2, 29, 176, 7, 8, 9, 4, 8, 5, 6, 5, 6, 8, 8, 3, 18, 3, 3, 21, 26, 9, 8, 24, 13, 10, 7, 12, 15, 21, 10, 20, 14, 9, 6),
+    (33, 22, 35, 27, 23, 35, 27, 36, 18, 32, 31, 28, 25, 35, 33, 33, 28, 24, 29, 30, 31, 29, 35, 34, 28, 28, 27, 28, 27, 33, 31),
+    (18, 26, 22, 16, 20, 12, 29, 17, 18, 20, 10, 14),
+    (17, 17, 11, 16, 16, 13, 13, 14),
+    (31, 22, 26, 6, 30, 13, 25, 22, 21, 34, 16, 6, 22, 32, 9, 14, 14, 7, 25, 6, 17, 25, 18, 23, 12, 21, 13, 29, 24, 33, 9, 20, 24, 17, 10, 22, 38, 22, 8, 31, 29, 25, 28, 28, 25, 13, 15, 22, 26, 11, 23, 15, 12, 17, 13, 12, 21, 14, 21, 22, 11, 12, 19, 12, 25, 24),
+    (19, 37, 25, 31, 31, 30, 34, 22, 26, 25, 23, 17, 27, 22, 21, 21, 27, 23, 15, 18, 14, 30, 40, 10, 38, 24, 22, 17, 32, 24, 40, 44, 26, 22, 19, 32, 21, 28, 18, 16, 18, 22, 13, 30, 5, 28, 7, 47, 39, 46, 64, 34),
+    (22, 22, 66, 22, 22),
+    (28, 10, 27, 17, 17, 14, 27, 18, 11, 22, 25, 28, 23, 23, 8, 63, 24, 32, 14, 49, 32, 31, 49, 27, 17, 21, 36, 26, 21, 26, 18, 32, 33, 31, 15, 38, 28, 23, 29, 49, 26, 20, 27, 31, 25, 24, 23, 35),
+    (21, 49, 30, 37, 31, 28, 28, 27, 27, 21, 45, 13),
+    (11, 23, 5, 19, 15, 11, 16, 14, 17, 15, 12, 14, 16, 9),
+    (20, 32, 21),
+    (15, 16, 15, 13, 27, 14, 17, 14, 15),
+    (21,),
+    (17, 10, 10, 11),
+    (16, 13, 12, 13, 15, 16, 20),
+    (15, 13, 19),
+    (17, 20, 19),
+    (18, 15, 20),
+    (15, 23),
+    (21, 13, 10, 14, 11, 15, 14, 23, 17, 12, 17, 14, 9, 21),
+    (14, 17, 18, 6),
+    (25, 23, 17, 25, 48, 34, 29, 34, 38, 42, 30, 50, 58, 36, 39, 28, 27, 35, 30, 34, 46, 46, 39, 51, 46, 75, 66, 20),
+    (45, 28, 35, 41, 43, 56, 37, 38, 50, 52, 33, 44, 37, 72, 47, 20),
+    (80, 52, 38, 44, 39, 49, 50, 56, 62, 42, 54, 59, 35, 35, 32, 31, 37, 43, 48, 47, 38, 71, 56, 53),
+    (51, 25, 36, 54, 47, 71, 53, 59, 41, 42, 57, 50, 38, 31, 27, 33, 26, 40, 42, 31, 25),
+    (26, 47, 26, 37, 42, 15, 60, 40, 43, 48, 30, 25, 52, 28, 41, 40, 34, 28, 41, 38, 40, 30, 35, 27, 27, 32, 44, 31),
+    (32, 29, 31, 25, 21, 23, 25, 39, 33, 21, 36, 21, 14, 23, 33, 27),
+    (31, 16, 23, 21, 13, 20, 40, 13, 27, 33, 34, 31, 13, 40, 58, 24),
+    (24, 17, 18, 18, 21, 18, 16, 24, 15, 18, 33, 21, 14),
+    (24, 21, 29, 31, 26, 18),
+    (23, 22, 21, 32, 33, 24),
+    (30, 30, 21, 23),
+    (29, 23, 25, 18),
+    (10, 20, 13, 18, 28),
+    (12, 17, 18),
+    (20, 15, 16, 16, 25, 21),
+    (18, 26, 17, 22),
+    (16, 15, 15),
+    (25,),
+    (14, 18, 19, 16, 14, 20, 28, 13, 28, 39, 40, 29, 25),
+    (27, 26, 18, 17, 20),
+    (25, 25, 22, 19, 14),
+    (21, 22, 18),
+    (10, 29, 24, 21, 21),
+    (13,),
+    (14,),
+    (25,),
+    (20, 29, 22, 11, 14, 17, 17, 13, 21, 11, 19, 17, 18, 20, 8, 21, 18, 24, 21, 15, 27, 21),
+)
+
+# Global ordinal of the first verse of each chapter of each book,
+# followed by one past the book's last verse
+CHAPTER_STARTS = (
+    (0, 31, 56, 80, 106, 138, 160, 184, 206, 235, 267, 299, 319, 337, 361, 382, 398, 425, 458, 496, 514, 548, 572, 592, 659, 693, 728, 774, 796, 831, 874, 929, 961, 981, 1012, 1041, 1084, 1120, 1150, 1173, 1196, 1253, 1291, 1325, 1359, 1387, 1421, 1452, 1474, 1507, 1533),
+    (1533, 1555, 1580, 1602, 1633, 1656, 1686, 1711, 1743, 1778, 1807, 1817, 1868, 1890, 1921, 1948, 1984, 2000, 2027, 2052, 2078, 2114, 2145, 2178, 2196, 2236, 2273, 2294, 2337, 2383, 2421, 2439, 2474, 2497, 2532, 2567, 2605, 2634, 2665, 2708, 2746),
+    (2746, 2763, 2779, 2796, 2831, 2850, 2880, 2918, 2954, 2978, 2998, 3045, 3053, 3112, 3169, 3202, 3236, 3252, 3282, 3319, 3346, 3370, 3403, 3447, 3470, 3525, 3571, 3605),
+    (3605, 3659, 3693, 3744, 3793, 3824, 3851, 3940, 3966, 3989, 4025, 4060, 4076, 4109, 4154, 4195, 4245, 4258, 4290, 4312, 4341, 4376, 4417, 4447, 4472, 4490, 4555, 4578, 4609, 4649, 4665, 4719, 4761, 4817, 4846, 4880, 4893),
+    (4893, 4939, 4976, 5005, 5054, 5087, 5112, 5138, 5158, 5187, 5209, 5241, 5273, 5291, 5320, 5343, 5365, 5385, 5407, 5428, 5448, 5471, 5501, 5526, 5548, 5567, 5586, 5612, 5680, 5709, 5729, 5759, 5811, 5840, 5852),
+    (5852, 5870, 5894, 5911, 5935, 5950, 5977, 6003, 6038, 6065, 6108, 6131, 6155, 6188, 6203, 6266, 6276, 6294, 6322, 6373, 6382, 6427, 6461, 6477, 6510),
+    (6510, 6546, 6569, 6600, 6624, 6655, 6695, 6720, 6755, 6812, 6830, 6870, 6885, 6910, 6930, 6950, 6981, 6994, 7025, 7055, 7103, 7128),
+    (7128, 7150, 7173, 7191, 7213),
+    (7213, 7241, 7277, 7298, 7320, 7332, 7353, 7370, 7392, 7419, 7446, 7461, 7486, 7509, 7561, 7596, 7619, 7677, 7707, 7731, 7773, 7788, 7811, 7840, 7862, 7906, 7931, 7943, 7968, 7979, 8010, 8023),
+    (8023, 8050, 8082, 8121, 8133, 8158, 8181, 8210, 8228, 8241, 8260, 8287, 8318, 8357, 8390, 8427, 8450, 8479, 8512, 8555, 8581, 8603, 8654, 8693, 8718),
+    (8718, 8771, 8817, 8845, 8879, 8897, 8935, 8986, 9052, 9080, 9109, 9152, 9185, 9219, 9250, 9284, 9318, 9342, 9388, 9409, 9452, 9481, 9534),
+    (9534, 9552, 9577, 9604, 9648, 9675, 9708, 9728, 9757, 9794, 9830, 9851, 9872, 9897, 9926, 9964, 9984, 10025, 10062, 10099, 10120, 10146, 10166, 10203, 10223, 10253),
+    (10253, 10307, 10362, 10386, 10429, 10455, 10536, 10576, 10616, 10660, 10674, 10721, 10761, 10775, 10792, 10821, 10864, 10891, 10908, 10927, 10935, 10965, 10984, 11016, 11047, 11078, 11110, 11144, 11165, 11195),
+    (11195, 11212, 11230, 11247, 11269, 11283, 11325, 11347, 11365, 11396, 11415, 11438, 11454, 11476, 11491, 11510, 11524, 11543, 11577, 11588, 11625, 11645, 11657, 11678, 11705, 11733, 11756, 11765, 11792, 11828, 11855, 11876, 11909, 11934, 11967, 11994, 12017),
+    (12017, 12028, 12098, 12111, 12135, 12152, 12174, 12202, 12238, 12253, 12297),
+    (12297, 12308, 12328, 12360, 12383, 12402, 12421, 12494, 12512, 12550, 12589, 12625, 12672, 12703),
+    (12703, 12725, 12748, 12763, 12780, 12794, 12808, 12818, 12835, 12867, 12870),
+    (12870, 12892, 12905, 12931, 12952, 12979, 13009, 13030, 13052, 13087, 13109, 13129, 13154, 13182, 13204, 13239, 13261, 13277, 13298, 13327, 13356, 13390, 13420, 13437, 13462, 13468, 13482, 13505, 13533, 13558, 13589, 13629, 13651, 13684, 13721, 13737, 13770, 13794, 13835, 13865, 13889, 13923, 13940),
+    (13940, 13946, 13958, 13966, 13974, 13986, 13996, 14013, 14022, 14042, 14060, 14067, 14075, 14081, 14088, 14093, 14104, 14119, 14169, 14183, 14192, 14205, 14236, 14242, 14252, 14274, 14286, 14300, 14309, 14320, 14332, 14356, 14367, 14389, 14411, 14439, 14451, 14491, 14513, 14526, 14543, 14556, 14567, 14572, 14598, 14615, 14626, 14635, 14649, 14669, 14692, 14711, 14720, 14726, 14733, 14756, 14769, 14780, 14791, 14808, 14820, 14828, 14840, 14851, 14861, 14874, 14894, 14901, 14936, 14972, 14977, 15001, 15021, 15049, 15072, 15082, 15094, 15114, 15186, 15199, 15218, 15234, 15242, 15260, 15272, 15285, 15302, 15309, 15327, 15379, 15396, 15412, 15427, 15432, 15455, 15466, 15479, 15491, 15500, 15509, 15514, 15522, 15550, 15572, 15607, 15652, 15700, 15743, 15756, 15787, 15794, 15804, 15814, 15823, 15831, 15849, 15868, 15870, 15899, 16075, 16082, 16090, 16099, 16103, 16111, 16116, 16122, 16127, 16133, 16141, 16149, 16152, 16170, 16173, 16176, 16197, 16223, 16232, 16240, 16264, 16277, 16287, 16294, 16306, 16321, 16342, 16352, 16372, 16386, 16395, 16401),
+    (16401, 16434, 16456, 16491, 16518, 16541, 16576, 16603, 16639, 16657, 16689, 16720, 16748, 16773, 16808, 16841, 16874, 16902, 16926, 16955, 16985, 17016, 17045, 17080, 17114, 17142, 17170, 17197, 17225, 17252, 17285, 17316),
+    (17316, 17334, 17360, 17382, 17398, 17418, 17430, 17459, 17476, 17494, 17514, 17524, 17538),
+    (17538, 17555, 17572, 17583, 17599, 17615, 17628, 17641, 17655),
+    (17655, 17686, 17708, 17734, 17740, 17770, 17783, 17808, 17830, 17851, 17885, 17901, 17907, 17929, 17961, 17970, 17984, 17998, 18005, 18030, 18036, 18053, 18078, 18096, 18119, 18131, 18152, 18165, 18194, 18218, 18251, 18260, 18280, 18304, 18321, 18331, 18353, 18391, 18413, 18421, 18452, 18481, 18506, 18534, 18562, 18587, 18600, 18615, 18637, 18663, 18674, 18697, 18712, 18724, 18741, 18754, 18766, 18787, 18801, 18822, 18844, 18855, 18867, 18886, 18898, 18923, 18947),
+    (18947, 18966, 19003, 19028, 19059, 19090, 19120, 19154, 19176, 19202, 19227, 19250, 19267, 19294, 19316, 19337, 19358, 19385, 19408, 19423, 19441, 19455, 19485, 19525, 19535, 19573, 19597, 19619, 19636, 19668, 19692, 19732, 19776, 19802, 19824, 19843, 19875, 19896, 19924, 19942, 19958, 19976, 19998, 20011, 20041, 20046, 20074, 20081, 20128, 20167, 20213, 20277, 20311),
+    (20311, 20333, 20355, 20421, 20443, 20465),
+    (20465, 20493, 20503, 20530, 20547, 20564, 20578, 20605, 20623, 20634, 20656, 20681, 20709, 20732, 20755, 20763, 20826, 20850, 20882, 20896, 20945, 20977, 21008, 21057, 21084, 21101, 21122, 21158, 21184, 21205, 21231, 21249, 21281, 21314, 21345, 21360, 21398, 21426, 21449, 21478, 21527, 21553, 21573, 21600, 21631, 21656, 21680, 21703, 21738),
+    (21738, 21759, 21808, 21838, 21875, 21906, 21934, 21962, 21989, 22016, 22037, 22082, 22095),
+    (22095, 22106, 22129, 22134, 22153, 22168, 22179, 22195, 22209, 22226, 22241, 22253, 22267, 22283, 22292),
+    (22292, 22312, 22344, 22365),
+    (22365, 22380, 22396, 22411, 22424, 22451, 22465, 22482, 22496, 22511),
+    (22511, 22532),
+    (22532, 22549, 22559, 22569, 22580),
+    (22580, 22596, 22609, 22621, 22634, 22649, 22665, 22685),
+    (22685, 22700, 22713, 22732),
+    (22732, 22749, 22769, 22788),
+    (22788, 22806, 22821, 22841),
+    (22841, 22856, 22879),
+    (22879, 22900, 22913, 22923, 22937, 22948, 22963, 22977, 23000, 23017, 23029, 23046, 23060, 23069, 23090),
+    (23090, 23104, 23121, 23139, 23145),
+    (23145, 23170, 23193, 23210, 23235, 23283, 23317, 23346, 23380, 23418, 23460, 23490, 23540, 23598, 23634, 23673, 23701, 23728, 23763, 23793, 23827, 23873, 23919, 23958, 24009, 24055, 24130, 24196, 24216),
+    (24216, 24261, 24289, 24324, 24365, 24408, 24464, 24501, 24539, 24589, 24641, 24674, 24718, 24755, 24827, 24874, 24894),
+    (24894, 24974, 25026, 25064, 25108, 25147, 25196, 25246, 25302, 25364, 25406, 25460, 25519, 25554, 25589, 25621, 25652, 25689, 25732, 25780, 25827, 25865, 25936, 25992, 26045),
+    (26045, 26096, 26121, 26157, 26211, 26258, 26329, 26382, 26441, 26482, 26524, 26581, 26631, 26669, 26700, 26727, 26760, 26786, 26826, 26868, 26899, 26924),
+    (26924, 26950, 26997, 27023, 27060, 27102, 27117, 27177, 27217, 27260, 27308, 27338, 27363, 27415, 27443, 27484, 27524, 27558, 27586, 27627, 27665, 27705, 27735, 27770, 27797, 27824, 27856, 27900, 27931),
+    (27931, 27963, 27992, 28023, 28048, 28069, 28092, 28117, 28156, 28189, 28210, 28246, 28267, 28281, 28304, 28337, 28364),
+    (28364, 28395, 28411, 28434, 28455, 28468, 28488, 28528, 28541, 28568, 28601, 28635, 28666, 28679, 28719, 28777, 28801),
+    (28801, 28825, 28842, 28860, 28878, 28899, 28917, 28933, 28957, 28972, 28990, 29023, 29044, 29058),
+    (29058, 29082, 29103, 29132, 29163, 29189, 29207),
+    (29207, 29230, 29252, 29273, 29305, 29338, 29362),
+    (29362, 29392, 29422, 29443, 29466),
+    (29466, 29495, 29518, 29543, 29561),
+    (29561, 29571, 29591, 29604, 29622, 29650),
+    (29650, 29662, 29679, 29697),
+    (29697, 29717, 29732, 29748, 29764, 29789, 29810),
+    (29810, 29828, 29854, 29871, 29893),
+    (29893, 29909, 29924, 29939),
+    (29939, 29964),
+    (29964, 29978, 29996, 30015, 30031, 30045, 30065, 30093, 30106, 30134, 30173, 30213, 30242, 30267),
+    (30267, 30294, 30320, 30338, 30355, 30375),
+    (30375, 30400, 30425, 30447, 30466, 30480),
+    (30480, 30501, 30523, 30541),
+    (30541, 30551, 30580, 30604, 30625, 30646),
+    (30646, 30659),
+    (30659, 30673),
+    (30673, 30698),
+    (30698, 30718, 30747, 30769, 30780, 30794, 30811, 30828, 30841, 30862, 30873, 30892, 30909, 30927, 30947, 30955, 30976, 30994, 31018, 31039, 31054, 31081, 31102),
+)
+
+TOTAL_VERSES = 31102
+
+# Half-open ordinal range of each testament
+TESTAMENT_RANGES = {'OT': (0, 23145), 'NT': (23145, 31102)}
+
+# Normalized book names and abbreviations mapped to book IDs
+BOOK_INDEX = {
+    'gen': 'GEN',
+    'genesis': 'GEN',
+    'ge': 'GEN',
+    'gn': 'GEN',
+    'exo': 'EXO',
+    'exodus': 'EXO',
+    'exod': 'EXO',
+    'ex': 'EXO',
+    'lev': 'LEV',
+    'leviticus': 'LEV',
+    'le': 'LEV',
+    'lv': 'LEV',
+    'num': 'NUM',
+    'numbers': 'NUM',
+    'nu': 'NUM',
+    'nm': 'NUM',
+    'nb': 'NUM',
+    'deu': 'DEU',
+    'deuteronomy': 'DEU',
+    'deut': 'DEU',
+    'de': 'DEU',
+    'dt': 'DEU',
+    'jos': 'JOS',
+    'joshua': 'JOS',
+    'josh': 'JOS',
+    'jsh': 'JOS',
+    'jdg': 'JDG',
+    'judges': 'JDG',
+    'judg': 'JDG',
+    'jdgs': 'JDG',
+    'jg': 'JDG',
+    'rut': 'RUT',
+    'ruth': 'RUT',
+    'rth': 'RUT',
+    'ru': 'RUT',
+    '1 sa': '1SA',
+    '1 samuel': '1SA',
+    '1 sam': '1SA',
+    '1 sm': '1SA',
+    'i samuel': '1SA',
+    'i sam': '1SA',
+    'i sa': '1SA',
+    'i sm': '1SA',
+    '1 st samuel': '1SA',
+    '1 st sam': '1SA',
+    '1 st sa': '1SA',
+    '1 st sm': '1SA',
+    'first samuel': '1SA',
+    'first sam': '1SA',
+    'first sa': '1SA',
+    'first sm': '1SA',
+    '2 sa': '2SA',
+    '2 samuel': '2SA',
+    '2 sam': '2SA',
+    '2 sm': '2SA',
+    'ii samuel': '2SA',
+    'ii sam': '2SA',
+    'ii sa': '2SA',
+    'ii sm': '2SA',
+    '2 nd samuel': '2SA',
+    '2 nd sam': '2SA',
+    '2 nd sa': '2SA',
+    '2 nd sm': '2SA',
+    'second samuel': '2SA',
+    'second sam': '2SA',
+    'second sa': '2SA',
+    'second sm': '2SA',
+    '1 ki': '1KI',
+    '1 kings': '1KI',
+    '1 kgs': '1KI',
+    '1 kin': '1KI',
+    'i kings': '1KI',
+    'i kgs': '1KI',
+    'i kin': '1KI',
+    'i ki': '1KI',
+    '1 st kings': '1KI',
+    '1 st kgs': '1KI',
+    '1 st kin': '1KI',
+    '1 st ki': '1KI',
+    'first kings': '1KI',
+    'first kgs': '1KI',
+    'first kin': '1KI',
+    'first ki': '1KI',
+    '2 ki': '2KI',
+    '2 kings': '2KI',
+    '2 kgs': '2KI',
+    '2 kin': '2KI',
+    'ii kings': '2KI',
+    'ii kgs': '2KI',
+    'ii kin': '2KI',
+    'ii ki': '2KI',
+    '2 nd kings': '2KI',
+    '2 nd kgs': '2KI',
+    '2 nd kin': '2KI',
+    '2 nd ki': '2KI',
+    'second kings': '2KI',
+    'second kgs': '2KI',
+    'second kin': '2KI',
+    'second ki': '2KI',
+    '1 ch': '1CH',
+    '1 chronicles': '1CH',
+    '1 chron': '1CH',
+    '1 chr': '1CH',
+    'i chronicles': '1CH',
+    'i chron': '1CH',
+    'i chr': '1CH',
+    'i ch': '1CH',
+    '1 st chronicles': '1CH',
+    '1 st chron': '1CH',
+    '1 st chr': '1CH',
+    '1 st ch': '1CH',
+    'first chronicles': '1CH',
+    'first chron': '1CH',
+    'first chr': '1CH',
+    'first ch': '1CH',
+    '2 ch': '2CH',
+    '2 chronicles': '2CH',
+    '2 chron': '2CH',
+    '2 chr': '2CH',
+    'ii chronicles': '2CH',
+    'ii chron': '2CH',
+    'ii chr': '2CH',
+    'ii ch': '2CH',
+    '2 nd chronicles': '2CH',
+    '2 nd chron': '2CH',
+    '2 nd chr': '2CH',
+    '2 nd ch': '2CH',
+    'second chronicles': '2CH',
+    'second chron': '2CH',
+    'second chr': '2CH',
+    'second ch': '2CH',
+    'ezr': 'EZR',
+    'ezra': 'EZR',
+    'neh': 'NEH',
+    'nehemiah': 'NEH',
+    'ne': 'NEH',
+    'est': 'EST',
+    'esther': 'EST',
+    'esth': 'EST',
+    'es': 'EST',
+    'job': 'JOB',
+    'jb': 'JOB',
+    'psa': 'PSA',
+    'psalms': 'PSA',
+    'psalm': 'PSA',
+    'ps': 'PSA',
+    'pslm': 'PSA',
+    'psm': 'PSA',
+    'pss': 'PSA',
+    'pro': 'PRO',
+    'proverbs': 'PRO',
+    'prov': 'PRO',
+    'pr': 'PRO',
+    'prv': 'PRO',
+    'ecc': 'ECC',
+    'ecclesiastes': 'ECC',
+    'eccles': 'ECC',
+    'eccle': 'ECC',
+    'eccl': 'ECC',
+    'ec': 'ECC',
+    'qoh': 'ECC',
+    'qoheleth': 'ECC',
+    'sng': 'SNG',
+    'song of solomon': 'SNG',
+    'song': 'SNG',
+    'song of songs': 'SNG',
+    'song of sol': 'SNG',
+    'sos': 'SNG',
+    'so': 'SNG',
+    'canticles': 'SNG',
+    'cant': 'SNG',
+    'isa': 'ISA',
+    'isaiah': 'ISA',
+    'is': 'ISA',
+    'jer': 'JER',
+    'jeremiah': 'JER',
+    'je': 'JER',
+    'jr': 'JER',
+    'lam': 'LAM',
+    'lamentations': 'LAM',
+    'la': 'LAM',
+    'ezk': 'EZK',
+    'ezekiel': 'EZK',
+    'ezek': 'EZK',
+    'eze': 'EZK',
+    'dan': 'DAN',
+    'daniel': 'DAN',
+    'da': 'DAN',
+    'dn': 'DAN',
+    'hos': 'HOS',
+    'hosea': 'HOS',
+    'ho': 'HOS',
+    'jol': 'JOL',
+    'joel': 'JOL',
+    'joe': 'JOL',
+    'jl': 'JOL',
+    'amo': 'AMO',
+    'amos': 'AMO',
+    'am': 'AMO',
+    'obad': 'OBAD',
+    'obadiah': 'OBAD',
+    'ob': 'OBAD',
+    'oba': 'OBAD',
+    'jon': 'JON',
+    'jonah': 'JON',
+    'jnh': 'JON',
+    'mic': 'MIC',
+    'micah': 'MIC',
+    'mc': 'MIC',
+    'nam': 'NAM',
+    'nahum': 'NAM',
+    'nah': 'NAM',
+    'na': 'NAM',
+    'hab': 'HAB',
+    'habakkuk': 'HAB',
+    'hb': 'HAB',
+    'zep': 'ZEP',
+    'zephaniah': 'ZEP',
+    'zeph': 'ZEP',
+    'zp': 'ZEP',
+    'hag': 'HAG',
+    'haggai': 'HAG',
+    'hg': 'HAG',
+    'zec': 'ZEC',
+    'zechariah': 'ZEC',
+    'zech': 'ZEC',
+    'zc': 'ZEC',
+    'mal': 'MAL',
+    'malachi': 'MAL',
+    'ml': 'MAL',
+    'mat': 'MAT',
+    'matthew': 'MAT',
+    'matt': 'MAT',
+    'mt': 'MAT',
+    'mrk': 'MRK',
+    'mark': 'MRK',
+    'mar': 'MRK',
+    'mk': 'MRK',
+    'mr': 'MRK',
+    'luk': 'LUK',
+    'luke': 'LUK',
+    'lk': 'LUK',
+    'jhn': 'JHN',
+    'john': 'JHN',
+    'joh': 'JHN',
+    'jn': 'JHN',
+    'act': 'ACT',
+    'acts': 'ACT',
+    'ac': 'ACT',
+    'rom': 'ROM',
+    'romans': 'ROM',
+    'ro': 'ROM',
+    'rm': 'ROM',
+    '1 co': '1CO',
+    '1 corinthians': '1CO',
+    '1 cor': '1CO',
+    'i corinthians': '1CO',
+    'i cor': '1CO',
+    'i co': '1CO',
+    '1 st corinthians': '1CO',
+    '1 st cor': '1CO',
+    '1 st co': '1CO',
+    'first corinthians': '1CO',
+    'first cor': '1CO',
+    'first co': '1CO',
+    '2 co': '2CO',
+    '2 corinthians': '2CO',
+    '2 cor': '2CO',
+    'ii corinthians': '2CO',
+    'ii cor': '2CO',
+    'ii co': '2CO',
+    '2 nd corinthians': '2CO',
+    '2 nd cor': '2CO',
+    '2 nd co': '2CO',
+    'second corinthians': '2CO',
+    'second cor': '2CO',
+    'second co': '2CO',
+    'gal': 'GAL',
+    'galatians': 'GAL',
+    'ga': 'GAL',
+    'eph': 'EPH',
+    'ephesians': 'EPH',
+    'ephes': 'EPH',
+    'php': 'PHP',
+    'philippians': 'PHP',
+    'phil': 'PHP',
+    'pp': 'PHP',
+    'col': 'COL',
+    'colossians': 'COL',
+    'colos': 'COL',
+    '1 th': '1TH',
+    '1 thessalonians': '1TH',
+    '1 thess': '1TH',
+    '1 thes': '1TH',
+    'i thessalonians': '1TH',
+    'i thess': '1TH',
+    'i thes': '1TH',
+    'i th': '1TH',
+    '1 st thessalonians': '1TH',
+    '1 st thess': '1TH',
+    '1 st thes': '1TH',
+    '1 st th': '1TH',
+    'first thessalonians': '1TH',
+    'first thess': '1TH',
+    'first thes': '1TH',
+    'first th': '1TH',
+    '2 th': '2TH',
+    '2 thessalonians': '2TH',
+    '2 thess': '2TH',
+    '2 thes': '2TH',
+    'ii thessalonians': '2TH',
+    'ii thess': '2TH',
+    'ii thes': '2TH',
+    'ii th': '2TH',
+    '2 nd thessalonians': '2TH',
+    '2 nd thess': '2TH',
+    '2 nd thes': '2TH',
+    '2 nd th': '2TH',
+    'second thessalonians': '2TH',
+    'second thess': '2TH',
+    'second thes': '2TH',
+    'second th': '2TH',
+    '1 ti': '1TI',
+    '1 timothy': '1TI',
+    '1 tim': '1TI',
+    'i timothy': '1TI',
+    'i tim': '1TI',
+    'i ti': '1TI',
+    '1 st timothy': '1TI',
+    '1 st tim': '1TI',
+    '1 st ti': '1TI',
+    'first timothy': '1TI',
+    'first tim': '1TI',
+    'first ti': '1TI',
+    '2 ti': '2TI',
+    '2 timothy': '2TI',
+    '2 tim': '2TI',
+    'ii timothy': '2TI',
+    'ii tim': '2TI',
+    'ii ti': '2TI',
+    '2 nd timothy': '2TI',
+    '2 nd tim': '2TI',
+    '2 nd ti': '2TI',
+    'second timothy': '2TI',
+    'second tim': '2TI',
+    'second ti': '2TI',
+    'tit': 'TIT',
+    'titus': 'TIT',
+    'ti': 'TIT',
+    'phlm': 'PHLM',
+    'philemon': 'PHLM',
+    'philem': 'PHLM',
+    'phm': 'PHLM',
+    'pm': 'PHLM',
+    'heb': 'HEB',
+    'hebrews': 'HEB',
+    'he': 'HEB',
+    'jas': 'JAS',
+    'james': 'JAS',
+    'jm': 'JAS',
+    '1 pe': '1PE',
+    '1 peter': '1PE',
+    '1 pet': '1PE',
+    '1 pt': '1PE',
+    'i peter': '1PE',
+    'i pet': '1PE',
+    'i pe': '1PE',
+    'i pt': '1PE',
+    '1 st peter': '1PE',
+    '1 st pet': '1PE',
+    '1 st pe': '1PE',
+    '1 st pt': '1PE',
+    'first peter': '1PE',
+    'first pet': '1PE',
+    'first pe': '1PE',
+    'first pt': '1PE',
+    '2 pe': '2PE',
+    '2 peter': '2PE',
+    '2 pet': '2PE',
+    '2 pt': '2PE',
+    'ii peter': '2PE',
+    'ii pet': '2PE',
+    'ii pe': '2PE',
+    'ii pt': '2PE',
+    '2 nd peter': '2PE',
+    '2 nd pet': '2PE',
+    '2 nd pe': '2PE',
+    '2 nd pt': '2PE',
+    'second peter': '2PE',
+    'second pet': '2PE',
+    'second pe': '2PE',
+    'second pt': '2PE',
+    '1 jn': '1JN',
+    '1 john': '1JN',
+    '1 jhn': '1JN',
+    '1 jo': '1JN',
+    'i john': '1JN',
+    'i jn': '1JN',
+    'i jhn': '1JN',
+    'i jo': '1JN',
+    '1 st john': '1JN',
+    '1 st jn': '1JN',
+    '1 st jhn': '1JN',
+    '1 st jo': '1JN',
+    'first john': '1JN',
+    'first jn': '1JN',
+    'first jhn': '1JN',
+    'first jo': '1JN',
+    '2 jn': '2JN',
+    '2 john': '2JN',
+    '2 jhn': '2JN',
+    '2 jo': '2JN',
+    'ii john': '2JN',
+    'ii jn': '2JN',
+    'ii jhn': '2JN',
+    'ii jo': '2JN',
+    '2 nd john': '2JN',
+    '2 nd jn': '2JN',
+    '2 nd jhn': '2JN',
+    '2 nd jo': '2JN',
+    'second john': '2JN',
+    'second jn': '2JN',
+    'second jhn': '2JN',
+    'second jo': '2JN',
+    '3 jn': '3JN',
+    '3 john': '3JN',
+    '3 jhn': '3JN',
+    '3 jo': '3JN',
+    'iii john': '3JN',
+    'iii jn': '3JN',
+    'iii jhn': '3JN',
+    'iii jo': '3JN',
+    '3 rd john': '3JN',
+    '3 rd jn': '3JN',
+    '3 rd jhn': '3JN',
+    '3 rd jo': '3JN',
+    'third john': '3JN',
+    'third jn': '3JN',
+    'third jhn': '3JN',
+    'third jo': '3JN',
+    'jud': 'JUD',
+    'jude': 'JUD',
+    'jd': 'JUD',
+    'rev': 'REV',
+    'revelation': 'REV',
+    're': 'REV',
+    'rv': 'REV',
+    'revelations': 'REV',
+    'apocalypse': 'REV',
+}
+
+# Most words in any name in BOOK_INDEX
+MAX_BOOK_NAME_WORDS = 3
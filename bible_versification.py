@@ -0,0 +1,313 @@
+"""
+Versification maps between the standard numbering and other schemes.
+
+Verse ordinals (see bible_data) follow the standard English (KJV/WEB)
+versification. Some translations number verses differently; the
+Clementine Vulgate and the Douay-Rheims, for instance, follow the Greek
+numbering of the Psalms, and count psalm titles as verses. Each scheme is
+described by a table of rules mapping runs of standard verses to the
+scheme's chapter and verse numbers. The first time a scheme is used, its
+rules are compiled into two arrays indexed by ordinal, so converting a
+verse in either direction is a single array lookup.
+
+The Vulgate scheme renumbers Job, Psalms, Ecclesiastes, Song of Solomon,
+Daniel, Hosea and Jonah. Every other book keeps the standard numbering,
+including Joel and Malachi, which the Hebrew Bible divides differently
+but the Clementine Vulgate does not, and 3 John. A standard verse that a
+scheme splits in two (such as Psalm 13:2) maps to the first part only.
+"""
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from bible_data import BOOK_IDS, BOOKS, TOTAL_VERSES, book_ordinal_range, verse_to_ordinal
+
+# A rule maps standard verses first..last of a chapter (None for the end of
+# the chapter) to consecutive verses of the scheme, starting at a target
+# chapter and verse:
+#     (book_id, chapter, first, last, target_chapter, target_verse)
+Rule = Tuple[str, int, int, Optional[int], int, int]
+
+# Psalms whose titles the Hebrew and Greek texts count as separate verses,
+# by the number of verses the title takes up. Other titles either do not
+# exist or share the first verse with the text.
+_PSALM_TITLE_VERSES: Dict[int, int] = {
+    **dict.fromkeys((
+        3, 4, 5, 6, 7, 8, 9, 12, 18, 19, 20, 21, 22, 30, 31, 34, 36, 38, 39,
+        40, 41, 42, 44, 45, 46, 47, 48, 49, 53, 55, 56, 57, 58, 59, 61, 62,
+        63, 64, 65, 67, 68, 69, 70, 75, 76, 77, 80, 81, 83, 84, 85, 88, 89,
+        92, 102, 108, 140, 142,
+    ), 1),
+    **dict.fromkeys((51, 52, 54, 60), 2),
+}
+
+
+def _greek_psalm_rules() -> List[Rule]:
+    """
+    Build the rules for the Greek (Septuagint and Vulgate) numbering of the Psalms.
+
+    Psalms 9-10 are one psalm, as are 114-115, while 116 and 147 are each
+    split in two, so most psalms are numbered one lower than in the
+    standard numbering.
+
+    Returns:
+        Rules covering every verse of the Psalms
+    """
+    rules: List[Rule] = [
+        ("PSA", 10, 1, None, 9, 22),
+        # 13:1 shares a verse with the title, 13:2 is split in two and
+        # 13:5-6 are one verse
+        ("PSA", 13, 1, 2, 12, 1),
+        ("PSA", 13, 3, 5, 12, 4),
+        ("PSA", 13, 6, None, 12, 6),
+        ("PSA", 114, 1, None, 113, 1),
+        ("PSA", 115, 1, None, 113, 9),
+        ("PSA", 116, 1, 9, 114, 1),
+        ("PSA", 116, 10, None, 115, 1),
+        ("PSA", 147, 1, 11, 146, 1),
+        ("PSA", 147, 12, None, 147, 1),
+    ]
+    special = {chapter for _, chapter, _, _, _, _ in rules}
+    for chapter in range(1, BOOKS["PSA"].chapters + 1):
+        if chapter in special:
+            continue
+        target = chapter - 1 if 11 <= chapter <= 146 else chapter
+        rules.append(("PSA", chapter, 1, None, target, 1 + _PSALM_TITLE_VERSES.get(chapter, 0)))
+    return rules
+
+
+# Verses the Vulgate numbers differently outside the Psalms. Chapters of
+# these books without a rule of their own keep the standard numbering.
+_VULGATE_RULES: List[Rule] = [
+    # Job 40:1-5 end chapter 39, and chapter 40 runs on to 41:9
+    ("JOB", 40, 1, 5, 39, 31),
+    ("JOB", 40, 6, None, 40, 1),
+    ("JOB", 41, 1, 9, 40, 20),
+    ("JOB", 41, 10, None, 41, 1),
+    # Chapter 5 starts one verse later
+    ("ECC", 5, 1, 1, 4, 17),
+    ("ECC", 5, 2, None, 5, 1),
+    # Chapter 6 starts one verse later
+    ("SNG", 6, 1, 1, 5, 17),
+    ("SNG", 6, 2, None, 6, 1),
+    # Chapter 3 includes the Prayer of Azariah and the Song of the Three
+    # Young Men (3:24-90), and 4:1-3 end it
+    ("DAN", 3, 1, 23, 3, 1),
+    ("DAN", 3, 24, None, 3, 91),
+    ("DAN", 4, 1, 3, 3, 98),
+    ("DAN", 4, 4, None, 4, 1),
+    # Chapter 14 starts one verse earlier
+    ("HOS", 13, 1, 15, 13, 1),
+    ("HOS", 13, 16, 16, 14, 1),
+    ("HOS", 14, 1, None, 14, 2),
+    # Chapter 2 starts one verse earlier
+    ("JON", 1, 1, 16, 1, 1),
+    ("JON", 1, 17, 17, 2, 1),
+    ("JON", 2, 1, None, 2, 2),
+]
+
+
+def _vulgate_rules() -> List[Rule]:
+    """
+    Build the rules for the Vulgate numbering (Clementine, Douay-Rheims).
+
+    Returns:
+        Rules covering every verse of each book the Vulgate renumbers
+    """
+    rules = _greek_psalm_rules() + _VULGATE_RULES
+    moved = {(book_id, chapter) for book_id, chapter, _, _, _, _ in _VULGATE_RULES}
+    for book_id in {rule[0] for rule in _VULGATE_RULES}:
+        for chapter in range(1, BOOKS[book_id].chapters + 1):
+            if (book_id, chapter) not in moved:
+                rules.append((book_id, chapter, 1, None, chapter, 1))
+    return rules
+
+
+# Rules of each non-standard scheme
+_SCHEME_RULES = {
+    "vulgate": _vulgate_rules,
+}
+
+# Translations that do not use the standard numbering, by scheme
+TRANSLATION_SCHEMES: Dict[str, str] = {
+    "clementine": "vulgate",
+    "dra": "vulgate",
+}
+
+
+class Versification:
+    """
+    Compiled mapping between the standard numbering and another scheme.
+
+    Scheme verses get ordinals of their own, laid out in canonical order
+    like the standard ones. The forward array maps each standard ordinal
+    to a scheme ordinal; since the mapping preserves order, the reverse
+    array only needs the first standard ordinal at or after each scheme
+    ordinal, and a scheme verse covers the standard verses up to the next
+    entry. A scheme verse with no standard counterpart, such as a psalm
+    title, covers none.
+    """
+
+    __slots__ = ("name", "_chapter_starts", "_book_starts", "_forward", "_reverse")
+
+    def __init__(self, name: str, rules: Iterable[Rule]):
+        """
+        Compile a scheme from its rules.
+
+        Args:
+            name: Scheme name (e.g., "vulgate")
+            rules: Rules for every standard verse of each book the scheme
+                renumbers; other books keep the standard numbering
+        """
+        self.name = name
+
+        by_book: Dict[str, List[Rule]] = {}
+        for rule in rules:
+            by_book.setdefault(rule[0], []).append(rule)
+
+        # Lay out the scheme's chapters, then map every standard verse
+        self._chapter_starts: Dict[str, array] = {}
+        starts = []
+        ordinal = 0
+        for book_id in BOOK_IDS:
+            starts.append(ordinal)
+            counts = list(BOOKS[book_id].verses)
+            if book_id in by_book:
+                counts = [0] * len(counts)
+                for _, chapter, first, last, target_chapter, target_verse in by_book[book_id]:
+                    last = last or BOOKS[book_id].verses[chapter - 1]
+                    if target_chapter > len(counts):
+                        counts.extend([0] * (target_chapter - len(counts)))
+                    end = target_verse + last - first
+                    counts[target_chapter - 1] = max(counts[target_chapter - 1], end)
+            chapter_starts = array("I", [ordinal])
+            for count in counts:
+                ordinal += count
+                chapter_starts.append(ordinal)
+            self._chapter_starts[book_id] = chapter_starts
+        self._book_starts = array("I", starts)
+
+        self._forward = array("I", bytes(4 * TOTAL_VERSES))
+        for book_id in BOOK_IDS:
+            start, stop = book_ordinal_range(book_id)
+            scheme_start = self._chapter_starts[book_id][0]
+            if book_id not in by_book:
+                self._forward[start:stop] = array("I", range(scheme_start, scheme_start + stop - start))
+                continue
+            for _, chapter, first, last, target_chapter, target_verse in by_book[book_id]:
+                last = last or BOOKS[book_id].verses[chapter - 1]
+                source = verse_to_ordinal(book_id, chapter, first)
+                target = self._chapter_starts[book_id][target_chapter - 1] + target_verse - 1
+                self._forward[source:source + last - first + 1] = array(
+                    "I", range(target, target + last - first + 1)
+                )
+
+        total = ordinal
+        self._reverse = array("I", bytes(4 * (total + 1)))
+        standard = 0
+        for scheme_ordinal in range(total + 1):
+            while standard < TOTAL_VERSES and self._forward[standard] < scheme_ordinal:
+                standard += 1
+            self._reverse[scheme_ordinal] = standard
+
+    def __repr__(self) -> str:
+        return f"Versification({self.name!r})"
+
+    def to_scheme(self, ordinal: int) -> Tuple[str, int, int]:
+        """
+        Get the scheme's numbering of a standard verse.
+
+        Args:
+            ordinal: Standard verse ordinal
+
+        Returns:
+            Tuple of (book_id, chapter, verse) in the scheme
+
+        Raises:
+            ValueError: If the ordinal is out of range
+        """
+        if not 0 <= ordinal < TOTAL_VERSES:
+            raise ValueError(f"Invalid verse ordinal: {ordinal}")
+
+        scheme_ordinal = self._forward[ordinal]
+        book_id = BOOK_IDS[bisect_right(self._book_starts, scheme_ordinal) - 1]
+        chapter_starts = self._chapter_starts[book_id]
+        chapter = bisect_right(chapter_starts, scheme_ordinal)
+        return book_id, chapter, scheme_ordinal - chapter_starts[chapter - 1] + 1
+
+    def from_scheme(self, book_id: str, chapter: int, verse: int) -> Tuple[int, int]:
+        """
+        Get the standard verses covered by a verse of the scheme.
+
+        Args:
+            book_id: Book ID (e.g., "PSA")
+            chapter: Chapter number in the scheme
+            verse: Verse number in the scheme
+
+        Returns:
+            Half-open range of standard ordinals, empty if the verse has no
+            standard counterpart
+
+        Raises:
+            ValueError: If the verse does not exist in the scheme
+        """
+        chapter_starts = self._chapter_starts.get(book_id)
+        if chapter_starts is None or not 1 <= chapter < len(chapter_starts):
+            raise ValueError(f"Reference does not exist: {book_id} {chapter}:{verse}")
+        scheme_ordinal = chapter_starts[chapter - 1] + verse - 1
+        if verse < 1 or scheme_ordinal >= chapter_starts[chapter]:
+            raise ValueError(f"Reference does not exist: {book_id} {chapter}:{verse}")
+        return self._reverse[scheme_ordinal], self._reverse[scheme_ordinal + 1]
+
+    def format_passage(self, ranges: Iterable[Tuple[int, int]]) -> str:
+        """
+        Format standard verse ranges as a reference in the scheme's numbering.
+
+        Args:
+            ranges: Half-open standard ordinal ranges, all in one book
+
+        Returns:
+            Reference string (e.g., "Psalms 22:1-6,50:3-21")
+        """
+        book_name = None
+        segments = []
+        for start, stop in ranges:
+            book_id, first_chapter, first_verse = self.to_scheme(start)
+            _, last_chapter, last_verse = self.to_scheme(stop - 1)
+            book_name = BOOKS[book_id].name
+            segment = f"{first_chapter}:{first_verse}"
+            if last_chapter != first_chapter:
+                segment += f"-{last_chapter}:{last_verse}"
+            elif last_verse != first_verse:
+                segment += f"-{last_verse}"
+            segments.append(segment)
+        return f"{book_name} " + ",".join(segments)
+
+
+@lru_cache(maxsize=None)
+def _compile(scheme: str) -> Versification:
+    """
+    Compile a scheme on first use.
+
+    Args:
+        scheme: Scheme name (e.g., "vulgate")
+
+    Returns:
+        The compiled versification
+    """
+    return Versification(scheme, _SCHEME_RULES[scheme]())
+
+
+def get_versification(translation: Optional[str]) -> Optional[Versification]:
+    """
+    Get the versification a translation uses, if it is not the standard one.
+
+    Args:
+        translation: Translation ID (e.g., "dra"), or None for the default
+
+    Returns:
+        The compiled versification, or None for the standard numbering
+    """
+    scheme = TRANSLATION_SCHEMES.get((translation or "").lower())
+    return _compile(scheme) if scheme else None
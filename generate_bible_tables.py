@@ -0,0 +1,315 @@
+"""
+Generator for bible_tables, the precomputed Bible structure tables.
+
+This is the source of the Bible structure data: each book's name,
+testament and verse counts, and the abbreviations accepted for it.
+Everything bible_data needs at run time (cumulative chapter start
+ordinals, testament ranges and the book name index) is computed here once
+and written to bible_tables.py as Python literals, so importing bible_data
+does no work beyond loading constants.
+
+After changing the data below, regenerate the tables:
+
+    python generate_bible_tables.py
+
+or write them elsewhere with --output.
+"""
+import argparse
+import os
+import re
+import sys
+from typing import Dict, List, Optional, Tuple
+
+# The generator must run without bible_tables.py, so it imports nothing
+# from bible_data (which loads the tables). These constants and the name
+# normalization below mirror bible_data's, and the tests check they agree.
+
+# Testament codes, as in bible_data
+OLD_TESTAMENT = "OT"
+NEW_TESTAMENT = "NT"
+
+# Books in canonical order: (book ID, name, testament, verses per chapter)
+BOOKS: List[Tuple[str, str, str, List[int]]] = [
+    ("GEN", "Genesis", OLD_TESTAMENT, [31, 25, 24, 26, 32, 22, 24, 22, 29, 32, 32, 20, 18, 24, 21, 16, 27, 33, 38, 18, 34, 24, 20, 67, 34, 35, 46, 22, 35, 43, 55, 32, 20, 31, 29, 43, 36, 30, 23, 23, 57, 38, 34, 34, 28, 34, 31, 22, 33, 26]),
+    ("EXO", "Exodus", OLD_TESTAMENT, [22, 25, 22, 31, 23, 30, 25, 32, 35, 29, 10, 51, 22, 31, 27, 36, 16, 27, 25, 26, 36, 31, 33, 18, 40, 37, 21, 43, 46, 38, 18, 35, 23, 35, 35, 38, 29, 31, 43, 38]),
+    ("LEV", "Leviticus", OLD_TESTAMENT, [17, 16, 17, 35, 19, 30, 38, 36, 24, 20, 47, 8, 59, 57, 33, 34, 16, 30, 37, 27, 24, 33, 44, 23, 55, 46, 34]),
+    ("NUM", "Numbers", OLD_TESTAMENT, [54, 34, 51, 49, 31, 27, 89, 26, 23, 36, 35, 16, 33, 45, 41, 50, 13, 32, 22, 29, 35, 41, 30, 25, 18, 65, 23, 31, 40, 16, 54, 42, 56, 29, 34, 13]),
+    ("DEU", "Deuteronomy", OLD_TESTAMENT, [46, 37, 29, 49, 33, 25, 26, 20, 29, 22, 32, 32, 18, 29, 23, 22, 20, 22, 21, 20, 23, 30, 25, 22, 19, 19, 26, 68, 29, 20, 30, 52, 29, 12]),
+    ("JOS", "Joshua", OLD_TESTAMENT, [18, 24, 17, 24, 15, 27, 26, 35, 27, 43, 23, 24, 33, 15, 63, 10, 18, 28, 51, 9, 45, 34, 16, 33]),
+    ("JDG", "Judges", OLD_TESTAMENT, [36, 23, 31, 24, 31, 40, 25, 35, 57, 18, 40, 15, 25, 20, 20, 31, 13, 31, 30, 48, 25]),
+    ("RUT", "Ruth", OLD_TESTAMENT, [22, 23, 18, 22]),
+    ("1SA", "1 Samuel", OLD_TESTAMENT, [28, 36, 21, 22, 12, 21, 17, 22, 27, 27, 15, 25, 23, 52, 35, 23, 58, 30, 24, 42, 15, 23, 29, 22, 44, 25, 12, 25, 11, 31, 13]),
+    ("2SA", "2 Samuel", OLD_TESTAMENT, [27, 32, 39, 12, 25, 23, 29, 18, 13, 19, 27, 31, 39, 33, 37, 23, 29, 33, 43, 26, 22, 51, 39, 25]),
+    ("1KI", "1 Kings", OLD_TESTAMENT, [53, 46, 28, 34, 18, 38, 51, 66, 28, 29, 43, 33, 34, 31, 34, 34, 24, 46, 21, 43, 29, 53]),
+    ("2KI", "2 Kings", OLD_TESTAMENT, [18, 25, 27, 44, 27, 33, 20, 29, 37, 36, 21, 21, 25, 29, 38, 20, 41, 37, 37, 21, 26, 20, 37, 20, 30]),
+    ("1CH", "1 Chronicles", OLD_TESTAMENT, [54, 55, 24, 43, 26, 81, 40, 40, 44, 14, 47, 40, 14, 17, 29, 43, 27, 17, 19, 8, 30, 19, 32, 31, 31, 32, 34, 21, 30]),
+    ("2CH", "2 Chronicles", OLD_TESTAMENT, [17, 18, 17, 22, 14, 42, 22, 18, 31, 19, 23, 16, 22, 15, 19, 14, 19, 34, 11, 37, 20, 12, 21, 27, 28, 23, 9, 27, 36, 27, 21, 33, 25, 33, 27, 23]),
+    ("EZR", "Ezra", OLD_TESTAMENT, [11, 70, 13, 24, 17, 22, 28, 36, 15, 44]),
+    ("NEH", "Nehemiah", OLD_TESTAMENT, [11, 20, 32, 23, 19, 19, 73, 18, 38, 39, 36, 47, 31]),
+    ("EST", "Esther", OLD_TESTAMENT, [22, 23, 15, 17, 14, 14, 10, 17, 32, 3]),
+    ("JOB", "Job", OLD_TESTAMENT, [22, 13, 26, 21, 27, 30, 21, 22, 35, 22, 20, 25, 28, 22, 35, 22, 16, 21, 29, 29, 34, 30, 17, 25, 6, 14, 23, 28, 25, 31, 40, 22, 33, 37, 16, 33, 24, 41, 30, 24, 34, 17]),
+    ("PSA", "Psalms", OLD_TESTAMENT, [6, 12, 8, 8, 12, 10, 17, 9, 20, 18, 7, 8, 6, 7, 5, 11, 15, 50, 14, 9, 13, 31, 6, 10, 22, 12, 14, 9, 11, 12, 24, 11, 22, 22, 28, 12, 40, 22, 13, 17, 13, 11, 5, 26, 17, 11, 9, 14, 20, 23, 19, 9, 6, 7, 23, 13, 11, 11, 17, 12, 8, 12, 11, 10, 13, 20, 7, 35, 36, 5, 24, 20, 28, 23, 10, 12, 20, 72, 13, 19, 16, 8, 18, 12, 13, 17, 7, 18, 52, 17, 16, 15, 5, 23, 11, 13, 12, 9, 9, 5, 8, 28, 22, 35, 45, 48, 43, 13, 31, 7, 10, 10, 9, 8, 18, 19, 2, 29, 176, 7, 8, 9, 4, 8, 5, 6, 5, 6, 8, 8, 3, 18, 3, 3, 21, 26, 9, 8, 24, 13, 10, 7, 12, 15, 21, 10, 20, 14, 9, 6]),
+    ("PRO", "Proverbs", OLD_TESTAMENT, [33, 22, 35, 27, 23, 35, 27, 36, 18, 32, 31, 28, 25, 35, 33, 33, 28, 24, 29, 30, 31, 29, 35, 34, 28, 28, 27, 28, 27, 33, 31]),
+    ("ECC", "Ecclesiastes", OLD_TESTAMENT, [18, 26, 22, 16, 20, 12, 29, 17, 18, 20, 10, 14]),
+    ("SNG", "Song of Solomon", OLD_TESTAMENT, [17, 17, 11, 16, 16, 13, 13, 14]),
+    ("ISA", "Isaiah", OLD_TESTAMENT, [31, 22, 26, 6, 30, 13, 25, 22, 21, 34, 16, 6, 22, 32, 9, 14, 14, 7, 25, 6, 17, 25, 18, 23, 12, 21, 13, 29, 24, 33, 9, 20, 24, 17, 10, 22, 38, 22, 8, 31, 29, 25, 28, 28, 25, 13, 15, 22, 26, 11, 23, 15, 12, 17, 13, 12, 21, 14, 21, 22, 11, 12, 19, 12, 25, 24]),
+    ("JER", "Jeremiah", OLD_TESTAMENT, [19, 37, 25, 31, 31, 30, 34, 22, 26, 25, 23, 17, 27, 22, 21, 21, 27, 23, 15, 18, 14, 30, 40, 10, 38, 24, 22, 17, 32, 24, 40, 44, 26, 22, 19, 32, 21, 28, 18, 16, 18, 22, 13, 30, 5, 28, 7, 47, 39, 46, 64, 34]),
+    ("LAM", "Lamentations", OLD_TESTAMENT, [22, 22, 66, 22, 22]),
+    ("EZK", "Ezekiel", OLD_TESTAMENT, [28, 10, 27, 17, 17, 14, 27, 18, 11, 22, 25, 28, 23, 23, 8, 63, 24, 32, 14, 49, 32, 31, 49, 27, 17, 21, 36, 26, 21, 26, 18, 32, 33, 31, 15, 38, 28, 23, 29, 49, 26, 20, 27, 31, 25, 24, 23, 35]),
+    ("DAN", "Daniel", OLD_TESTAMENT, [21, 49, 30, 37, 31, 28, 28, 27, 27, 21, 45, 13]),
+    ("HOS", "Hosea", OLD_TESTAMENT, [11, 23, 5, 19, 15, 11, 16, 14, 17, 15, 12, 14, 16, 9]),
+    ("JOL", "Joel", OLD_TESTAMENT, [20, 32, 21]),
+    ("AMO", "Amos", OLD_TESTAMENT, [15, 16, 15, 13, 27, 14, 17, 14, 15]),
+    ("OBAD", "Obadiah", OLD_TESTAMENT, [21]),
+    ("JON", "Jonah", OLD_TESTAMENT, [17, 10, 10, 11]),
+    ("MIC", "Micah", OLD_TESTAMENT, [16, 13, 12, 13, 15, 16, 20]),
+    ("NAM", "Nahum", OLD_TESTAMENT, [15, 13, 19]),
+    ("HAB", "Habakkuk", OLD_TESTAMENT, [17, 20, 19]),
+    ("ZEP", "Zephaniah", OLD_TESTAMENT, [18, 15, 20]),
+    ("HAG", "Haggai", OLD_TESTAMENT, [15, 23]),
+    ("ZEC", "Zechariah", OLD_TESTAMENT, [21, 13, 10, 14, 11, 15, 14, 23, 17, 12, 17, 14, 9, 21]),
+    ("MAL", "Malachi", OLD_TESTAMENT, [14, 17, 18, 6]),
+    ("MAT", "Matthew", NEW_TESTAMENT, [25, 23, 17, 25, 48, 34, 29, 34, 38, 42, 30, 50, 58, 36, 39, 28, 27, 35, 30, 34, 46, 46, 39, 51, 46, 75, 66, 20]),
+    ("MRK", "Mark", NEW_TESTAMENT, [45, 28, 35, 41, 43, 56, 37, 38, 50, 52, 33, 44, 37, 72, 47, 20]),
+    ("LUK", "Luke", NEW_TESTAMENT, [80, 52, 38, 44, 39, 49, 50, 56, 62, 42, 54, 59, 35, 35, 32, 31, 37, 43, 48, 47, 38, 71, 56, 53]),
+    ("JHN", "John", NEW_TESTAMENT, [51, 25, 36, 54, 47, 71, 53, 59, 41, 42, 57, 50, 38, 31, 27, 33, 26, 40, 42, 31, 25]),
+    ("ACT", "Acts", NEW_TESTAMENT, [26, 47, 26, 37, 42, 15, 60, 40, 43, 48, 30, 25, 52, 28, 41, 40, 34, 28, 41, 38, 40, 30, 35, 27, 27, 32, 44, 31]),
+    ("ROM", "Romans", NEW_TESTAMENT, [32, 29, 31, 25, 21, 23, 25, 39, 33, 21, 36, 21, 14, 23, 33, 27]),
+    ("1CO", "1 Corinthians", NEW_TESTAMENT, [31, 16, 23, 21, 13, 20, 40, 13, 27, 33, 34, 31, 13, 40, 58, 24]),
+    ("2CO", "2 Corinthians", NEW_TESTAMENT, [24, 17, 18, 18, 21, 18, 16, 24, 15, 18, 33, 21, 14]),
+    ("GAL", "Galatians", NEW_TESTAMENT, [24, 21, 29, 31, 26, 18]),
+    ("EPH", "Ephesians", NEW_TESTAMENT, [23, 22, 21, 32, 33, 24]),
+    ("PHP", "Philippians", NEW_TESTAMENT, [30, 30, 21, 23]),
+    ("COL", "Colossians", NEW_TESTAMENT, [29, 23, 25, 18]),
+    ("1TH", "1 Thessalonians", NEW_TESTAMENT, [10, 20, 13, 18, 28]),
+    ("2TH", "2 Thessalonians", NEW_TESTAMENT, [12, 17, 18]),
+    ("1TI", "1 Timothy", NEW_TESTAMENT, [20, 15, 16, 16, 25, 21]),
+    ("2TI", "2 Timothy", NEW_TESTAMENT, [18, 26, 17, 22]),
+    ("TIT", "Titus", NEW_TESTAMENT, [16, 15, 15]),
+    ("PHLM", "Philemon", NEW_TESTAMENT, [25]),
+    ("HEB", "Hebrews", NEW_TESTAMENT, [14, 18, 19, 16, 14, 20, 28, 13, 28, 39, 40, 29, 25]),
+    ("JAS", "James", NEW_TESTAMENT, [27, 26, 18, 17, 20]),
+    ("1PE", "1 Peter", NEW_TESTAMENT, [25, 25, 22, 19, 14]),
+    ("2PE", "2 Peter", NEW_TESTAMENT, [21, 22, 18]),
+    ("1JN", "1 John", NEW_TESTAMENT, [10, 29, 24, 21, 21]),
+    ("2JN", "2 John", NEW_TESTAMENT, [13]),
+    ("3JN", "3 John", NEW_TESTAMENT, [14]),
+    ("JUD", "Jude", NEW_TESTAMENT, [25]),
+    ("REV", "Revelation", NEW_TESTAMENT, [20, 29, 22, 11, 14, 17, 17, 13, 21, 11, 19, 17, 18, 20, 8, 21, 18, 24, 21, 15, 27, 21]),
+]
+
+# Common abbreviations and alternative names, beyond each book's name and
+# ID. Numbered books list their names without the ordinal; every ordinal
+# form in ORDINALS is prefixed to them.
+BOOK_ABBREVIATIONS: Dict[str, Tuple[str, ...]] = {
+    "GEN": ("Gen", "Ge", "Gn"),
+    "EXO": ("Exod", "Ex", "Exo"),
+    "LEV": ("Lev", "Le", "Lv"),
+    "NUM": ("Num", "Nu", "Nm", "Nb"),
+    "DEU": ("Deut", "De", "Dt"),
+    "JOS": ("Josh", "Jsh"),
+    "JDG": ("Judg", "Jdgs", "Jg"),
+    "RUT": ("Rth", "Ru"),
+    "1SA": ("Samuel", "Sam", "Sa", "Sm"),
+    "2SA": ("Samuel", "Sam", "Sa", "Sm"),
+    "1KI": ("Kings", "Kgs", "Kin", "Ki"),
+    "2KI": ("Kings", "Kgs", "Kin", "Ki"),
+    "1CH": ("Chronicles", "Chron", "Chr", "Ch"),
+    "2CH": ("Chronicles", "Chron", "Chr", "Ch"),
+    "EZR": ("Ezr",),
+    "NEH": ("Neh", "Ne"),
+    "EST": ("Esth", "Es"),
+    "JOB": ("Jb",),
+    "PSA": ("Psalm", "Ps", "Pslm", "Psm", "Pss"),
+    "PRO": ("Prov", "Pr", "Prv"),
+    "ECC": ("Eccles", "Eccle", "Eccl", "Ec", "Qoh", "Qoheleth"),
+    "SNG": ("Song", "Song of Songs", "Song of Sol", "SOS", "So", "Canticles", "Cant"),
+    "ISA": ("Is",),
+    "JER": ("Je", "Jr"),
+    "LAM": ("La",),
+    "EZK": ("Ezek", "Eze", "Ezk"),
+    "DAN": ("Da", "Dn"),
+    "HOS": ("Ho",),
+    "JOL": ("Joe", "Jl"),
+    "AMO": ("Am",),
+    "OBAD": ("Obad", "Ob", "Oba"),
+    "JON": ("Jnh",),
+    "MIC": ("Mc",),
+    "NAM": ("Nah", "Na"),
+    "HAB": ("Hb",),
+    "ZEP": ("Zeph", "Zp"),
+    "HAG": ("Hg",),
+    "ZEC": ("Zech", "Zc"),
+    "MAL": ("Ml",),
+    "MAT": ("Matt", "Mt"),
+    "MRK": ("Mar", "Mk", "Mr"),
+    "LUK": ("Luk", "Lk"),
+    "JHN": ("Joh", "Jn"),
+    "ACT": ("Ac",),
+    "ROM": ("Ro", "Rm"),
+    "1CO": ("Corinthians", "Cor", "Co"),
+    "2CO": ("Corinthians", "Cor", "Co"),
+    "GAL": ("Ga",),
+    "EPH": ("Ephes",),
+    "PHP": ("Phil", "Pp"),
+    "COL": ("Colos",),
+    "1TH": ("Thessalonians", "Thess", "Thes", "Th"),
+    "2TH": ("Thessalonians", "Thess", "Thes", "Th"),
+    "1TI": ("Timothy", "Tim", "Ti"),
+    "2TI": ("Timothy", "Tim", "Ti"),
+    "TIT": ("Ti",),
+    "PHLM": ("Philem", "Phm", "Pm"),
+    "HEB": ("He",),
+    "JAS": ("Jm",),
+    "1PE": ("Peter", "Pet", "Pe", "Pt"),
+    "2PE": ("Peter", "Pet", "Pe", "Pt"),
+    "1JN": ("John", "Jn", "Jhn", "Jo"),
+    "2JN": ("John", "Jn", "Jhn", "Jo"),
+    "3JN": ("John", "Jn", "Jhn", "Jo"),
+    "JUD": ("Jd",),
+    "REV": ("Rev", "Re", "Rv", "Revelations", "Apocalypse"),
+}
+
+# Ways of writing the ordinal of a numbered book (e.g., "1 John", "I John")
+ORDINALS: Dict[str, Tuple[str, ...]] = {
+    "1": ("1", "I", "1st", "First"),
+    "2": ("2", "II", "2nd", "Second"),
+    "3": ("3", "III", "3rd", "Third"),
+}
+
+
+# Word boundaries a reference may leave out, as in bible_data
+_BOOK_NAME_BREAKS = re.compile(r"(?<=[a-z])\.|(?<=[a-z])(?=\d)|(?<=\d)(?=[a-z])")
+
+
+def normalize_book_name(name: str) -> str:
+    """
+    Normalize a book name the way bible_data looks names up.
+    
+    Args:
+        name: Book name or abbreviation (e.g., "1Cor.", "Song  of Solomon")
+        
+    Returns:
+        Lowercase words separated by single spaces (e.g., "1 cor")
+    """
+    return " ".join(_BOOK_NAME_BREAKS.sub(" ", name.lower()).split())
+
+
+def build_book_index() -> Dict[str, str]:
+    """
+    Build the book name index from the book names and abbreviation tables.
+    
+    Returns:
+        Dictionary mapping every normalized name to its book ID
+        
+    Raises:
+        ValueError: If a name would resolve to two different books
+    """
+    index: Dict[str, str] = {}
+    for book_id, name, _, _ in BOOKS:
+        names = [book_id, name]
+        abbreviations = BOOK_ABBREVIATIONS.get(book_id, ())
+        ordinal = book_id[0]
+        if ordinal in ORDINALS:
+            stems = [name.split(" ", 1)[1], *abbreviations]
+            names += [f"{prefix} {stem}" for prefix in ORDINALS[ordinal] for stem in stems]
+        else:
+            names += abbreviations
+        
+        for alias in names:
+            key = normalize_book_name(alias)
+            if index.setdefault(key, book_id) != book_id:
+                raise ValueError(f"Ambiguous book name: {alias} ({index[key]} or {book_id})")
+    return index
+
+
+def render() -> str:
+    """
+    Render the contents of bible_tables.py.
+    
+    Returns:
+        Python source defining the tables
+    """
+    chapter_starts = []
+    ordinal = 0
+    for _, _, _, verses in BOOKS:
+        starts = [ordinal]
+        for count in verses:
+            ordinal += count
+            starts.append(ordinal)
+        chapter_starts.append(tuple(starts))
+    total_verses = ordinal
+    
+    testament_ranges = {}
+    for (_, _, testament, _), starts in zip(BOOKS, chapter_starts):
+        first, last = testament_ranges.get(testament, (starts[0], starts[-1]))
+        testament_ranges[testament] = (min(first, starts[0]), max(last, starts[-1]))
+    
+    book_index = build_book_index()
+    
+    lines = [
+        '"""',
+        "Precomputed Bible structure tables.",
+        "",
+        "Generated by generate_bible_tables.py; do not edit by hand.",
+        '"""',
+        "",
+        "# Book IDs, names and testaments in canonical order",
+        f"BOOK_IDS = {tuple(book[0] for book in BOOKS)!r}",
+        f"BOOK_NAMES = {tuple(book[1] for book in BOOKS)!r}",
+        f"BOOK_TESTAMENTS = {tuple(book[2] for book in BOOKS)!r}",
+        "",
+        "# Verses per chapter of each book",
+        "VERSE_COUNTS = (",
+        *(f"    {tuple(book[3])!r}," for book in BOOKS),
+        ")",
+        "",
+        "# Global ordinal of the first verse of each chapter of each book,",
+        "# followed by one past the book's last verse",
+        "CHAPTER_STARTS = (",
+        *(f"    {starts!r}," for starts in chapter_starts),
+        ")",
+        "",
+        f"TOTAL_VERSES = {total_verses!r}",
+        "",
+        "# Half-open ordinal range of each testament",
+        f"TESTAMENT_RANGES = {testament_ranges!r}",
+        "",
+        "# Normalized book names and abbreviations mapped to book IDs",
+        "BOOK_INDEX = {",
+        *(f"    {key!r}: {book_id!r}," for key, book_id in book_index.items()),
+        "}",
+        "",
+        "# Most words in any name in BOOK_INDEX",
+        f"MAX_BOOK_NAME_WORDS = {max(key.count(' ') + 1 for key in book_index)!r}",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Write bible_tables.py, by default next to this script.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--output", "-o",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "bible_tables.py"),
+        help="File to write (default: bible_tables.py next to this script)",
+    )
+    args = parser.parse_args(argv)
+    
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(render())
+    print(f"Wrote {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
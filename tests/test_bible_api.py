@@ -2,12 +2,18 @@
 Test suite for the Bible API client.
 """
 import asyncio
+import logging
+import threading
 import pytest
 import httpx
 from unittest.mock import patch, AsyncMock, MagicMock
 from typing import Dict, Any, Optional, List, Tuple
 
-from bible_api import BibleAPIClient
+from bible_api import (
+    BibleAPIClient, CircuitBreaker, CircuitOpenError, InvalidResponseError, RetryPolicy, TokenBucket,
+    _passage_key, _ranges_key
+)
+from bible_cache import SQLiteCache
 from bible_data import OLD_TESTAMENT, NEW_TESTAMENT
 
 # Mock responses for different test cases
@@ -170,11 +176,21 @@ def get_mock_response(url):
 
 # Mock AsyncClient for httpx
 class MockAsyncClient:
+    instances = 0
+    
+    def __init__(self, *args, **kwargs):
+        MockAsyncClient.instances += 1
+        self.kwargs = kwargs
+        self.closed = False
+    
     async def __aenter__(self):
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         pass
+    
+    async def aclose(self):
+        self.closed = True
         
     async def get(self, url):
         # Check for invalid references explicitly
@@ -322,3 +338,510 @@ async def test_list_translations():
     # Check if default translation exists
     default_translations = [t for t in translations if t.get('default')]
     assert len(default_translations) > 0
+
+@pytest.mark.asyncio
+@patch('httpx.AsyncClient', MockAsyncClient)
+async def test_pooled_http_client():
+    """Test that one pooled HTTP client is reused until the client is closed."""
+    client = BibleAPIClient(max_connections=4, timeout=5.0)
+    created_before = MockAsyncClient.instances
+    
+    await client.get_by_book_chapter_verse("web", "JHN", 3, 16)
+    await client.get_by_book_chapter_verse("web", "JHN", 3)
+    assert MockAsyncClient.instances == created_before + 1
+    
+    http_client = client._http_client
+    assert http_client.kwargs["limits"].max_connections == 4
+    
+    await client.aclose()
+    assert http_client.closed
+    assert client._http_client is None
+
+@pytest.mark.asyncio
+async def test_token_bucket_serializes_concurrent_callers():
+    """Test that concurrent callers are released one token at a time in FIFO order."""
+    limiter = TokenBucket(rate=50.0, burst=1)
+    order = []
+    
+    async def caller(i):
+        waited = await limiter.acquire()
+        order.append(i)
+        return waited
+    
+    waits = await asyncio.gather(*(caller(i) for i in range(5)))
+    
+    assert order == [0, 1, 2, 3, 4]
+    assert waits[0] < 0.01
+    # Each later caller waits roughly one refill interval longer than the last
+    assert waits[4] >= 0.07
+    assert limiter.acquisitions == 5
+    assert limiter.total_wait == pytest.approx(sum(waits))
+    
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+@pytest.mark.asyncio
+@patch('httpx.AsyncClient', MockAsyncClient)
+async def test_rate_limiter_shared_and_reported(caplog):
+    """Test that clients share one limiter and log each request's queue wait."""
+    assert BibleAPIClient()._rate_limiter is BibleAPIClient()._rate_limiter
+    
+    limiter = TokenBucket(rate=20.0, burst=1)
+    client = BibleAPIClient(rate_limiter=limiter)
+    with caplog.at_level(logging.DEBUG, logger="bible_api"):
+        await client.get_by_book_chapter_verse("web", "JHN", 3, 16)
+        await client.get_by_book_chapter_verse("kjv", "JHN", 3, 16)
+    
+    assert limiter.acquisitions == 2
+    waits = [record for record in caplog.records if "rate limiter queue" in record.getMessage()]
+    assert len(waits) == 2
+    assert waits[1].args[0] > 0
+    assert "translation=kjv" in waits[1].args[1]
+
+@pytest.mark.asyncio
+async def test_response_cache_normalizes_references():
+    """Test that equivalent references share one cached response."""
+    client = BibleAPIClient(rate_limiter=TokenBucket(rate=1000.0, burst=10))
+    client._make_request = AsyncMock(return_value=MOCK_RESPONSES["john_3_16"])
+    
+    for reference in ("John 3:16", "john 3:16", "JHN 3:16", "Jn 3:16"):
+        result = await client.get_verse_by_reference(reference, "web")
+        assert result["reference"] == "John 3:16"
+    await client.get_by_book_chapter_verse("web", "JHN", 3, 16)
+    assert client._make_request.await_count == 1
+    
+    # A different translation is a different entry
+    await client.get_verse_by_reference("John 3:16", "kjv")
+    assert client._make_request.await_count == 2
+
+@pytest.mark.asyncio
+async def test_invalid_requests_rejected_before_network():
+    """Test that bad references and translations never reach the API."""
+    client = BibleAPIClient(rate_limiter=TokenBucket(rate=1000.0, burst=10))
+    client._make_request = AsyncMock(return_value=MOCK_RESPONSES["john_3_16"])
+    
+    for reference, translation, message in (
+        ("Hezekiah 1:1", "web", "Unknown book"),
+        ("John 22:1", "web", "Invalid chapter: 22 does not exist in John"),
+        ("John 3:37", "web", "Invalid verse: 37 does not exist in John 3"),
+        ("John 3:16-14", "web", "Reference does not exist"),
+        ("John 3:16", "nope", "Invalid translation: nope"),
+    ):
+        with pytest.raises(ValueError, match=message):
+            await client.get_verse_by_reference(reference, translation)
+    with pytest.raises(ValueError, match="Invalid translation"):
+        await client.get_by_book_chapter_verse("nope", "JHN", 3, 16)
+    client._make_request.assert_not_awaited()
+    
+    # Valid references are requested in normalized form
+    await client.get_verse_by_reference("Jn 3:16", "KJV")
+    assert client._make_request.await_args.args[0].endswith("/John 3:16?translation=KJV")
+
+@pytest.mark.asyncio
+async def test_persistent_cache_survives_restart(tmp_path):
+    """Test that a new client serves responses cached by a previous one."""
+    path = str(tmp_path / "cache.db")
+    limiter = TokenBucket(rate=1000.0, burst=10)
+    
+    first = BibleAPIClient(rate_limiter=limiter, persistent_cache=SQLiteCache(path))
+    first._make_request = AsyncMock(return_value=MOCK_RESPONSES["john_3_16"])
+    await first.get_verse_by_reference("John 3:16", "web")
+    await first.aclose()
+    
+    second = BibleAPIClient(rate_limiter=limiter, persistent_cache=SQLiteCache(path))
+    second._make_request = AsyncMock(side_effect=AssertionError("should not hit the network"))
+    result = await second.get_by_book_chapter_verse("web", "JHN", 3, 16)
+    assert result["text"] == MOCK_RESPONSES["john_3_16"]["text"]
+    await second.aclose()
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_are_coalesced():
+    """Test that identical in-flight requests share one upstream call and its errors."""
+    client = BibleAPIClient(rate_limiter=TokenBucket(rate=1000.0, burst=10))
+    
+    async def slow_response(url):
+        await asyncio.sleep(0.05)
+        return MOCK_RESPONSES["john_3_16"]
+    
+    client._make_request = AsyncMock(side_effect=slow_response)
+    results = await asyncio.gather(
+        client.get_verse_by_reference("John 3:16", "web"),
+        client.get_verse_by_reference("john 3:16", "web"),
+        client.get_by_book_chapter_verse("web", "JHN", 3, 16),
+    )
+    assert client._make_request.await_count == 1
+    assert all(result is results[0] for result in results)
+    assert not client._inflight
+    
+    async def failing_response(url):
+        await asyncio.sleep(0.05)
+        raise ValueError("Reference not found")
+    
+    client._make_request = AsyncMock(side_effect=failing_response)
+    results = await asyncio.gather(
+        client.get_by_book_chapter_verse("web", "GEN", 1, 1),
+        client.get_by_book_chapter_verse("web", "GEN", 1, 1),
+        return_exceptions=True,
+    )
+    assert client._make_request.await_count == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+@pytest.mark.asyncio
+async def test_chapter_mode_reuses_cached_chapter():
+    """Test that verse lookups in chapter mode are sliced from one chapter fetch."""
+    client = BibleAPIClient(rate_limiter=TokenBucket(rate=1000.0, burst=10), chapter_mode=True)
+    client._make_request = AsyncMock(return_value=MOCK_RESPONSES["matthew_5_3_10"])
+    
+    result = await client.get_by_book_chapter_verse("web", "MAT", 5, 4)
+    assert result["reference"] == "Matthew 5:4"
+    assert [v["verse"] for v in result["verses"]] == [4]
+    assert result["translation_name"] == "World English Bible"
+    
+    result = await client.get_verse_by_reference("Matthew 5:6-8", "web")
+    assert result["reference"] == "Matthew 5:6-8"
+    assert [v["verse"] for v in result["verses"]] == [6, 7, 8]
+    assert "merciful" in result["text"]
+    
+    assert client._make_request.await_count == 1
+    assert client._make_request.await_args.args[0].endswith("/MAT 5?translation=web")
+
+@pytest.mark.asyncio
+async def test_single_chapter_book_fetches_whole_chapter():
+    """Test that a single-chapter book's chapter is requested with its full verse range."""
+    client = BibleAPIClient(rate_limiter=TokenBucket(rate=1000.0, burst=10))
+    client._make_request = AsyncMock(return_value=MOCK_RESPONSES["jude_1"])
+    
+    await client.get_by_book_chapter_verse("web", "JUD", 1)
+    assert client._make_request.await_args.args[0].endswith("/JUD 1:1-25?translation=web")
+
+def verse_list_response(url):
+    """Build a response for a comma-list reference like "/JHN 3:16,5:2?translation=web"."""
+    reference = url.split("/")[-1].split("?")[0]
+    book_id, verse_list = reference.split(" ")
+    verses = []
+    for item in verse_list.split(","):
+        chapter, verse = item.split(":")
+        verses.append({
+            "book_id": book_id, "book_name": book_id, "chapter": int(chapter),
+            "verse": int(verse), "text": f"{book_id} {chapter}:{verse} text\n",
+        })
+    return {
+        "reference": reference,
+        "verses": verses,
+        "text": "".join(v["text"] for v in verses),
+        "translation_id": "web",
+        "translation_name": "World English Bible",
+    }
+
+@pytest.mark.asyncio
+async def test_random_verses_batched_by_book():
+    """Test that random verses are fetched with one request per book and then cached."""
+    from bible_data import ordinal_to_verse, sample_ordinals
+    client = BibleAPIClient(rate_limiter=TokenBucket(rate=1000.0, burst=10))
+    client._make_request = AsyncMock(side_effect=verse_list_response)
+    
+    expected = [ordinal_to_verse(o) for o in sample_ordinals(50, seed=7)]
+    results = await client.get_random_verses(50, "web", seed=7)
+    
+    assert [(v["verses"][0]["book_id"], v["verses"][0]["chapter"], v["verses"][0]["verse"])
+            for v in results] == expected
+    assert results[0]["reference"].endswith(f"{expected[0][1]}:{expected[0][2]}")
+    assert client._make_request.await_count == len({book for book, _, _ in expected})
+    
+    # The same sample is now served entirely from the cache
+    client._make_request.reset_mock()
+    assert await client.get_random_verses(50, "web", seed=7) == results
+    client._make_request.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_concurrent_random_verses_share_requests():
+    """Test that concurrent identical verse lists are coalesced onto one request per book."""
+    from bible_data import ordinal_to_verse, sample_ordinals
+    client = BibleAPIClient(rate_limiter=TokenBucket(rate=1000.0, burst=10))
+    client._make_request = AsyncMock(side_effect=verse_list_response)
+    
+    books = {ordinal_to_verse(o)[0] for o in sample_ordinals(20, seed=3)}
+    first, second = await asyncio.gather(
+        client.get_random_verses(20, "web", seed=3),
+        client.get_random_verses(20, "web", seed=3),
+    )
+    assert first == second
+    assert client._make_request.await_count == len(books)
+
+@pytest.mark.asyncio
+async def test_random_verses_reuse_cached_chapter():
+    """Test that random verses in an already cached chapter need no request."""
+    client = BibleAPIClient(rate_limiter=TokenBucket(rate=1000.0, burst=10))
+    client._make_request = AsyncMock(return_value=MOCK_RESPONSES["matthew_5_3_10"])
+    await client.get_by_book_chapter_verse("web", "MAT", 5)
+    client._make_request.reset_mock()
+    
+    from bible_data import verse_to_ordinal
+    with patch("bible_api.sample_ordinals", return_value=[verse_to_ordinal("MAT", 5, 4)]):
+        results = await client.get_random_verses(1, "web")
+    assert results[0]["reference"] == "Matthew 5:4"
+    client._make_request.assert_not_awaited()
+
+def verse_list_response_for_ranges(url):
+    """Build a response for a normalized single-book reference like "/John 3:1-20"."""
+    from bible_data import ordinal_to_verse, parse_passage
+    reference = url.split("/")[-1].split("?")[0]
+    ordinals = [o for start, stop in parse_passage(reference) for o in range(start, stop)]
+    verses = []
+    for ordinal in ordinals:
+        book_id, chapter, verse = ordinal_to_verse(ordinal)
+        verses.append({
+            "book_id": book_id, "book_name": book_id, "chapter": chapter,
+            "verse": verse, "text": f"{book_id} {chapter}:{verse} text\n",
+        })
+    return {
+        "reference": reference,
+        "verses": verses,
+        "text": "".join(v["text"] for v in verses),
+        "translation_id": "web",
+        "translation_name": "World English Bible",
+    }
+
+@pytest.mark.asyncio
+async def test_get_passages_merges_overlapping_requests():
+    """Test that overlapping passages are fetched once and split back per caller."""
+    client = BibleAPIClient(rate_limiter=TokenBucket(rate=1000.0, burst=10))
+    client._make_request = AsyncMock(side_effect=verse_list_response_for_ranges)
+    
+    results = await client.get_passages(["John 3:1-10", "John 3:5-20", "John 3:16", "Rom 5:8"], "web")
+    
+    # One request per book, covering the union of the passages
+    urls = sorted(call.args[0] for call in client._make_request.await_args_list)
+    assert [url.split("/")[-1] for url in urls] == ["John 3:1-20?translation=web", "Romans 5:8?translation=web"]
+    
+    assert [r["reference"] for r in results] == ["John 3:1-10", "John 3:5-20", "John 3:16", "Romans 5:8"]
+    assert [v["verse"] for v in results[1]["verses"]] == list(range(5, 21))
+    assert results[2]["text"] == "JHN 3:16 text\n"
+    
+    # Repeating a passage is served from the cache
+    client._make_request.reset_mock()
+    assert (await client.get_passages(["John 3:16"], "web"))[0] == results[2]
+    client._make_request.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_persistent_cache_writes_are_batched(tmp_path):
+    """Test that persistent cache writes are batched and do not hold up responses."""
+    from bible_data import parse_passage
+    
+    path = str(tmp_path / "cache.db")
+    cache = SQLiteCache(path)
+    batches = []
+    write_started = threading.Event()
+    release_writes = threading.Event()
+    set_many = cache.set_many
+    
+    def slow_set_many(items):
+        batches.append([key for key, _ in items])
+        if not write_started.is_set():
+            # Hold up the first write until the response has been returned
+            write_started.set()
+            release_writes.wait(5)
+        set_many(items)
+    
+    cache.set_many = slow_set_many
+    client = BibleAPIClient(rate_limiter=TokenBucket(rate=1000.0, burst=10), persistent_cache=cache)
+    client._make_request = AsyncMock(side_effect=verse_list_response)
+    
+    # Random verses are returned while their writes are still blocked
+    verses = await client.get_random_verses(30, "web", seed=5)
+    assert len(verses) == 30
+    assert await asyncio.to_thread(write_started.wait, 5)
+    assert client._cache_writes
+    release_writes.set()
+    
+    # Each book's verse list, then all its single verses, in one write each
+    books = client._make_request.await_count
+    await client.aclose()
+    assert not client._cache_writes
+    assert len(batches) == 2 * books
+    assert sum(len(batch) for batch in batches) == books + 30
+    
+    # Passages assembled from fetched verses are persisted too
+    batches.clear()
+    client._make_request = AsyncMock(side_effect=verse_list_response_for_ranges)
+    await client.get_passages(["John 3:1-3", "John 3:2-5"], "web")
+    await client.aclose()
+    keys = [_ranges_key("web", parse_passage(reference)) for reference in ("John 3:1-3", "John 3:2-5")]
+    assert keys in batches
+    
+    reopened = SQLiteCache(path)
+    assert all(reopened.get(key) is not None for key in keys)
+    reopened.close()
+
+@pytest.mark.asyncio
+async def test_passages_use_translation_versification():
+    """Test that a translation's own verse numbering is requested and mapped back."""
+    client = BibleAPIClient(rate_limiter=TokenBucket(rate=1000.0, burst=10))
+    client._make_request = AsyncMock(return_value={
+        "reference": "Psalms 22:1-6",
+        "verses": [
+            {"book_id": "PSA", "book_name": "Psalms", "chapter": 22, "verse": v, "text": f"DRA 22:{v}\n"}
+            for v in range(1, 7)
+        ],
+        "text": "".join(f"DRA 22:{v}\n" for v in range(1, 7)),
+        "translation_id": "dra",
+    })
+    
+    results = await client.get_passages(["Psalm 23:1-3", "Psalm 23:4-6"], "dra")
+    
+    # The Douay-Rheims numbers Psalm 23 as Psalm 22
+    client._make_request.assert_awaited_once()
+    assert client._make_request.await_args.args[0].endswith("/Psalms 22:1-6?translation=dra")
+    assert [v["text"] for v in results[1]["verses"]] == ["DRA 22:4\n", "DRA 22:5\n", "DRA 22:6\n"]
+
+@pytest.mark.asyncio
+async def test_multi_book_reference_fetched_per_book():
+    """Test that a reference spanning books is requested one book at a time."""
+    client = BibleAPIClient(rate_limiter=TokenBucket(rate=1000.0, burst=10))
+    client._make_request = AsyncMock(side_effect=verse_list_response_for_ranges)
+    
+    result = await client.get_verse_by_reference("John 3:16; Rom 5:8", "web")
+    assert result["reference"] == "John 3:16; Romans 5:8"
+    assert [v["book_id"] for v in result["verses"]] == ["JHN", "ROM"]
+    assert client._make_request.await_count == 2
+
+class ScriptedHTTPClient:
+    """HTTP client returning a scripted sequence of responses or exceptions."""
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+    
+    async def get(self, url):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        if isinstance(outcome, httpx.Response):
+            return outcome
+        status, headers = outcome
+        request = httpx.Request("GET", url)
+        return httpx.Response(status, headers=headers, json=MOCK_RESPONSES["john_3_16"], request=request)
+    
+    async def aclose(self):
+        pass
+
+def make_retry_client(http_client, attempts=4, breaker=None):
+    """Create a client with fast retries and its own circuit breaker."""
+    client = BibleAPIClient(
+        rate_limiter=TokenBucket(rate=1000.0, burst=10),
+        retry_policy=RetryPolicy(attempts=attempts, base_delay=0.001),
+        circuit_breaker=breaker or CircuitBreaker(),
+    )
+    client._http_client = http_client
+    return client
+
+def test_retry_policy_delays():
+    """Test backoff, jitter bounds and Retry-After handling."""
+    policy = RetryPolicy(attempts=3, base_delay=1.0, max_delay=10.0)
+    
+    assert 0 <= policy.delay(0) <= 1.0
+    assert 0 <= policy.delay(1) <= 2.0
+    assert policy.delay(2) is None
+    
+    request = httpx.Request("GET", "https://bible-api.com/john 3:16")
+    response = httpx.Response(429, headers={"Retry-After": "3"}, request=request)
+    assert policy.delay(0, response) == 3.0
+    response = httpx.Response(429, headers={"Retry-After": "3600"}, request=request)
+    assert policy.delay(0, response) is None
+    response = httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, request=request)
+    assert policy.delay(0, response) == 0.0
+
+@pytest.mark.asyncio
+async def test_make_request_retries_transient_failures():
+    """Test that 429s, 5xx and network errors are retried."""
+    http_client = ScriptedHTTPClient(
+        (429, {"Retry-After": "0"}),
+        (503, {}),
+        httpx.ConnectError("connection reset"),
+        (200, {}),
+    )
+    client = make_retry_client(http_client)
+    
+    result = await client._make_request("https://bible-api.com/john 3:16")
+    assert result["reference"] == "John 3:16"
+    assert http_client.calls == 4
+    
+    # Errors that are not transient are not retried
+    http_client = ScriptedHTTPClient((400, {}))
+    client = make_retry_client(http_client)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client._make_request("https://bible-api.com/john 3:16")
+    assert http_client.calls == 1
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_fails_fast_and_serves_stale():
+    """Test that an open circuit fails fast and falls back to expired cache entries."""
+    clock_time = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=lambda: clock_time[0])
+    http_client = ScriptedHTTPClient(*([(503, {})] * 4))
+    client = make_retry_client(http_client, attempts=2, breaker=breaker)
+    
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            await client._make_request("https://bible-api.com/john 3:16")
+    assert breaker.state == CircuitBreaker.OPEN
+    
+    with pytest.raises(CircuitOpenError):
+        await client._make_request("https://bible-api.com/john 3:16")
+    assert http_client.calls == 4
+    
+    # An expired cache entry is served while the circuit is open
+    client._cache._entries[_passage_key("web", "JHN", 3, 16)] = (-1.0, MOCK_RESPONSES["john_3_16"])
+    result = await client.get_by_book_chapter_verse("web", "JHN", 3, 16)
+    assert result["reference"] == "John 3:16"
+    
+    # After the reset timeout a successful probe closes the circuit
+    clock_time[0] = 31
+    client._http_client = ScriptedHTTPClient((200, {}))
+    await client._make_request("https://bible-api.com/john 3:16")
+    assert breaker.state == CircuitBreaker.CLOSED
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_releases_circuit():
+    """Test that a probe cancelled while backing off lets the next request probe."""
+    clock_time = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=lambda: clock_time[0])
+    breaker.record_failure()
+    clock_time[0] = 31
+    client = make_retry_client(ScriptedHTTPClient((503, {"Retry-After": "1"})), breaker=breaker)
+    
+    probe = asyncio.create_task(client._make_request("https://bible-api.com/john 3:16"))
+    while client._http_client.calls == 0:
+        await asyncio.sleep(0)
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+    
+    client._http_client = ScriptedHTTPClient((200, {}))
+    await client._make_request("https://bible-api.com/john 3:16")
+    assert breaker.state == CircuitBreaker.CLOSED
+
+@pytest.mark.asyncio
+async def test_undecodable_response_is_not_a_circuit_failure():
+    """Test that a bad response body is its own error and leaves the circuit alone."""
+    clock_time = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=lambda: clock_time[0])
+    request = httpx.Request("GET", "https://bible-api.com/john 3:16")
+    client = make_retry_client(
+        ScriptedHTTPClient(httpx.Response(200, content=b"<html>", request=request)), breaker=breaker
+    )
+    
+    with pytest.raises(InvalidResponseError) as excinfo:
+        await client._make_request("https://bible-api.com/john 3:16")
+    assert not isinstance(excinfo.value, ValueError)
+    assert breaker.state == CircuitBreaker.CLOSED
+    
+    # Unexpected errors give up a half-open probe without reopening the circuit
+    breaker.record_failure()
+    clock_time[0] = 31
+    client._http_client = ScriptedHTTPClient(RuntimeError("bug"), (200, {}))
+    with pytest.raises(RuntimeError):
+        await client._make_request("https://bible-api.com/john 3:16")
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    await client._make_request("https://bible-api.com/john 3:16")
+    assert breaker.state == CircuitBreaker.CLOSED
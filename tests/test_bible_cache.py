@@ -0,0 +1,138 @@
+"""
+Test suite for the Bible response caches.
+"""
+import logging
+
+import pytest
+
+from bible_cache import LRUCache, SQLiteCache
+
+
+class FakeClock:
+    """Manually advanced clock for expiry tests."""
+    def __init__(self):
+        self.now = 0.0
+        
+    def __call__(self):
+        return self.now
+
+def test_lru_cache_eviction():
+    """Test that the least recently used entry is evicted first."""
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    
+    # Touch "a" so that "b" becomes the oldest entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.hits == 3
+    assert cache.misses == 1
+
+def test_lru_cache_ttl():
+    """Test that entries expire after their time-to-live."""
+    clock = FakeClock()
+    cache = LRUCache(maxsize=10, ttl=60, clock=clock)
+    cache.set("a", 1)
+    
+    clock.now = 59
+    assert cache.get("a") == 1
+    
+    clock.now = 61
+    assert cache.get("a") is None
+    
+    # Expired entries can still be served as a fallback
+    assert cache.get("a", allow_stale=True) == 1
+
+def test_lru_cache_disabled_and_invalid():
+    """Test a zero-size cache and invalid settings."""
+    cache = LRUCache(maxsize=0)
+    cache.set("a", 1)
+    assert cache.get("a", "missing") == "missing"
+    
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=-1)
+    with pytest.raises(ValueError):
+        LRUCache(ttl=0)
+
+def test_sqlite_cache_persists(tmp_path):
+    """Test that entries survive reopening the database."""
+    path = str(tmp_path / "cache.db")
+    cache = SQLiteCache(path)
+    cache.set("web|JHN|3|16", {"reference": "John 3:16", "text": "For God so loved the world"})
+    cache.close()
+    
+    reopened = SQLiteCache(path)
+    assert reopened.get("web|JHN|3|16")["reference"] == "John 3:16"
+    assert reopened.get("web|JHN|3|17") is None
+    mode = reopened._connect().execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+    reopened.close()
+
+def test_sqlite_cache_eviction_and_ttl(tmp_path):
+    """Test least-recently-used eviction and expiry."""
+    clock = FakeClock()
+    cache = SQLiteCache(str(tmp_path / "cache.db"), max_entries=2, ttl=100, clock=clock)
+    
+    for i, key in enumerate(("a", "b", "c")):
+        clock.now = i
+        cache.set(key, {"n": i})
+    clock.now = 3
+    assert cache.get("a") is not None  # Touch "a" so that "b" is the oldest
+    cache.evict()
+    
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("c") == {"n": 2}
+    
+    clock.now = 200
+    assert cache.get("c") is None
+    assert cache.get("c", allow_stale=True) == {"n": 2}
+    cache.close()
+
+def test_sqlite_cache_batches_access_times(tmp_path):
+    """Test that reads only record access times until the next write."""
+    clock = FakeClock()
+    cache = SQLiteCache(str(tmp_path / "cache.db"), clock=clock)
+    cache.set("a", {"n": 1})
+    
+    clock.now = 5
+    assert cache.get("a") == {"n": 1}
+    query = "SELECT accessed_at FROM responses WHERE key = 'a'"
+    assert cache._connect().execute(query).fetchone()[0] == 0
+    
+    cache.set("b", {"n": 2})
+    assert cache._connect().execute(query).fetchone()[0] == 5
+    cache.close()
+
+def test_sqlite_cache_errors_are_misses(tmp_path, caplog):
+    """Test that a locked database is logged and treated as a miss or skipped write."""
+    import sqlite3
+    
+    class LockedConnection:
+        def execute(self, *args):
+            raise sqlite3.OperationalError("database is locked")
+        
+        def close(self):
+            pass
+    
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    cache.set("a", {"n": 1})
+    cache._conn.close()
+    cache._conn = LockedConnection()
+    with caplog.at_level(logging.WARNING, logger="bible_cache"):
+        assert cache.get("a") is None
+        cache.set("b", {"n": 2})
+    
+    assert len(caplog.records) == 2
+    assert all("locked" in record.getMessage() for record in caplog.records)
+    cache.close()
+    
+    reopened = SQLiteCache(str(tmp_path / "cache.db"))
+    assert reopened.get("a") == {"n": 1}
+    assert reopened.get("b") is None
+    reopened.close()
@@ -1,10 +1,13 @@
 """
 Test suite for the Bible data module.
 """
+import os
+import random
 import pytest
 from typing import Dict, List, Optional, Tuple, Union, Any
 
 import bible_data
+import generate_bible_tables
 
 def test_single_chapter_books():
     """Test single chapter books data."""
@@ -161,3 +164,258 @@ def test_parse_reference():
     # Test invalid chapter/verse
     with pytest.raises(ValueError):
         bible_data.parse_reference("John 999:1")
+
+def test_get_verse_count():
+    """Test chapter verse counts."""
+    assert bible_data.get_verse_count("JHN", 3) == 36
+    assert bible_data.get_verse_count("JUD", 1) == 25
+    
+    with pytest.raises(ValueError):
+        bible_data.get_verse_count("JHN", 22)
+    with pytest.raises(ValueError):
+        bible_data.get_verse_count("INVALID", 1)
+
+def test_parse_verse_range():
+    """Test parsing references within a single chapter."""
+    assert bible_data.parse_verse_range("John 3") == ("JHN", 3, None, None)
+    assert bible_data.parse_verse_range("john 3:16") == ("JHN", 3, 16, 16)
+    assert bible_data.parse_verse_range("1 John 3:16-18") == ("1JN", 3, 16, 18)
+    
+    # Bare numbers in single-chapter books are verses
+    assert bible_data.parse_verse_range("Jude 5") == ("JUD", 1, 5, 5)
+    
+    # Test invalid ranges
+    with pytest.raises(ValueError):
+        bible_data.parse_verse_range("John 3:18-16")
+    with pytest.raises(ValueError):
+        bible_data.parse_verse_range("John 3:16-99")
+    
+    # Passages parse_passage accepts but that span chapters are refused
+    with pytest.raises(ValueError, match="within one chapter"):
+        bible_data.parse_verse_range("Gen 1-2")
+    assert bible_data.passage_verse_range(bible_data.parse_passage("Gen 1:31-2:1")) is None
+    assert bible_data.passage_verse_range(bible_data.parse_passage("Jude 1-25")) == ("JUD", 1, 1, 25)
+
+def test_verse_ordinal_index():
+    """Test conversions between references and global verse ordinals."""
+    assert bible_data.TOTAL_VERSES == 31102
+    assert bible_data.verse_to_ordinal("GEN", 1, 1) == 0
+    assert bible_data.verse_to_ordinal("GEN", 2, 1) == 31
+    assert bible_data.verse_to_ordinal("REV", 22, 21) == bible_data.TOTAL_VERSES - 1
+    
+    # Round-trip every chapter boundary
+    for book_id in bible_data.BOOK_IDS:
+        for chapter in range(1, bible_data.BIBLE_DATA[book_id]["chapters"] + 1):
+            last = bible_data.get_verse_count(book_id, chapter)
+            for verse in (1, last):
+                ordinal = bible_data.verse_to_ordinal(book_id, chapter, verse)
+                assert bible_data.ordinal_to_verse(ordinal) == (book_id, chapter, verse)
+    
+    # Test invalid references and ordinals
+    with pytest.raises(ValueError):
+        bible_data.verse_to_ordinal("GEN", 1, 32)
+    with pytest.raises(ValueError):
+        bible_data.verse_to_ordinal("GEN", 51, 1)
+    with pytest.raises(ValueError):
+        bible_data.verse_to_ordinal("INVALID", 1, 1)
+    with pytest.raises(ValueError):
+        bible_data.ordinal_to_verse(bible_data.TOTAL_VERSES)
+
+def test_ordinal_ranges():
+    """Test ordinal ranges of chapters, books and testaments."""
+    assert bible_data.chapter_ordinal_range("GEN", 1) == (0, 31)
+    assert bible_data.book_ordinal_range("JUD") == (
+        bible_data.verse_to_ordinal("JUD", 1, 1), bible_data.verse_to_ordinal("JUD", 1, 25) + 1
+    )
+    
+    ot_start, ot_stop = bible_data.testament_ordinal_range(bible_data.OLD_TESTAMENT)
+    nt_start, nt_stop = bible_data.testament_ordinal_range(bible_data.NEW_TESTAMENT)
+    assert ot_start == 0
+    assert ot_stop == nt_start == bible_data.verse_to_ordinal("MAT", 1, 1)
+    assert nt_stop == bible_data.TOTAL_VERSES
+    
+    with pytest.raises(ValueError):
+        bible_data.testament_ordinal_range("INVALID")
+    with pytest.raises(ValueError):
+        bible_data.chapter_ordinal_range("JHN", 22)
+
+def test_random_sampling_is_uniform_over_verses():
+    """Test that random references weight books by their number of verses."""
+    rng = random.Random(1234)
+    draws = 20000
+    psalms = bible_data.book_ordinal_range("PSA")
+    jude = bible_data.book_ordinal_range("JUD")
+    psalms_hits = jude_hits = 0
+    for _ in range(draws):
+        ordinal = bible_data.get_random_ordinal(rng=rng)
+        psalms_hits += psalms[0] <= ordinal < psalms[1]
+        jude_hits += jude[0] <= ordinal < jude[1]
+    
+    # Psalms has ~2461 of 31102 verses, Jude only 25
+    assert 0.07 < psalms_hits / draws < 0.09
+    assert jude_hits < 0.005 * draws
+    
+    # Testament filters stay within their range
+    nt_start, nt_stop = bible_data.testament_ordinal_range(bible_data.NEW_TESTAMENT)
+    for _ in range(100):
+        assert nt_start <= bible_data.get_random_ordinal(bible_data.NEW_TESTAMENT, rng) < nt_stop
+
+def test_random_reference_seed():
+    """Test that a seed makes random references reproducible."""
+    first = bible_data.get_random_reference(seed=42)
+    assert bible_data.get_random_reference(seed=42) == first
+    assert bible_data.parse_verse_range(first)
+    
+    with pytest.raises(ValueError):
+        bible_data.get_random_reference(testament="INVALID")
+
+def test_sample_ordinals():
+    """Test that sampled verse ordinals are distinct, bounded and reproducible."""
+    sample = bible_data.sample_ordinals(50, bible_data.OLD_TESTAMENT, seed=3)
+    assert len(set(sample)) == 50
+    start, stop = bible_data.testament_ordinal_range(bible_data.OLD_TESTAMENT)
+    assert all(start <= o < stop for o in sample)
+    assert bible_data.sample_ordinals(50, bible_data.OLD_TESTAMENT, seed=3) == sample
+    
+    with pytest.raises(ValueError):
+        bible_data.sample_ordinals(0)
+    with pytest.raises(ValueError):
+        bible_data.sample_ordinals(bible_data.TOTAL_VERSES + 1)
+
+def test_match_book_aliases():
+    """Test that names, abbreviations and ordinal forms resolve to book IDs."""
+    cases = {
+        "John 3:16": ("JHN", "3:16"),
+        "jn 3:16": ("JHN", "3:16"),
+        "JHN 3:16": ("JHN", "3:16"),
+        "1 John 3:16": ("1JN", "3:16"),
+        "1Jn 3:16": ("1JN", "3:16"),
+        "I John 3:16": ("1JN", "3:16"),
+        "First John 3:16": ("1JN", "3:16"),
+        "1Cor 13:4": ("1CO", "13:4"),
+        "2 Cor. 5:17": ("2CO", "5:17"),
+        "Song of Solomon 2:1": ("SNG", "2:1"),
+        "Song of Songs 2:1": ("SNG", "2:1"),
+        "Gen.1:1": ("GEN", "1:1"),
+        "Ps 23": ("PSA", "23"),
+        "Isa 53:5": ("ISA", "53:5"),
+        "I Sa 3:1": ("1SA", "3:1"),
+        "Jude 5": ("JUD", "5"),
+    }
+    for reference, expected in cases.items():
+        assert bible_data.match_book(reference) == expected, reference
+    
+    with pytest.raises(ValueError):
+        bible_data.match_book("Hezekiah 1:1")
+
+def test_parse_reference_with_aliases():
+    """Test that references users type validate locally."""
+    assert bible_data.parse_reference("1 John 3:16") == ("1JN", 3, 16)
+    assert bible_data.parse_reference("Song of Solomon 2:1") == ("SNG", 2, 1)
+    assert bible_data.parse_verse_range("1Cor 13:4-7") == ("1CO", 13, 4, 7)
+    assert bible_data.parse_verse_range("Jn 3") == ("JHN", 3, None, None)
+
+def test_parse_reference_uses_passage_parser():
+    """Test that parse_reference reads references the way parse_passage does."""
+    assert bible_data.parse_reference("Jude 5") == ("JUD", 1, 5)
+    # A bare number in a single-chapter book is a verse, not the chapter
+    assert bible_data.parse_reference("Jude 1") == ("JUD", 1, 1)
+    assert bible_data.parse_reference("Ps 23") == ("PSA", 23, None)
+    with pytest.raises(ValueError):
+        bible_data.parse_reference("Gen 1-2")
+    with pytest.raises(ValueError):
+        bible_data.parse_reference("John 3:16-18")
+
+def test_parse_passage():
+    """Test the full reference grammar and its ordinal ranges."""
+    def span(book_id, chapter, verse, end_chapter, end_verse):
+        return (bible_data.verse_to_ordinal(book_id, chapter, verse),
+                bible_data.verse_to_ordinal(book_id, end_chapter, end_verse) + 1)
+    
+    assert bible_data.parse_passage("Matthew 5:1-10") == (span("MAT", 5, 1, 5, 10),)
+    assert bible_data.parse_passage("Gen 1:26-2:3") == (span("GEN", 1, 26, 2, 3),)
+    assert bible_data.parse_passage("matt 25:31-33,46") == (
+        span("MAT", 25, 31, 25, 33), span("MAT", 25, 46, 25, 46)
+    )
+    assert bible_data.parse_passage("John 3:16; 4:5") == (
+        span("JHN", 3, 16, 3, 16), span("JHN", 4, 5, 4, 5)
+    )
+    assert bible_data.parse_passage("Gen 1-2") == (span("GEN", 1, 1, 2, 25),)
+    assert bible_data.parse_passage("Jude 5") == (span("JUD", 1, 5, 1, 5),)
+    
+    # Overlapping and adjacent ranges are merged, whatever their order
+    assert bible_data.parse_passage("John 3:5-20, 1-10; John 3:21") == (span("JHN", 3, 1, 3, 21),)
+    
+    for reference in ("John", "John 3:18-16", "John 3:16-99", "John 22", "John 3:x", "4:5; John 3"):
+        with pytest.raises(ValueError):
+            bible_data.parse_passage(reference)
+
+def test_format_passage_round_trip():
+    """Test that formatted passages read naturally and parse back unchanged."""
+    for reference, expected in (
+        ("matt 25:31-33,46", "Matthew 25:31-33,46"),
+        ("Gen 1:26-2:3", "Genesis 1:26-2:3"),
+        ("Genesis 1:1-2:25", "Genesis 1-2"),
+        ("John 3:16; Rom 5:8", "John 3:16; Romans 5:8"),
+        ("Jude 1:1-25", "Jude 1-25"),
+    ):
+        ranges = bible_data.parse_passage(reference)
+        assert bible_data.format_passage(ranges) == expected
+        assert bible_data.parse_passage(expected) == ranges
+
+def test_book_records():
+    """Test the compact Book records and the BIBLE_DATA compatibility view."""
+    john = bible_data.BOOKS["JHN"]
+    assert (john.id, john.name, john.testament, john.chapters) == ("JHN", "John", "NT", 21)
+    assert john.verses[2] == 36
+    assert john.chapter_starts[-1] - john.chapter_starts[0] == sum(john.verses)
+    
+    # Single-chapter books are stored like any other book
+    jude = bible_data.BOOKS["JUD"]
+    assert list(jude.verses) == [25]
+    
+    # The compatibility view keeps the original dictionary format
+    assert bible_data.BIBLE_DATA["JHN"]["verses"] == list(john.verses)
+    assert bible_data.BIBLE_DATA["JUD"]["verses"] == 25
+    assert dict(bible_data.BIBLE_DATA["JUD"]) == {
+        "name": "Jude", "testament": "NT", "chapters": 1, "verses": 25
+    }
+    assert list(bible_data.BIBLE_DATA) == list(bible_data.BOOK_IDS)
+    assert "INVALID" not in bible_data.BIBLE_DATA
+
+def test_generated_tables_up_to_date():
+    """Test that bible_tables.py matches what generate_bible_tables.py writes."""
+    path = os.path.join(os.path.dirname(generate_bible_tables.__file__), "bible_tables.py")
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == generate_bible_tables.render()
+
+def test_generator_runs_without_tables(tmp_path):
+    """Test that the generator neither needs nor imports the tables it writes."""
+    import shutil
+    import subprocess
+    import sys
+    
+    shutil.copy(generate_bible_tables.__file__, tmp_path)
+    subprocess.run(
+        [sys.executable, "-I", str(tmp_path / "generate_bible_tables.py")],
+        check=True, capture_output=True, cwd=tmp_path,
+    )
+    with open(tmp_path / "bible_tables.py", encoding="utf-8") as f:
+        assert f.read() == generate_bible_tables.render()
+    
+    # --help writes nothing, and --output writes elsewhere
+    (tmp_path / "bible_tables.py").unlink()
+    subprocess.run(
+        [sys.executable, "-I", str(tmp_path / "generate_bible_tables.py"), "--help"],
+        check=True, capture_output=True, cwd=tmp_path,
+    )
+    assert not (tmp_path / "bible_tables.py").exists()
+    assert generate_bible_tables.main(["--output", str(tmp_path / "tables.py")]) == 0
+    with open(tmp_path / "tables.py", encoding="utf-8") as f:
+        assert f.read() == generate_bible_tables.render()
+    
+    for name in ("1Cor.", "Song  of Solomon", "I John", "Gen.", "Ps23"):
+        assert generate_bible_tables.normalize_book_name(name) == bible_data._normalize_book_name(name)
+    assert (generate_bible_tables.OLD_TESTAMENT, generate_bible_tables.NEW_TESTAMENT) == (
+        bible_data.OLD_TESTAMENT, bible_data.NEW_TESTAMENT
+    )
@@ -0,0 +1,27 @@
+"""
+Test suite for verse ordinal interval sets.
+"""
+import pytest
+
+from bible_intervals import IntervalSet
+
+def test_interval_set_normalizes_ranges():
+    """Test that overlapping and adjacent ranges are merged and empty ones dropped."""
+    intervals = IntervalSet([(10, 20), (0, 5), (5, 8), (15, 25), (30, 30)])
+    assert intervals.ranges == ((0, 8), (10, 25))
+    assert intervals.size == 23
+    assert 7 in intervals and 8 not in intervals and 24 in intervals and 25 not in intervals
+    assert intervals == IntervalSet([(10, 25), (0, 8)])
+    assert not IntervalSet()
+
+def test_interval_set_operations():
+    """Test union, intersection and difference."""
+    a = IntervalSet([(0, 10), (20, 30)])
+    b = IntervalSet([(5, 25), (40, 50)])
+    
+    assert (a | b).ranges == ((0, 30), (40, 50))
+    assert (a & b).ranges == ((5, 10), (20, 25))
+    assert (a - b).ranges == ((0, 5), (25, 30))
+    assert (b - a).ranges == ((10, 20), (40, 50))
+    assert (a - IntervalSet([(2, 3), (4, 6), (28, 40)])).ranges == ((0, 2), (3, 4), (6, 10), (20, 28))
+    assert not (a - a) and not (a & IntervalSet([(10, 20)]))
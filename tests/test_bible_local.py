@@ -0,0 +1,174 @@
+"""
+Test suite for the offline Bible backend.
+"""
+import asyncio
+import json
+import os
+import pytest
+
+from bible_data import BIBLE_DATA
+from bible_local import LocalBibleClient
+from bible_search import MappedSearchIndex
+
+JOHN_3 = ["Verse %d of John 3." % v for v in range(1, 37)]
+JOHN_3[15] = "For God so loved the world, that he gave his one and only Son."
+
+@pytest.fixture
+def corpus_dir(tmp_path):
+    """Create a small corpus with John and Jude in one translation."""
+    books = {
+        "JHN": [["Verse %d of John %d." % (v, c) for v in range(1, n + 1)]
+                for c, n in enumerate(BIBLE_DATA["JHN"]["verses"], 1)],
+        "JUD": [["Verse %d of Jude." % v for v in range(1, 26)]],
+    }
+    books["JHN"][2] = JOHN_3
+    corpus = {
+        "translation_id": "web",
+        "translation_name": "World English Bible",
+        "language": "English",
+        "books": books,
+    }
+    (tmp_path / "web.json").write_text(json.dumps(corpus), encoding="utf-8")
+    return str(tmp_path)
+
+@pytest.mark.asyncio
+async def test_local_verse_lookup(corpus_dir):
+    """Test verse, range and chapter lookups from the local corpus."""
+    client = LocalBibleClient(corpus_dir)
+    
+    result = await client.get_verse_by_reference("John 3:16", "web")
+    assert result["reference"] == "John 3:16"
+    assert result["text"].startswith("For God so loved the world")
+    assert result["translation_name"] == "World English Bible"
+    
+    result = await client.get_verse_by_reference("john 3:16-18")
+    assert [v["verse"] for v in result["verses"]] == [16, 17, 18]
+    
+    result = await client.get_by_book_chapter_verse("web", "JHN", 3)
+    assert result["reference"] == "John 3"
+    assert len(result["verses"]) == 36
+    
+    result = await client.get_by_book_chapter_verse("web", "JUD", 1, 5)
+    assert result["text"] == "Verse 5 of Jude."
+    
+    # The JSON corpus was compiled into a memory-mapped store on first use
+    assert os.path.exists(os.path.join(corpus_dir, "web.idx"))
+    await client.aclose()
+
+@pytest.mark.asyncio
+async def test_local_errors(corpus_dir):
+    """Test missing translations, books and invalid references."""
+    client = LocalBibleClient(corpus_dir)
+    
+    with pytest.raises(ValueError):
+        await client.get_verse_by_reference("John 3:16", "kjv")
+    with pytest.raises(ValueError):
+        await client.get_verse_by_reference("Genesis 1:1", "web")
+    for translation in ("../web", "/tmp/web", "web.meta"):
+        with pytest.raises(ValueError, match="Invalid translation"):
+            await client.get_verse_by_reference("John 3:16", translation)
+    with pytest.raises(ValueError):
+        await client.get_by_book_chapter_verse("web", "JHN", 3, 999)
+    with pytest.raises(ValueError):
+        await client.get_random_verse(testament="INVALID")
+
+@pytest.mark.asyncio
+async def test_local_translations(corpus_dir):
+    """Test listing installed translations."""
+    client = LocalBibleClient(corpus_dir)
+    
+    translations = await client.list_translations()
+    assert translations == [
+        {"id": "web", "name": "World English Bible", "language": "English", "default": True}
+    ]
+    # Listing reads the corpus metadata without compiling the corpus
+    assert not os.path.exists(os.path.join(corpus_dir, "web.idx"))
+    
+    await client.get_verse_by_reference("John 3:16", "web")
+    assert await client.list_translations() == translations
+    await client.aclose()
+
+def test_local_client_used_from_several_loops(corpus_dir):
+    """Test that a backend created outside any event loop works in each loop that uses it."""
+    client = LocalBibleClient(corpus_dir)
+    for reference in ("John 3:16", "Jude 5"):
+        result = asyncio.run(client.get_verse_by_reference(reference, "web"))
+        assert result["verses"]
+    asyncio.run(client.aclose())
+
+@pytest.mark.asyncio
+async def test_local_passage_lookup(corpus_dir):
+    """Test cross-chapter ranges, comma lists and multi-references locally."""
+    client = LocalBibleClient(corpus_dir)
+    
+    result = await client.get_verse_by_reference("Jn 3:35-4:2")
+    assert result["reference"] == "John 3:35-4:2"
+    assert [(v["chapter"], v["verse"]) for v in result["verses"]] == [(3, 35), (3, 36), (4, 1), (4, 2)]
+    
+    result = await client.get_verse_by_reference("John 3:16,18; Jude 3-4")
+    assert result["reference"] == "John 3:16,18; Jude 3-4"
+    assert [(v["book_id"], v["verse"]) for v in result["verses"]] == [
+        ("JHN", 16), ("JHN", 18), ("JUD", 3), ("JUD", 4)
+    ]
+    await client.aclose()
+
+@pytest.mark.asyncio
+async def test_local_search(corpus_dir):
+    """Test ranked full-text search with book and testament filters."""
+    client = LocalBibleClient(corpus_dir)
+    
+    result = await client.search_verses("God loved the world", "web")
+    assert result["translation_name"] == "World English Bible"
+    best = result["verses"][0]
+    assert (best["book_id"], best["chapter"], best["verse"]) == ("JHN", 3, 16)
+    assert best["text"].startswith("For God so loved the world")
+    # The index written when the corpus was compiled is memory-mapped
+    assert isinstance(client._indexes["web"], MappedSearchIndex)
+    
+    result = await client.search_verses("verse 5", book="Jude", limit=3)
+    assert [(v["book_id"], v["verse"]) for v in result["verses"]][0] == ("JUD", 5)
+    assert all(v["book_id"] == "JUD" for v in result["verses"])
+    assert len(result["verses"]) == 3
+    
+    # Misspelled words are corrected
+    result = await client.search_verses("Jide verse 5")
+    assert result["corrections"] == {"jide": ["jude"]}
+    assert (result["verses"][0]["book_id"], result["verses"][0]["verse"]) == ("JUD", 5)
+    
+    result = await client.search_verses("verse", testament="OT")
+    assert result["verses"] == []
+    
+    for kwargs in ({"testament": "INVALID"}, {"book": "Hezekiah"}, {"limit": 0}):
+        with pytest.raises(ValueError):
+            await client.search_verses("verse", **kwargs)
+    await client.aclose()
+
+@pytest.mark.asyncio
+async def test_local_concordance(corpus_dir):
+    """Test word counts by testament and book, with the first references."""
+    client = LocalBibleClient(corpus_dir)
+    
+    result = await client.concordance("Verse", limit=3)
+    assert result["word"] == "verse"
+    # Every verse of John except John 3:16, and all of Jude
+    john_verses = sum(BIBLE_DATA["JHN"]["verses"]) - 1
+    assert result["occurrences"] == result["verses"] == john_verses + 25
+    assert result["testaments"] == {"OT": 0, "NT": john_verses + 25}
+    assert result["books"] == [
+        {"book_id": "JHN", "book_name": "John", "count": john_verses},
+        {"book_id": "JUD", "book_name": "Jude", "count": 25},
+    ]
+    assert [(r["book_id"], r["chapter"], r["verse"]) for r in result["references"]] == [
+        ("JHN", 1, 1), ("JHN", 1, 2), ("JHN", 1, 3)
+    ]
+    assert result["references"][0]["text"] == "Verse 1 of John 1."
+    
+    result = await client.concordance("jide")
+    assert result["occurrences"] == 0
+    assert result["references"] == []
+    assert result["suggestions"] == ["jude"]
+    
+    for word, limit in (("two words", 10), ("", 10), ("verse", 0), ("verse", 51)):
+        with pytest.raises(ValueError):
+            await client.concordance(word, limit=limit)
+    await client.aclose()
@@ -0,0 +1,95 @@
+"""
+Test suite for bulk mirroring a translation.
+"""
+import os
+import pytest
+
+import bible_mirror
+from bible_data import chapter_ordinal_range, get_verse_count, verse_to_ordinal
+from bible_store import VerseStore
+from bible_versification import get_versification
+
+class FakeChapterClient:
+    """Backend returning synthetic chapters, optionally failing after N calls."""
+    def __init__(self, fail_after=None):
+        self.calls = []
+        self.fail_after = fail_after
+    
+    async def get_by_book_chapter_verse(self, translation_id, book_id, chapter, verse=None):
+        if self.fail_after is not None and len(self.calls) >= self.fail_after:
+            raise ConnectionError("upstream went away")
+        self.calls.append((book_id, chapter))
+        if book_id == "GEN" and chapter == 2:
+            raise ValueError("Reference not found")
+        verses = [
+            {"book_id": book_id, "chapter": chapter, "verse": v, "text": f"{book_id} {chapter}:{v}\n"}
+            for v in range(1, get_verse_count(book_id, chapter) + 1)
+        ]
+        return {"verses": verses, "translation_name": "Test Bible"}
+
+class FakeVulgateClient:
+    """Backend returning chapters in the Vulgate numbering, like bible-api.com for dra."""
+    async def get_by_book_chapter_verse(self, translation_id, book_id, chapter, verse=None):
+        versification = get_versification(translation_id)
+        numbered = []
+        for ordinal in range(*chapter_ordinal_range(book_id, chapter)):
+            scheme_verse = versification.to_scheme(ordinal)
+            if scheme_verse not in numbered:
+                numbered.append(scheme_verse)
+        verses = [
+            {"book_id": book, "chapter": c, "verse": v, "text": f"{book} {c}:{v}"}
+            for book, c, v in numbered
+        ]
+        return {"verses": verses, "translation_name": "Douay-Rheims"}
+
+@pytest.mark.asyncio
+async def test_mirror_resumes_after_interruption(tmp_path):
+    """Test that an interrupted mirror resumes from its checkpoint."""
+    directory = str(tmp_path)
+    
+    first = FakeChapterClient(fail_after=100)
+    with pytest.raises(ConnectionError):
+        await bible_mirror.mirror_translation(first, "test", directory)
+    checkpoint = bible_mirror._read_checkpoint(bible_mirror.checkpoint_path(directory, "test"))
+    assert len(checkpoint) == 99
+    assert ("GEN", 2) not in {(r["book_id"], r["chapter"]) for r in checkpoint}
+    
+    second = FakeChapterClient()
+    progress = []
+    count = await bible_mirror.mirror_translation(
+        second, "test", directory, lambda done, total, book, chapter: progress.append(done)
+    )
+    
+    # Every chapter is fetched once across both runs, except the missing
+    # one, which was left out of the checkpoint and is retried
+    assert len(first.calls) + len(second.calls) == 1190
+    assert second.calls[0] == ("GEN", 2)
+    assert second.calls[1] == first.calls[-1][:1] + (first.calls[-1][1] + 1,)
+    assert progress[-1] == 1189
+    assert count == 31102 - get_verse_count("GEN", 2)
+    assert not os.path.exists(bible_mirror.checkpoint_path(directory, "test"))
+    assert not any(name.endswith(".tmp") for name in os.listdir(directory))
+    
+    store = VerseStore(directory, "test")
+    assert store.metadata["translation_name"] == "Test Bible"
+    assert store.get_text(verse_to_ordinal("JHN", 3, 16)) == "JHN 3:16"
+    assert store.get_text(verse_to_ordinal("GEN", 2, 1)) == ""
+    store.close()
+
+@pytest.mark.asyncio
+async def test_mirror_maps_translation_versification(tmp_path):
+    """Test that verses numbered in the Vulgate scheme are stored at their standard ordinals."""
+    directory = str(tmp_path)
+    count = await bible_mirror.mirror_translation(FakeVulgateClient(), "dra", directory)
+    # Psalm 13:5-6 are one verse in the Vulgate, stored at 13:5
+    assert count == 31101
+    
+    store = VerseStore(directory, "dra")
+    # Psalm 3's title is verse 1 in the Vulgate; Psalm 10 is the second half of its Psalm 9
+    assert store.get_text(verse_to_ordinal("PSA", 3, 1)) == "PSA 3:2"
+    assert store.get_text(verse_to_ordinal("PSA", 3, 8)) == "PSA 3:9"
+    assert store.get_text(verse_to_ordinal("PSA", 10, 1)) == "PSA 9:22"
+    assert store.get_text(verse_to_ordinal("PSA", 10, 18)) == "PSA 9:39"
+    assert store.get_text(verse_to_ordinal("PSA", 11, 1)) == "PSA 10:1"
+    assert store.get_text(verse_to_ordinal("JHN", 3, 16)) == "JHN 3:16"
+    store.close()
@@ -0,0 +1,153 @@
+"""
+Test suite for full-text search.
+"""
+import pytest
+
+from bible_data import book_ordinal_range, verse_to_ordinal
+from bible_search import (
+    MappedSearchIndex, SearchIndex, edit_distance, parse_query, tokenize, write_search_index
+)
+
+JOHN_3_16 = verse_to_ordinal("JHN", 3, 16)
+JOHN_15_13 = verse_to_ordinal("JHN", 15, 13)
+ROM_5_8 = verse_to_ordinal("ROM", 5, 8)
+GEN_1_1 = verse_to_ordinal("GEN", 1, 1)
+
+VERSES = [
+    (GEN_1_1, "In the beginning, God created the heavens and the earth."),
+    (JOHN_3_16, "For God so loved the world, that he gave his one and only Son."),
+    (JOHN_15_13, "Greater love has no one than this, that someone lay down his life for his friends."),
+    (ROM_5_8, "But God commends his own love toward us, in that while we were yet sinners, Christ died for us."),
+]
+
+def test_tokenize():
+    """Test that words are lowercased and possessive endings dropped."""
+    assert tokenize("God's Spirit was hovering—over the WATERS.") == [
+        "god", "spirit", "was", "hovering", "over", "the", "waters"
+    ]
+    assert tokenize("Don’t be afraid") == ["don't", "be", "afraid"]
+
+def test_bm25_ranking():
+    """Test that rare words and short verses rank higher."""
+    index = SearchIndex(VERSES)
+    assert index.verse_count == 4
+    
+    # "love" is in two verses; the shorter one ranks first
+    hits, _ = index.search("love")
+    assert [ordinal for ordinal, _ in hits] == [JOHN_15_13, ROM_5_8]
+    
+    # A rarer word outweighs one found everywhere
+    hits, _ = index.search("God world")
+    assert hits[0][0] == JOHN_3_16
+    assert len(hits) == 3
+    
+    assert index.search("nowhere")[0] == []
+    assert len(index.search("god", limit=2)[0]) == 2
+
+def test_search_within_ranges():
+    """Test restricting a search to ordinal ranges."""
+    index = SearchIndex(VERSES)
+    hits, _ = index.search("God love", ranges=[book_ordinal_range("ROM")])
+    assert [ordinal for ordinal, _ in hits] == [ROM_5_8]
+    assert index.search("God", ranges=[book_ordinal_range("EXO")])[0] == []
+
+def test_parse_query():
+    """Test splitting queries into phrases, NEAR clauses and words."""
+    assert parse_query('"In the beginning" faith NEAR/3 hope love') == (
+        [["in", "the", "beginning"]], [("faith", "hope", 3)], ["love"]
+    )
+    # One-word phrases are plain words, and an unclosed quote runs to the end
+    assert parse_query('"grace" "the world') == ([["the", "world"]], [], ["grace"])
+
+def test_phrase_and_proximity_queries():
+    """Test that phrases and NEAR clauses must match and still rank by BM25."""
+    index = SearchIndex(sorted(VERSES + [
+        (verse_to_ordinal("JHN", 1, 1), "In the beginning was the Word, and the Word was with God."),
+        (verse_to_ordinal("PRO", 8, 23), "I was set up from everlasting, from the beginning, before the earth."),
+    ]))
+    
+    hits, _ = index.search('"in the beginning"')
+    assert sorted(ordinal for ordinal, _ in hits) == [GEN_1_1, verse_to_ordinal("JHN", 1, 1)]
+    assert index.search('"beginning the in"')[0] == []
+    
+    # "God" and "world" are four words apart in John 3:16
+    assert [o for o, _ in index.search("God NEAR/4 world")[0]] == [JOHN_3_16]
+    assert [o for o, _ in index.search("world NEAR/4 God")[0]] == [JOHN_3_16]
+    assert index.search("God NEAR/3 world")[0] == []
+    
+    # Repeated words need two occurrences
+    assert [o for o, _ in index.search("his NEAR/3 his")[0]] == [JOHN_15_13]
+    
+    # Every clause must match; loose words only rank the matches
+    hits, _ = index.search('"the beginning" earth', ranges=[book_ordinal_range("GEN")])
+    assert [o for o, _ in hits] == [GEN_1_1]
+    assert index.search('"the beginning" God NEAR/2 created')[0] == [
+        (GEN_1_1, index.search('"the beginning" God created')[0][0][1])
+    ]
+
+def test_typo_correction():
+    """Test that misspelled words are expanded to nearby indexed words."""
+    dan_1_1 = verse_to_ordinal("DAN", 1, 1)
+    index = SearchIndex(sorted(VERSES + [
+        (dan_1_1, "In the third year of the reign of Jehoiakim king of Judah, "
+                  "Nebuchadnezzar king of Babylon came to Jerusalem."),
+        (verse_to_ordinal("HEB", 7, 1), "For this Melchizedek, king of Salem, priest of God Most High"),
+    ]))
+    assert edit_distance("melchisedek", "melchizedek", 2) == 1
+    assert edit_distance("kitten", "sitting", 2) == 3
+    
+    assert index.correct("nebuchadnezar") == ["nebuchadnezzar"]
+    assert index.correct("melchisedec") == ["melchizedek"]
+    # Short words and distant ones are left alone
+    assert index.correct("gad") == []
+    assert index.correct("babble") == []
+    
+    assert [o for o, _ in index.search("Nebuchadnezar")[0]] == [dan_1_1]
+    assert [o for o, _ in index.search('"king of babylen"')[0]] == [dan_1_1]
+    assert index.corrections('"the begining" Melchisedec God') == {
+        "begining": ["beginning"], "melchisedec": ["melchizedek"]
+    }
+    hits, corrections = index.search('"the begining" Melchisedec God')
+    assert [o for o, _ in hits] == [GEN_1_1]
+    assert corrections == {"begining": ["beginning"], "melchisedec": ["melchizedek"]}
+
+def test_concordance():
+    """Test counting a word's occurrences by book and testament."""
+    index = SearchIndex(VERSES)
+    concordance = index.concordance("his")
+    assert concordance["occurrences"] == 4
+    assert concordance["verses"] == 3
+    assert concordance["books"] == {"JHN": 3, "ROM": 1}
+    assert concordance["testaments"] == {"OT": 0, "NT": 4}
+    assert concordance["ordinals"] == [JOHN_3_16, JOHN_15_13, ROM_5_8]
+    assert index.concordance("the")["testaments"] == {"OT": 3, "NT": 1}
+    assert index.concordance("nowhere") is None
+
+def test_mapped_index(tmp_path):
+    """Test that a written and memory-mapped index answers queries like an in-memory one."""
+    verses = sorted(VERSES + [
+        (verse_to_ordinal("JHN", 1, 1), "In the beginning was the Word, and the Word was with God."),
+        (verse_to_ordinal("EST", 8, 9), " ".join(["and the scribes"] * 50) + " wrote"),
+    ])
+    index = SearchIndex(verses)
+    path = str(tmp_path / "web.search")
+    write_search_index(path, verses)
+    
+    mapped = MappedSearchIndex(path)
+    assert len(mapped) == len(index)
+    assert mapped.verse_count == index.verse_count
+    for query in ("love", "God world", '"in the beginning"', "his NEAR/3 his",
+                  "God NEAR/4 world", '"scribes wrote"', "the NEAR/100 wrote", "nowhere"):
+        assert mapped.search(query) == index.search(query)
+        assert mapped.search(query, ranges=[book_ordinal_range("JHN")]) == \
+            index.search(query, ranges=[book_ordinal_range("JHN")])
+    for word in ("begining", "wrot", "scrbes", "xyzzy"):
+        assert mapped.correct(word) == index.correct(word)
+    for word in ("the", "his", "scribes", "xyzzy"):
+        assert mapped.concordance(word) == index.concordance(word)
+    assert "scribes" in mapped and "scrbes" not in mapped
+    mapped.close()
+    
+    (tmp_path / "bad.search").write_bytes(b"NOTASRCH" + bytes(12))
+    with pytest.raises(ValueError):
+        MappedSearchIndex(str(tmp_path / "bad.search"))
@@ -2,6 +2,7 @@
 Test suite for the Bible MCP server.
 """
 import asyncio
+import os
 import pytest
 import sys
 import subprocess
@@ -82,10 +83,34 @@ class MockBibleClient:
         else:
             return SAMPLE_RANDOM_VERSE
     
-    async def get_random_verse(self, translation_id="web", testament=None):
+    async def get_random_verse(self, translation_id="web", testament=None, seed=None):
         """Mock get_random_verse method."""
         return SAMPLE_RANDOM_VERSE
     
+    async def get_passages(self, references, translation=None):
+        """Mock get_passages method."""
+        return [await self.get_verse_by_reference(reference, translation) for reference in references]
+    
+    async def get_random_verses(self, count, translation_id="web", testament=None, seed=None):
+        """Mock get_random_verses method."""
+        return [SAMPLE_RANDOM_VERSE, SAMPLE_VERSE][:count]
+    
+    async def search_verses(self, query, translation=None, testament=None, limit=10, book=None):
+        """Mock search_verses method."""
+        verses = [dict(SAMPLE_VERSE["verses"][0], score=4.2)] if "love" in query else []
+        corrections = {"lovd": ["loved", "love"]} if "lovd" in query else {}
+        return {"query": query, "verses": verses[:limit], "corrections": corrections,
+                "translation_id": "web", "translation_name": "World English Bible"}
+    
+    async def concordance(self, word, translation=None, limit=10):
+        """Mock concordance method."""
+        if word != "loved":
+            return {"word": word, "occurrences": 0, "suggestions": ["loved"] if word == "lovd" else []}
+        return {"word": word, "translation_id": "web", "translation_name": "World English Bible",
+                "occurrences": 2, "verses": 2, "testaments": {"OT": 0, "NT": 2},
+                "books": [{"book_id": "JHN", "book_name": "John", "count": 2}],
+                "references": [dict(SAMPLE_VERSE["verses"][0])][:limit], "suggestions": []}
+    
     async def list_translations(self):
         """Mock list_translations method."""
         return SAMPLE_TRANSLATIONS
@@ -326,6 +351,58 @@ async def test_tool_random_verse(mock_stdio_client, mock_client_session):
     content = result.content[0].text if result.content else ""
     assert "Error" in content
 
+@pytest.mark.asyncio
+async def test_tool_passages():
+    """Test that get_passages returns every passage in one response."""
+    content = await bible_server.get_passages(["John 3:16", "Jude 1"], "web")
+    assert content.count("📖") == 2
+    assert "John 3:16" in content and "Jude 1" in content
+
+@pytest.mark.asyncio
+async def test_tool_random_verses():
+    """Test that get_random_verses returns every verse in one response."""
+    content = await bible_server.get_random_verses(count=2, translation="web")
+    assert content.count("📖") == 2
+    assert "Psalm 23:1" in content and "John 3:16" in content
+    
+    content = await bible_server.get_random_verses(count=0)
+    assert content.startswith("Error")
+    content = await bible_server.get_random_verses(count=5, testament="INVALID")
+    assert content.startswith("Error")
+
+@pytest.mark.asyncio
+async def test_tool_search_verses():
+    """Test that search_verses formats ranked hits and validates its filters."""
+    content = await bible_server.search_verses("loved the world", translation="web")
+    assert content.startswith("🔎 loved the world")
+    assert "John 3:16 - For God so loved the world" in content
+    assert "Also searched for" not in content
+    
+    content = await bible_server.search_verses("lovd your enemies, love")
+    assert "✏️ Also searched for: loved, love (for lovd)" in content
+    
+    content = await bible_server.search_verses("xyzzy")
+    assert content == "No verses found for: xyzzy"
+    content = await bible_server.search_verses("love", limit=0)
+    assert content.startswith("Error")
+    content = await bible_server.search_verses("love", testament="INVALID")
+    assert content.startswith("Error")
+
+@pytest.mark.asyncio
+async def test_tool_concordance():
+    """Test that concordance formats counts and references and validates its limit."""
+    content = await bible_server.concordance("loved")
+    assert content.startswith("📚 loved")
+    assert "2 occurrences in 2 verses (Old Testament: 0, New Testament: 2)" in content
+    assert "- John: 2" in content
+    assert "John 3:16 - For God so loved the world" in content
+    
+    assert await bible_server.concordance("xyzzy") == "No occurrences of: xyzzy"
+    content = await bible_server.concordance("lovd")
+    assert content == "No occurrences of: lovd\nDid you mean: loved?"
+    content = await bible_server.concordance("loved", limit=0)
+    assert content.startswith("Error")
+
 @pytest.mark.asyncio
 async def test_tool_translations(mock_stdio_client, mock_client_session):
     """Test the list_available_translations tool."""
@@ -367,3 +444,76 @@ async def test_prompts(mock_stdio_client, mock_client_session):
     prompt_text = result.messages[0].content.text if result.messages else ""
     assert "love" in prompt_text
     assert "provide the full reference" in prompt_text.lower()
+
+@pytest.mark.asyncio
+async def test_server_lifespan_manages_client():
+    """Test that the server lifespan opens and closes the API client."""
+    client = MagicMock()
+    client.open = AsyncMock()
+    client.aclose = AsyncMock()
+    
+    with patch.object(bible_server, "bible_client", client):
+        async with bible_server.server_lifespan(bible_server.mcp):
+            client.open.assert_awaited_once()
+            client.aclose.assert_not_awaited()
+        client.aclose.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_server_lifespans_share_client():
+    """Test that the client stays open until the last of several sessions ends."""
+    client = MagicMock()
+    client.open = AsyncMock()
+    client.aclose = AsyncMock()
+    
+    with patch.object(bible_server, "bible_client", client):
+        async with bible_server.server_lifespan(bible_server.mcp):
+            async with bible_server.server_lifespan(bible_server.mcp):
+                client.open.assert_awaited_once()
+            client.aclose.assert_not_awaited()
+        client.aclose.assert_awaited_once()
+
+def test_create_client_selects_backend(monkeypatch, tmp_path):
+    """Test that the backend is chosen from the environment."""
+    from bible_api import BibleAPIClient
+    from bible_local import LocalBibleClient
+    
+    monkeypatch.delenv("BIBLE_MCP_BACKEND", raising=False)
+    assert isinstance(bible_server.create_client(), BibleAPIClient)
+    
+    monkeypatch.setenv("BIBLE_MCP_BACKEND", "local")
+    monkeypatch.setenv("BIBLE_MCP_CORPUS_DIR", str(tmp_path))
+    client = bible_server.create_client()
+    assert isinstance(client, LocalBibleClient)
+    assert client.corpus_dir == str(tmp_path)
+    
+    monkeypatch.setenv("BIBLE_MCP_BACKEND", "ftp")
+    with pytest.raises(ValueError):
+        bible_server.create_client()
+
+def import_times(module: str) -> Dict[str, int]:
+    """Import a module in a fresh interpreter and return -X importtime cumulative times."""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("BIBLE_MCP_")}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+def test_import_time():
+    """Test that heavy dependencies are not imported at startup."""
+    times = import_times("bible_api")
+    assert "httpx" not in times
+    assert "sqlite3" not in times
+    
+    times = import_times("bible_server")
+    for module in ("bible_local", "bible_store", "sqlite3"):
+        assert module not in times
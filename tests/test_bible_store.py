@@ -0,0 +1,66 @@
+"""
+Test suite for the memory-mapped verse store.
+"""
+import json
+import pytest
+
+import bible_store
+from bible_data import verse_to_ordinal
+from bible_store import VerseStore, write_store
+
+def test_write_and_read_store(tmp_path):
+    """Test round-tripping verses through a compiled store."""
+    john_3_16 = verse_to_ordinal("JHN", 3, 16)
+    write_store(
+        str(tmp_path),
+        "web",
+        [(0, "In the beginning, God created the heavens and the earth."),
+         (john_3_16, "For God so loved the world…"),
+         (john_3_16 + 1, "For God didn't send his Son into the world to judge the world.")],
+        {"translation_name": "World English Bible"},
+    )
+    
+    store = VerseStore(str(tmp_path), "web")
+    assert store.metadata["translation_name"] == "World English Bible"
+    assert store.get_text(0).startswith("In the beginning")
+    assert store.get_text(john_3_16) == "For God so loved the world…"
+    assert store.get_text(1) == ""
+    
+    # Contiguous ranges are views into the mapped text
+    view = store.range_bytes(john_3_16, john_3_16 + 2)
+    assert isinstance(view, memoryview)
+    assert bytes(view).decode("utf-8").startswith("For God so loved the world…For God didn't")
+    assert store.get_texts(john_3_16 - 1, john_3_16 + 1) == ["", "For God so loved the world…"]
+    
+    view.release()
+    store.close()
+    
+    # The search index is written alongside the store
+    assert (tmp_path / "web.search").exists()
+
+def test_missing_and_invalid_store(tmp_path):
+    """Test opening a missing or corrupt store."""
+    with pytest.raises(ValueError):
+        VerseStore(str(tmp_path), "kjv")
+    
+    (tmp_path / "kjv.txt").write_bytes(b"")
+    (tmp_path / "kjv.idx").write_bytes(b"NOTANIDX" + bytes(8))
+    with pytest.raises(ValueError):
+        VerseStore(str(tmp_path), "kjv")
+
+def test_import_json_corpus(tmp_path):
+    """Test compiling a JSON corpus into a store."""
+    corpus = {
+        "translation_id": "web",
+        "translation_name": "World English Bible",
+        "language": "English",
+        "books": {"JUD": [["Jude, a servant of Jesus Christ", "Mercy to you"]]},
+    }
+    json_path = tmp_path / "web.json"
+    json_path.write_text(json.dumps(corpus), encoding="utf-8")
+    
+    assert bible_store.import_json_corpus(str(json_path), str(tmp_path)) == "web"
+    store = VerseStore(str(tmp_path), "web")
+    assert store.get_text(verse_to_ordinal("JUD", 1, 2)) == "Mercy to you"
+    assert store.metadata["language"] == "English"
+    store.close()
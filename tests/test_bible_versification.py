@@ -0,0 +1,88 @@
+"""
+Test suite for versification maps.
+"""
+import pytest
+
+from bible_data import TOTAL_VERSES, verse_to_ordinal, chapter_ordinal_range
+from bible_versification import get_versification
+
+def test_vulgate_psalms():
+    """Test mapping standard Psalms references to the Vulgate numbering and back."""
+    vulgate = get_versification("dra")
+    assert vulgate is get_versification("clementine")
+    assert get_versification("web") is None
+    assert get_versification(None) is None
+    
+    for standard, scheme in (
+        (("PSA", 1, 1), ("PSA", 1, 1)),
+        (("PSA", 3, 1), ("PSA", 3, 2)),      # Title counted as verse 1
+        (("PSA", 9, 20), ("PSA", 9, 21)),
+        (("PSA", 10, 1), ("PSA", 9, 22)),    # Psalms 9-10 are one psalm
+        (("PSA", 23, 1), ("PSA", 22, 1)),
+        (("PSA", 51, 1), ("PSA", 50, 3)),    # Two-verse title
+        (("PSA", 115, 1), ("PSA", 113, 9)),
+        (("PSA", 116, 10), ("PSA", 115, 1)),  # Psalm 116 is split in two
+        (("PSA", 147, 12), ("PSA", 147, 1)),
+        (("PSA", 150, 6), ("PSA", 150, 6)),
+        (("JHN", 3, 16), ("JHN", 3, 16)),
+    ):
+        ordinal = verse_to_ordinal(*standard)
+        assert vulgate.to_scheme(ordinal) == scheme
+        assert vulgate.from_scheme(*scheme) == (ordinal, ordinal + 1)
+    
+    # Titles have no standard counterpart; merged verses cover both
+    start = verse_to_ordinal("PSA", 3, 1)
+    assert vulgate.from_scheme("PSA", 3, 1) == (start, start)
+    assert vulgate.from_scheme("PSA", 12, 6) == (
+        verse_to_ordinal("PSA", 13, 5), verse_to_ordinal("PSA", 13, 6) + 1
+    )
+    
+    # Every standard verse maps to a scheme verse that maps back to it
+    for ordinal in range(TOTAL_VERSES):
+        start, stop = vulgate.from_scheme(*vulgate.to_scheme(ordinal))
+        assert start <= ordinal < stop
+    
+    with pytest.raises(ValueError):
+        vulgate.from_scheme("PSA", 9, 40)
+    with pytest.raises(ValueError):
+        vulgate.to_scheme(TOTAL_VERSES)
+
+def test_vulgate_other_books():
+    """Test the Vulgate's numbering outside the Psalms."""
+    vulgate = get_versification("dra")
+    for standard, scheme in (
+        (("PSA", 13, 1), ("PSA", 12, 1)),    # Title shares the first verse
+        (("PSA", 13, 3), ("PSA", 12, 4)),    # 13:2 is split in two
+        (("JOB", 40, 1), ("JOB", 39, 31)),
+        (("JOB", 41, 1), ("JOB", 40, 20)),
+        (("JOB", 41, 34), ("JOB", 41, 25)),
+        (("ECC", 5, 1), ("ECC", 4, 17)),
+        (("SNG", 6, 13), ("SNG", 6, 12)),
+        (("DAN", 3, 24), ("DAN", 3, 91)),    # After the Song of the Three Young Men
+        (("DAN", 4, 1), ("DAN", 3, 98)),
+        (("DAN", 4, 37), ("DAN", 4, 34)),
+        (("HOS", 13, 16), ("HOS", 14, 1)),
+        (("JON", 1, 17), ("JON", 2, 1)),
+        (("JOL", 2, 28), ("JOL", 2, 28)),
+        (("MAL", 4, 5), ("MAL", 4, 5)),
+        (("3JN", 1, 14), ("3JN", 1, 14)),
+    ):
+        ordinal = verse_to_ordinal(*standard)
+        assert vulgate.to_scheme(ordinal) == scheme
+        assert vulgate.from_scheme(*scheme) == (ordinal, ordinal + 1)
+    
+    # Additions to Daniel and the second half of Psalm 13:2 have no standard verses
+    start = verse_to_ordinal("DAN", 3, 24)
+    assert vulgate.from_scheme("DAN", 3, 50) == (start, start)
+    start = verse_to_ordinal("PSA", 13, 3)
+    assert vulgate.from_scheme("PSA", 12, 3) == (start, start)
+
+def test_format_passage_in_scheme():
+    """Test formatting standard ranges in a scheme's numbering."""
+    vulgate = get_versification("dra")
+    assert vulgate.format_passage([chapter_ordinal_range("PSA", 23)]) == "Psalms 22:1-6"
+    assert vulgate.format_passage([chapter_ordinal_range("PSA", 10)]) == "Psalms 9:22-39"
+    assert vulgate.format_passage([
+        chapter_ordinal_range("PSA", 116),
+        (verse_to_ordinal("PSA", 119, 1), verse_to_ordinal("PSA", 119, 2) + 1),
+    ]) == "Psalms 114:1-115:10,118:1-2"